@@ -8,6 +8,7 @@ from .documentation import DocumentationAgent
 from .engagement import EngagementAgent
 from .insights import InsightsAgent
 from .quality import QualityAgent
+from .core import GitHubClient
 
 __all__ = [
     'ProfileAgent',
@@ -15,7 +16,8 @@ __all__ = [
     'DocumentationAgent',
     'EngagementAgent',
     'InsightsAgent',
-    'QualityAgent'
+    'QualityAgent',
+    'GitHubClient'
 ]
 
 __version__ = '1.0.0'
@@ -0,0 +1,47 @@
+"""Infraestrutura compartilhada entre os agentes (acesso à GitHub API)"""
+
+from .github_client import GitHubClient
+from .base_agent import GitHubAgent
+from .http_cache import HTTPCache
+from .concurrent_fetch import ConcurrentFetcher
+from .graphql_backend import GraphQLBackend
+from .run_context import RunContext
+from .task_graph import TaskGraph, TaskResult
+from .retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+from .metrics import RequestMetrics, agent_scope
+from .ttl_cache import TTLCache
+from .repo_resolver import RepoResolver
+from .search_cache import SearchCache
+from .top_k import TopK
+from .rate_limit import (
+    PRIORITY_HIGH,
+    PRIORITY_NORMAL,
+    PRIORITY_LOW,
+    RateLimitExceeded,
+    RateLimitScheduler
+)
+
+__all__ = [
+    'GitHubClient',
+    'GitHubAgent',
+    'HTTPCache',
+    'ConcurrentFetcher',
+    'GraphQLBackend',
+    'RunContext',
+    'TaskGraph',
+    'TaskResult',
+    'RateLimitScheduler',
+    'RateLimitExceeded',
+    'RetryPolicy',
+    'CircuitBreaker',
+    'CircuitOpenError',
+    'RequestMetrics',
+    'TTLCache',
+    'RepoResolver',
+    'SearchCache',
+    'TopK',
+    'agent_scope',
+    'PRIORITY_HIGH',
+    'PRIORITY_NORMAL',
+    'PRIORITY_LOW'
+]
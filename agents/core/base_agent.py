@@ -0,0 +1,28 @@
+"""
+Base comum dos agentes: cliente HTTP e snapshot da execução
+"""
+
+from typing import Optional
+
+from .github_client import GitHubClient
+from .run_context import RunContext
+
+
+class GitHubAgent:
+    """
+    Agente que consulta a GitHub API
+    Executado pelo orquestrador, recebe o cliente compartilhado (pool de conexões, cache,
+    rate limit e métricas de todos os agentes) e o RunContext da execução, que carrega
+    usuário, repositórios e linguagens uma única vez. No uso standalone, cria o próprio
+    cliente e, sem snapshot (context=None), busca tudo direto na API.
+    """
+
+    def __init__(self, username: str, github_token: Optional[str] = None,
+                 client: Optional[GitHubClient] = None,
+                 context: Optional[RunContext] = None):
+        self.username = username
+        self.client = client or GitHubClient(github_token)
+        self.context = context
+        self.github_token = self.client.github_token
+        self.api_base = self.client.api_base
+        self.headers = self.client.headers
@@ -0,0 +1,54 @@
+"""
+Motor de busca concorrente
+Dispara vários GETs em paralelo num thread pool com limite de concorrência
+As requisições usam a sessão síncrona do requests: threads são o único modo
+(um event loop só ganharia algo com um cliente HTTP assíncrono de verdade)
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from .rate_limit import PRIORITY_NORMAL
+
+
+class ConcurrentFetcher:
+    """Executa muitos GETs em paralelo sobre o cliente compartilhado"""
+
+    def __init__(self, client, max_concurrency: Optional[int] = None,
+                 priority: int = PRIORITY_NORMAL):
+        self.client = client
+        self.priority = priority
+        self.max_concurrency = max(1, max_concurrency or client.max_concurrency)
+
+    def _fetch(self, url: str) -> Any:
+        response = self.client.get(url, priority=self.priority)
+        response.raise_for_status()
+        return response.json()
+
+    def fetch_json(self, urls: Iterable[str],
+                   on_result: Callable[[str, Any], None]) -> Dict[str, Exception]:
+        """
+        Busca todas as URLs e chama on_result(url, json) conforme as respostas chegam
+        Falhas individuais não interrompem o lote: são devolvidas num dict url -> erro.
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+
+        errors = {}
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            # Cada tarefa herda o contexto (ex: agente atual para as métricas)
+            futures = {
+                executor.submit(contextvars.copy_context().run, self._fetch, url): url
+                for url in urls
+            }
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    data = future.result()
+                except Exception as e:
+                    errors[url] = e
+                    continue
+                on_result(url, data)
+        return errors
@@ -0,0 +1,275 @@
+"""
+Cliente HTTP compartilhado para a GitHub API
+Mantém uma sessão com pool de conexões reutilizada por todos os agentes
+"""
+
+import os
+import time
+import requests
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterator, Optional
+
+from .http_cache import HTTPCache
+from .graphql_backend import GraphQLBackend
+from .rate_limit import PRIORITY_HIGH, PRIORITY_NORMAL, RateLimitScheduler
+from .retry import CircuitBreaker, RetryPolicy
+from .metrics import RequestMetrics
+
+
+class GitHubClient:
+    """Cliente da GitHub API com sessão persistente (keep-alive)"""
+
+    def __init__(self, github_token: Optional[str] = None,
+                 api_base: str = 'https://api.github.com',
+                 pool_size: int = 10,
+                 timeout: float = 30,
+                 cache: Optional[HTTPCache] = None,
+                 prefetch_pages: bool = False,
+                 max_concurrency: int = 8,
+                 use_graphql: bool = False,
+                 rate_limiter: Optional[RateLimitScheduler] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 metrics: Optional[RequestMetrics] = None):
+        self.github_token = github_token or os.getenv('GITHUB_TOKEN')
+        self.api_base = api_base.rstrip('/')
+        self.timeout = timeout
+        self.cache = cache
+        self.prefetch_pages = prefetch_pages
+        # Padrão usado pelo ConcurrentFetcher
+        self.max_concurrency = max_concurrency
+        # GraphQL exige autenticação: sem token, continua na REST API
+        self.use_graphql = use_graphql and bool(self.github_token)
+        self._graphql = None
+        self.rate_limiter = rate_limiter or RateLimitScheduler(authenticated=bool(self.github_token))
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.metrics = metrics or RequestMetrics()
+        self.headers = {
+            'Accept': 'application/vnd.github.v3+json',
+        }
+        if self.github_token:
+            self.headers['Authorization'] = f'token {self.github_token}'
+        # Identidade usada nas chaves do cache HTTP (resolvida na primeira requisição)
+        self._cache_identity: Optional[str] = None
+        self._identity_lock = threading.Lock()
+
+        # Uma única sessão: reaproveita conexões TCP/TLS entre chamadas
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    @property
+    def graphql(self) -> Optional[GraphQLBackend]:
+        """Backend GraphQL compartilhado (None quando desabilitado)"""
+        if not self.use_graphql:
+            return None
+        if self._graphql is None:
+            self._graphql = GraphQLBackend(self)
+        return self._graphql
+
+    @property
+    def cache_identity(self) -> str:
+        """
+        Identidade estável para as chaves do cache: o login dono do token
+        Tokens de instalação (GITHUB_TOKEN do Actions) não acessam /user e ficam
+        todos sob a mesma identidade 'authenticated'
+        """
+        if self._cache_identity is None:
+            with self._identity_lock:
+                if self._cache_identity is None:
+                    self._cache_identity = self._resolve_identity()
+        return self._cache_identity
+
+    def _resolve_identity(self) -> str:
+        if not self.github_token:
+            return 'anonymous'
+        try:
+            response = self.request('GET', self.build_url('/user'), PRIORITY_HIGH)
+        except requests.RequestException:
+            return 'authenticated'
+        if response.status_code == 200:
+            login = response.json().get('login')
+            if login:
+                return f'user:{login}'
+        return 'authenticated'
+
+    def build_url(self, path: str) -> str:
+        """Monta a URL completa (aceita caminhos relativos ou URLs absolutas)"""
+        if path.startswith('http://') or path.startswith('https://'):
+            return path
+        return f"{self.api_base}/{path.lstrip('/')}"
+
+    @staticmethod
+    def is_rate_limited(response: requests.Response) -> bool:
+        """Indica se a resposta foi bloqueada por rate limit primário"""
+        return (
+            response.status_code in (403, 429)
+            and response.headers.get('X-RateLimit-Remaining') == '0'
+        )
+
+    def request(self, method: str, url: str, priority: int = PRIORITY_NORMAL,
+                **kwargs) -> requests.Response:
+        """
+        Envia uma requisição passando pelo agendador de rate limit
+        Se o orçamento acabar no meio do caminho, aguarda a renovação e tenta mais uma vez.
+        Falhas transitórias (5xx, rede, rate limit secundário) em GETs são repetidas com
+        backoff; requisições que falham mesmo após as retentativas contam para o circuit breaker.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        resource = self.rate_limiter.resource_for(url)
+        waited_for_reset = False
+        attempt = 0
+
+        while True:
+            self.circuit_breaker.before_request()
+            self.rate_limiter.acquire(resource, priority)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if not self.retry_policy.can_retry(method, attempt):
+                    self.circuit_breaker.record_failure()
+                    raise
+                self.retry_policy.sleep(attempt)
+                attempt += 1
+                continue
+
+            self.rate_limiter.update(resource, response.headers)
+
+            if self.is_rate_limited(response) and not waited_for_reset:
+                waited_for_reset = True
+                continue
+
+            if self.retry_policy.should_retry(method, attempt, response):
+                self.retry_policy.sleep(attempt, response)
+                attempt += 1
+                continue
+
+            if response.status_code >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+            return response
+
+    def _observe(self, url: str, start: float, response: Optional[requests.Response]):
+        """Registra a requisição nas métricas (latência inclui retentativas)"""
+        latency = time.perf_counter() - start
+        if response is None:
+            self.metrics.record(url, 'error', latency)
+            return
+        cache_hit = getattr(response, 'from_cache', None)
+        # Num replay do cache, nada além dos cabeçalhos foi baixado
+        size = 0 if cache_hit else len(response.content)
+        self.metrics.record(url, response.status_code, latency, size, cache_hit, response.headers)
+
+    def get(self, path: str, params: Optional[Dict] = None,
+            priority: int = PRIORITY_NORMAL, **kwargs) -> requests.Response:
+        """Executa um GET usando a sessão compartilhada (e o cache condicional, se houver)"""
+        url = self.build_url(path)
+        start = time.perf_counter()
+        response = None
+        try:
+            response = self._get(url, params, priority, **kwargs)
+            return response
+        finally:
+            self._observe(url, start, response)
+
+    def _get(self, url: str, params: Optional[Dict], priority: int, **kwargs) -> requests.Response:
+        if self.cache is None:
+            return self.request('GET', url, priority, params=params, **kwargs)
+
+        key = self.cache.make_key(url, params, self.cache_identity)
+        entry = self.cache.load(key)
+        headers = dict(kwargs.pop('headers', None) or {})
+        headers.update(self.cache.conditional_headers(entry))
+
+        response = self.request('GET', url, priority, params=params, headers=headers, **kwargs)
+
+        # 304 não conta no rate limit da GitHub: devolve o corpo guardado
+        if response.status_code == 304 and entry:
+            self.cache.hits += 1
+            return self.cache.replay(entry, response)
+
+        self.cache.misses += 1
+        response.from_cache = False
+        if response.status_code == 200:
+            self.cache.store(key, response)
+        return response
+
+    def post(self, path: str, json: Optional[Dict] = None,
+             priority: int = PRIORITY_NORMAL, **kwargs) -> requests.Response:
+        """Executa um POST usando a sessão compartilhada"""
+        url = self.build_url(path)
+        start = time.perf_counter()
+        response = None
+        try:
+            response = self.request('POST', url, priority, json=json, **kwargs)
+            return response
+        finally:
+            self._observe(url, start, response)
+
+    def get_json(self, path: str, params: Optional[Dict] = None,
+                 priority: int = PRIORITY_NORMAL):
+        """Executa um GET e retorna o JSON (levanta erro em status != 2xx)"""
+        response = self.get(path, params=params, priority=priority)
+        response.raise_for_status()
+        return response.json()
+
+    def paginate(self, path: str, params: Optional[Dict] = None,
+                 items_key: Optional[str] = None,
+                 prefetch: Optional[bool] = None,
+                 priority: int = PRIORITY_NORMAL) -> Iterator[Dict]:
+        """
+        Percorre todas as páginas seguindo o cabeçalho Link: rel="next"
+        Os itens são entregues um a um, sem manter as páginas anteriores em memória.
+        Com prefetch, a próxima página é baixada enquanto a atual é consumida.
+        """
+        if prefetch is None:
+            prefetch = self.prefetch_pages
+
+        def fetch(url: str, page_params: Optional[Dict]):
+            response = self.get(url, params=page_params, priority=priority)
+            response.raise_for_status()
+            return response
+
+        def page_items(response) -> list:
+            data = response.json()
+            return data.get(items_key, []) if items_key else data
+
+        def next_url(response) -> Optional[str]:
+            return response.links.get('next', {}).get('url')
+
+        url = self.build_url(path)
+
+        if not prefetch:
+            while url:
+                response = fetch(url, params)
+                # A URL "next" já traz os parâmetros da consulta
+                params = None
+                url = next_url(response)
+                yield from page_items(response)
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # copy_context: a página baixada em background continua atribuída ao agente atual
+            future = executor.submit(contextvars.copy_context().run, fetch, url, params)
+            while future is not None:
+                response = future.result()
+                url = next_url(response)
+                future = executor.submit(contextvars.copy_context().run, fetch, url, None) if url else None
+                yield from page_items(response)
+
+    def close(self):
+        """Fecha a sessão e libera as conexões do pool"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,190 @@
+"""
+Backend GraphQL para metadados de repositórios
+Busca até 100 repositórios por consulta (incluindo linguagens) e devolve
+dicionários no mesmo formato da REST API consumido pelos agentes
+"""
+
+from typing import Dict, Iterator, List, Optional
+
+from .ttl_cache import TTLCache
+
+
+REPO_FIELDS = """
+    name
+    nameWithOwner
+    url
+    description
+    homepageUrl
+    isFork
+    isPrivate
+    isArchived
+    stargazerCount
+    forkCount
+    diskUsage
+    createdAt
+    updatedAt
+    pushedAt
+    owner { login }
+    watchers { totalCount }
+    issues(states: OPEN) { totalCount }
+    pullRequests(states: OPEN) { totalCount }
+    primaryLanguage { name }
+    licenseInfo { key name spdxId }
+    repositoryTopics(first: 100) { nodes { topic { name } } }
+    languages(first: 100, orderBy: {field: SIZE, direction: DESC}) {
+        edges { size node { name } }
+    }
+"""
+
+# Só repositórios públicos, como /users/{username}/repos (mesmo resultado com ou sem token)
+REPOS_QUERY = """
+query($login: String!, $cursor: String) {
+  repositoryOwner(login: $login) {
+    repositories(first: 100, after: $cursor, ownerAffiliations: OWNER, privacy: PUBLIC,
+                 orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { %s }
+    }
+  }
+}
+""" % REPO_FIELDS
+
+REPO_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) { %s }
+}
+""" % REPO_FIELDS
+
+
+class GraphQLBackend:
+    """Busca metadados de repositórios via GraphQL (requer token)"""
+
+    def __init__(self, client, memo_size: int = 1000, memo_ttl: float = 600):
+        self.client = client
+        # GitHub Enterprise Server: REST em /api/v3, GraphQL em /api/graphql
+        if client.api_base.endswith('/api/v3'):
+            self.endpoint = client.api_base[:-len('v3')] + 'graphql'
+        else:
+            self.endpoint = client.build_url('/graphql')
+        # Repositórios já vistos (listagem de organizações grandes: só os mais recentes)
+        self._repo_memo = TTLCache(ttl=memo_ttl, max_entries=memo_size)
+
+    def query(self, query: str, variables: Optional[Dict] = None,
+              partial: bool = False) -> Dict:
+        """
+        Executa uma consulta GraphQL e retorna o campo data
+        Com partial, erros de campos isolados (ex: um alias NOT_FOUND) não descartam o
+        resto da resposta: só levanta erro se não vier nenhum dado
+        """
+        response = self.client.post(
+            self.endpoint,
+            json={'query': query, 'variables': variables or {}}
+        )
+        response.raise_for_status()
+        payload = response.json()
+        errors = payload.get('errors')
+        if errors and (not partial or payload.get('data') is None):
+            messages = '; '.join(error.get('message', '') for error in errors)
+            raise RuntimeError(f'Erro na consulta GraphQL: {messages}')
+        return payload.get('data') or {}
+
+    def to_rest_shape(self, node: Dict) -> Dict:
+        """Converte um nó GraphQL no formato de repositório da REST API"""
+        full_name = node['nameWithOwner']
+        license_info = node.get('licenseInfo')
+        languages = {
+            edge['node']['name']: edge['size']
+            for edge in (node.get('languages') or {}).get('edges', [])
+        }
+
+        return {
+            'name': node['name'],
+            'full_name': full_name,
+            'owner': {'login': node['owner']['login']},
+            'html_url': node['url'],
+            'description': node.get('description'),
+            'homepage': node.get('homepageUrl'),
+            'fork': node.get('isFork', False),
+            'private': node.get('isPrivate', False),
+            'archived': node.get('isArchived', False),
+            'stargazers_count': node.get('stargazerCount', 0),
+            # Na REST API, watchers_count é um alias de stargazers_count
+            'watchers_count': node.get('stargazerCount', 0),
+            'subscribers_count': node['watchers']['totalCount'],
+            'forks_count': node.get('forkCount', 0),
+            # Na REST API, open_issues_count inclui pull requests abertos
+            'open_issues_count': node['issues']['totalCount'] + node['pullRequests']['totalCount'],
+            'size': node.get('diskUsage') or 0,
+            'language': (node.get('primaryLanguage') or {}).get('name'),
+            'topics': [n['topic']['name'] for n in node['repositoryTopics']['nodes']],
+            'license': {
+                'key': license_info['key'],
+                'name': license_info['name'],
+                'spdx_id': license_info['spdxId']
+            } if license_info else None,
+            'created_at': node['createdAt'],
+            'updated_at': node['updatedAt'],
+            'pushed_at': node['pushedAt'],
+            'languages_url': self.client.build_url(f'/repos/{full_name}/languages'),
+            # Extra: linguagens já resolvidas (evita uma chamada por repositório)
+            'languages': languages
+        }
+
+    def iter_repos(self, login: str) -> Iterator[Dict]:
+        """Itera sobre os repositórios de um usuário ou organização, 100 por consulta"""
+        cursor = None
+        while True:
+            data = self.query(REPOS_QUERY, {'login': login, 'cursor': cursor})
+            owner = data.get('repositoryOwner')
+            if owner is None:
+                return
+
+            repositories = owner['repositories']
+            for node in repositories['nodes']:
+                repo = self.to_rest_shape(node)
+                self._repo_memo.set(repo['full_name'].lower(), repo)
+                yield repo
+
+            if not repositories['pageInfo']['hasNextPage']:
+                return
+            cursor = repositories['pageInfo']['endCursor']
+
+    def get_repos(self, full_names: List[str], batch_size: int = 50) -> Dict[str, Dict]:
+        """
+        Busca vários repositórios ('dono/nome') com aliases, vários por consulta
+        Repositórios inexistentes ou inacessíveis ficam de fora do resultado
+        """
+        repos = {}
+        for start in range(0, len(full_names), batch_size):
+            batch = full_names[start:start + batch_size]
+            declarations = []
+            selections = []
+            variables = {}
+            for i, full_name in enumerate(batch):
+                owner, name = full_name.split('/', 1)
+                variables[f'o{i}'] = owner
+                variables[f'n{i}'] = name
+                declarations.append(f'$o{i}: String!, $n{i}: String!')
+                selections.append(f'r{i}: repository(owner: $o{i}, name: $n{i}) {{ {REPO_FIELDS} }}')
+            query = 'query(%s) { %s }' % (', '.join(declarations), '\n'.join(selections))
+
+            data = self.query(query, variables, partial=True)
+            for i, full_name in enumerate(batch):
+                node = data.get(f'r{i}')
+                if node:
+                    repo = self.to_rest_shape(node)
+                    self._repo_memo.set(full_name.lower(), repo)
+                    repos[full_name] = repo
+        return repos
+
+    def get_repo(self, owner: str, name: str) -> Dict:
+        """Obtém um repositório (reaproveita o que já veio na listagem)"""
+        key = f'{owner}/{name}'.lower()
+        repo = self._repo_memo.get(key)
+        if repo is None:
+            data = self.query(REPO_QUERY, {'owner': owner, 'name': name}, partial=True)
+            if data.get('repository') is None:
+                raise RuntimeError(f'Repositório não encontrado: {owner}/{name}')
+            repo = self.to_rest_shape(data['repository'])
+            self._repo_memo.set(key, repo)
+        return repo
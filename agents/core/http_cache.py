@@ -0,0 +1,144 @@
+"""
+Cache HTTP condicional persistido em disco
+Guarda ETag/Last-Modified junto com o corpo e reaproveita respostas 304
+"""
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+from typing import Dict, Optional, Set
+
+
+class HTTPCache:
+    """Cache de respostas GET baseado em ETag / If-None-Match"""
+
+    # Cabeçalhos da resposta original que precisam ser restaurados num 304
+    STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Link')
+
+    def __init__(self, cache_dir: str = '.cache/github', max_age_days: float = 8):
+        self.cache_dir = cache_dir
+        # Entradas não usadas há mais tempo que isso são removidas por prune()
+        self.max_age_days = max_age_days
+        self.hits = 0
+        self.misses = 0
+        # Chaves lidas ou gravadas nesta execução (nunca removidas por prune())
+        self._touched: Set[str] = set()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def make_key(self, url: str, params: Optional[Dict] = None, identity: Optional[str] = None) -> str:
+        """
+        Gera a chave do cache a partir da URL, parâmetros e identidade autenticada
+        A identidade é o login (estável entre execuções), nunca o token: no CI cada job
+        recebe um token novo e as entradas deixariam de ser encontradas
+        """
+        params_str = json.dumps(sorted((params or {}).items()), default=str)
+        raw = f'{url}|{params_str}|{identity or ""}'
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f'{key}.json')
+
+    def load(self, key: str) -> Optional[Dict]:
+        """Lê uma entrada do cache (ou None se não existir / estiver corrompida)"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        self._touch(key, path)
+        return entry
+
+    def _touch(self, key: str, path: str):
+        """Marca a entrada como usada (a data de modificação guia o prune())"""
+        self._touched.add(key)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def store(self, key: str, response) -> None:
+        """Salva uma resposta 200 que tenha validadores (ETag ou Last-Modified)"""
+        headers = {
+            name: response.headers[name]
+            for name in self.STORED_HEADERS
+            if name in response.headers
+        }
+        if 'ETag' not in headers and 'Last-Modified' not in headers:
+            return
+
+        entry = {
+            'url': response.url,
+            'headers': headers,
+            'body': response.content.decode('utf-8', errors='replace')
+        }
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Escrita atômica: evita entradas parciais se o processo for interrompido
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+            self._touched.add(key)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def conditional_headers(self, entry: Optional[Dict]) -> Dict[str, str]:
+        """Cabeçalhos If-None-Match / If-Modified-Since para uma entrada"""
+        if not entry:
+            return {}
+        headers = {}
+        if entry['headers'].get('ETag'):
+            headers['If-None-Match'] = entry['headers']['ETag']
+        if entry['headers'].get('Last-Modified'):
+            headers['If-Modified-Since'] = entry['headers']['Last-Modified']
+        return headers
+
+    def replay(self, entry: Dict, response):
+        """Transforma um 304 na resposta 200 guardada em disco"""
+        response.status_code = 200
+        response._content = entry['body'].encode('utf-8')
+        response.encoding = 'utf-8'
+        # Mantém cabeçalhos novos (ex: rate limit) e restaura os do corpo original
+        response.headers.update(entry['headers'])
+        response.from_cache = True
+        return response
+
+    def prune(self, max_age_days: Optional[float] = None) -> int:
+        """
+        Remove entradas não usadas nesta execução nem nos últimos max_age_days
+        O diretório é restaurado entre execuções do CI e, sem isso, cresceria para sempre;
+        a janela preserva entradas de agentes que rodam em outro agendamento
+        Retorna quantas entradas foram removidas
+        """
+        if max_age_days is None:
+            max_age_days = self.max_age_days
+        cutoff = time.time() - max_age_days * 86400
+        removed = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                if name.endswith('.json'):
+                    if name[:-len('.json')] in self._touched:
+                        continue
+                elif not name.endswith('.tmp'):
+                    continue
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        os.remove(path)
+                        removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    def clear(self):
+        """Remove todas as entradas do cache"""
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith('.json'):
+                    os.remove(os.path.join(root, name))
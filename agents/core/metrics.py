@@ -0,0 +1,217 @@
+"""
+Instrumentação das requisições HTTP
+Registra cada chamada à API (endpoint, agente, status, latência, bytes, cache e
+rate limit) e agrega em histogramas por agente e por endpoint
+"""
+
+import os
+import json
+import threading
+import contextvars
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+# Agente responsável pelas requisições do contexto atual
+current_agent = contextvars.ContextVar('current_agent', default='standalone')
+
+# Limites dos buckets de latência (segundos), no estilo Prometheus
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Segmento seguinte a estas palavras é um identificador, não parte do endpoint
+_PLACEHOLDERS = {
+    'users': ('{user}',),
+    'orgs': ('{org}',),
+    'repos': ('{owner}', '{repo}'),
+}
+
+
+@contextmanager
+def agent_scope(name: str):
+    """Atribui as requisições feitas dentro do bloco ao agente informado"""
+    token = current_agent.set(name)
+    try:
+        yield
+    finally:
+        current_agent.reset(token)
+
+
+def endpoint_template(url: str) -> str:
+    """Converte uma URL concreta no template do endpoint (ex: /repos/{owner}/{repo}/languages)"""
+    segments = [s for s in urlparse(url).path.split('/') if s]
+    template = []
+    i = 0
+    while i < len(segments):
+        segment = segments[i]
+        template.append(segment)
+        i += 1
+        if segment == 'contents':
+            # O restante é o caminho do arquivo
+            if i < len(segments):
+                template.append('{path}')
+            break
+        placeholders = _PLACEHOLDERS.get(segment) if len(template) == 1 else None
+        if placeholders:
+            for placeholder in placeholders:
+                if i < len(segments):
+                    template.append(placeholder)
+                    i += 1
+    return '/' + '/'.join(template)
+
+
+class _Histogram:
+    """Histograma de latência com contadores agregados"""
+
+    def __init__(self):
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.latency_sum = 0.0
+        self.bytes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.statuses: Dict[str, int] = {}
+
+    def observe(self, status: str, latency: float, size: int, cache_hit: Optional[bool]):
+        self.count += 1
+        self.latency_sum += latency
+        self.bytes += size
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if cache_hit is True:
+            self.cache_hits += 1
+        elif cache_hit is False:
+            self.cache_misses += 1
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                self.buckets[i] += 1
+
+    def to_dict(self) -> Dict:
+        return {
+            'count': self.count,
+            'latency_sum': round(self.latency_sum, 4),
+            'latency_avg': round(self.latency_sum / self.count, 4) if self.count else 0,
+            'latency_buckets': {str(bound): n for bound, n in zip(LATENCY_BUCKETS, self.buckets)},
+            'bytes': self.bytes,
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'statuses': dict(self.statuses)
+        }
+
+
+class RequestMetrics:
+    """Coletor de métricas das requisições feitas pelos agentes"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (agente, endpoint) -> histograma; visões por agente/endpoint são derivadas
+        self.series: Dict[tuple, _Histogram] = {}
+        self.rate_limit_remaining: Dict[str, int] = {}
+
+    def record(self, url: str, status, latency: float, size: int = 0,
+               cache_hit: Optional[bool] = None, headers=None):
+        """Registra uma requisição concluída (status pode ser 'error')"""
+        key = (current_agent.get(), endpoint_template(url))
+        with self._lock:
+            histogram = self.series.setdefault(key, _Histogram())
+            histogram.observe(str(status), latency, size, cache_hit)
+            if headers is not None and 'X-RateLimit-Remaining' in headers:
+                resource = headers.get('X-RateLimit-Resource', 'core')
+                try:
+                    self.rate_limit_remaining[resource] = int(headers['X-RateLimit-Remaining'])
+                except ValueError:
+                    pass
+
+    def _group(self, index: int) -> Dict[str, Dict]:
+        grouped = {}
+        for key, histogram in self.series.items():
+            merged = grouped.setdefault(key[index], _Histogram())
+            merged.count += histogram.count
+            merged.latency_sum += histogram.latency_sum
+            merged.bytes += histogram.bytes
+            merged.cache_hits += histogram.cache_hits
+            merged.cache_misses += histogram.cache_misses
+            merged.buckets = [a + b for a, b in zip(merged.buckets, histogram.buckets)]
+            for status, n in histogram.statuses.items():
+                merged.statuses[status] = merged.statuses.get(status, 0) + n
+        return {name: histogram.to_dict() for name, histogram in sorted(grouped.items())}
+
+    def summary(self) -> Dict:
+        """Métricas agregadas por agente e por endpoint"""
+        with self._lock:
+            return {
+                'generated_at': datetime.now().isoformat(timespec='seconds'),
+                'total_requests': sum(h.count for h in self.series.values()),
+                'by_agent': self._group(0),
+                'by_endpoint': self._group(1),
+                'rate_limit_remaining': dict(self.rate_limit_remaining)
+            }
+
+    def write_json(self, path: str):
+        """Salva o resumo em JSON"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, indent=2, ensure_ascii=False)
+
+    @staticmethod
+    def _labels(**labels) -> str:
+        escaped = (
+            '{}="{}"'.format(k, str(v).replace('\\', '\\\\').replace('"', '\\"'))
+            for k, v in labels.items()
+        )
+        return '{' + ','.join(escaped) + '}'
+
+    def to_prometheus(self) -> str:
+        """Exporta no formato texto do Prometheus (textfile collector)"""
+        prefix = 'github_agents_http'
+        lines = [
+            f'# HELP {prefix}_request_duration_seconds Latência das requisições à GitHub API',
+            f'# TYPE {prefix}_request_duration_seconds histogram'
+        ]
+        with self._lock:
+            series = sorted(self.series.items())
+            for (agent, endpoint), h in series:
+                for bound, n in zip(LATENCY_BUCKETS, h.buckets):
+                    labels = self._labels(agent=agent, endpoint=endpoint, le=bound)
+                    lines.append(f'{prefix}_request_duration_seconds_bucket{labels} {n}')
+                labels = self._labels(agent=agent, endpoint=endpoint, le='+Inf')
+                lines.append(f'{prefix}_request_duration_seconds_bucket{labels} {h.count}')
+                labels = self._labels(agent=agent, endpoint=endpoint)
+                lines.append(f'{prefix}_request_duration_seconds_sum{labels} {h.latency_sum:.6f}')
+                lines.append(f'{prefix}_request_duration_seconds_count{labels} {h.count}')
+
+            lines.append(f'# HELP {prefix}_requests_total Requisições por status')
+            lines.append(f'# TYPE {prefix}_requests_total counter')
+            for (agent, endpoint), h in series:
+                for status, n in sorted(h.statuses.items()):
+                    labels = self._labels(agent=agent, endpoint=endpoint, status=status)
+                    lines.append(f'{prefix}_requests_total{labels} {n}')
+
+            lines.append(f'# HELP {prefix}_response_bytes_total Bytes baixados')
+            lines.append(f'# TYPE {prefix}_response_bytes_total counter')
+            for (agent, endpoint), h in series:
+                labels = self._labels(agent=agent, endpoint=endpoint)
+                lines.append(f'{prefix}_response_bytes_total{labels} {h.bytes}')
+
+            lines.append(f'# HELP {prefix}_cache_requests_total Consultas ao cache HTTP')
+            lines.append(f'# TYPE {prefix}_cache_requests_total counter')
+            for (agent, endpoint), h in series:
+                for result, n in (('hit', h.cache_hits), ('miss', h.cache_misses)):
+                    labels = self._labels(agent=agent, endpoint=endpoint, result=result)
+                    lines.append(f'{prefix}_cache_requests_total{labels} {n}')
+
+            lines.append('# HELP github_agents_rate_limit_remaining Chamadas restantes por recurso')
+            lines.append('# TYPE github_agents_rate_limit_remaining gauge')
+            for resource, remaining in sorted(self.rate_limit_remaining.items()):
+                labels = self._labels(resource=resource)
+                lines.append(f'github_agents_rate_limit_remaining{labels} {remaining}')
+
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str):
+        """Salva as métricas para o textfile collector (escrita atômica)"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
@@ -0,0 +1,163 @@
+"""
+Agendador ciente do rate limit da GitHub API
+Mantém um bucket de tokens por recurso (core, search, graphql), sincronizado
+com os cabeçalhos X-RateLimit-* e com fila de prioridade entre os agentes
+"""
+
+import time
+import heapq
+import itertools
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+# Prioridades (menor valor = mais importante)
+PRIORITY_HIGH = 0       # Chamadas essenciais para o README
+PRIORITY_NORMAL = 1     # Relatórios
+PRIORITY_LOW = 2        # Sugestões opcionais
+
+
+class RateLimitExceeded(Exception):
+    """Orçamento do recurso esgotado por mais tempo do que o permitido"""
+
+    def __init__(self, resource: str, wait_seconds: float):
+        self.resource = resource
+        self.wait_seconds = wait_seconds
+        super().__init__(
+            f"Rate limit do recurso '{resource}' esgotado (libera em {wait_seconds:.0f}s)"
+        )
+
+
+class RateLimitBucket:
+    """Estado de um recurso da API (limite, restante e horário de reset)"""
+
+    def __init__(self, resource: str, limit: int, window: int, reserve: int):
+        self.resource = resource
+        self.limit = limit
+        self.remaining = limit
+        self.window = window
+        self.reset_at = time.time() + window
+        # Tokens guardados para chamadas de maior prioridade
+        self.reserve = reserve
+        self.waiting = []
+        # Vira True após a primeira resposta com cabeçalhos de rate limit
+        self.synced = False
+
+    def refill(self, now: float):
+        """Renova o orçamento quando a janela expira"""
+        if now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = now + self.window
+
+
+class RateLimitScheduler:
+    """Controla o consumo de cada recurso e enfileira as chamadas por prioridade"""
+
+    # recurso -> (limite autenticado, limite anônimo, janela em segundos)
+    DEFAULT_LIMITS = {
+        'core': (5000, 60, 3600),
+        'search': (30, 10, 60),
+        'graphql': (5000, 0, 3600),
+    }
+
+    def __init__(self, authenticated: bool = True,
+                 reserve: Optional[Dict[str, int]] = None,
+                 max_wait: float = 120):
+        reserve = reserve or {}
+        self.max_wait = max_wait
+        self._condition = threading.Condition()
+        self._sequence = itertools.count()
+        self.buckets = {}
+        for resource, (auth_limit, anon_limit, window) in self.DEFAULT_LIMITS.items():
+            limit = auth_limit if authenticated else anon_limit
+            default_reserve = max(1, limit // 50) if limit else 0
+            self.buckets[resource] = RateLimitBucket(
+                resource, limit, window, reserve.get(resource, default_reserve)
+            )
+
+    @staticmethod
+    def resource_for(url: str) -> str:
+        """Identifica o recurso da API a partir da URL"""
+        path = urlparse(url).path
+        if path.rstrip('/').endswith('/graphql'):
+            return 'graphql'
+        if '/search/' in path:
+            return 'search'
+        return 'core'
+
+    def _bucket(self, resource: str) -> RateLimitBucket:
+        if resource not in self.buckets:
+            # Recursos menos comuns (code_scanning_upload etc.) seguem o core
+            resource = 'core'
+        return self.buckets[resource]
+
+    def acquire(self, resource: str, priority: int = PRIORITY_NORMAL):
+        """
+        Reserva um token do recurso, esperando na fila se necessário
+        Chamadas de menor prioridade não podem consumir a reserva das mais importantes.
+        """
+        bucket = self._bucket(resource)
+
+        with self._condition:
+            ticket = (priority, next(self._sequence))
+            heapq.heappush(bucket.waiting, ticket)
+            try:
+                while True:
+                    now = time.time()
+                    bucket.refill(now)
+                    # A reserva nunca passa de 1/4 do limite (ex: 60 chamadas sem token)
+                    floor = min(bucket.reserve, bucket.limit // 4) * max(priority, 0)
+                    if bucket.waiting[0] == ticket and bucket.remaining > floor:
+                        bucket.remaining -= 1
+                        return
+
+                    if bucket.waiting[0] == ticket:
+                        # Sem orçamento: espera a janela renovar
+                        wait = max(bucket.reset_at - now, 0.05)
+                        if wait > self.max_wait:
+                            raise RateLimitExceeded(bucket.resource, wait)
+                        self._condition.wait(timeout=wait)
+                    else:
+                        self._condition.wait(timeout=1)
+            finally:
+                bucket.waiting.remove(ticket)
+                heapq.heapify(bucket.waiting)
+                self._condition.notify_all()
+
+    def update(self, resource: str, headers) -> None:
+        """Sincroniza o bucket com os cabeçalhos X-RateLimit-* da resposta"""
+        if 'X-RateLimit-Remaining' not in headers:
+            return
+
+        bucket = self._bucket(headers.get('X-RateLimit-Resource', resource))
+        try:
+            remaining = int(headers['X-RateLimit-Remaining'])
+            limit = int(headers.get('X-RateLimit-Limit', bucket.limit))
+            reset_at = float(headers.get('X-RateLimit-Reset', bucket.reset_at))
+        except ValueError:
+            return
+
+        with self._condition:
+            if not bucket.synced or reset_at > bucket.reset_at + 1:
+                # Primeira resposta ou nova janela: o servidor é a fonte da verdade
+                bucket.remaining = remaining
+                bucket.synced = True
+            else:
+                # Respostas concorrentes podem chegar fora de ordem: fica com o menor
+                bucket.remaining = min(bucket.remaining, remaining)
+            bucket.limit = limit
+            bucket.reset_at = reset_at
+            self._condition.notify_all()
+
+    def status(self) -> Dict[str, Dict]:
+        """Resumo do orçamento atual de cada recurso"""
+        with self._condition:
+            return {
+                resource: {
+                    'limit': bucket.limit,
+                    'remaining': bucket.remaining,
+                    'reset_at': bucket.reset_at
+                }
+                for resource, bucket in self.buckets.items()
+            }
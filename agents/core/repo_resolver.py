@@ -0,0 +1,60 @@
+"""
+Resolução em lote de repositórios a partir de URLs da API
+Remove duplicatas, serve repetições do cache e busca o restante de uma vez
+(em paralelo via REST ou numa única consulta GraphQL)
+"""
+
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+from .concurrent_fetch import ConcurrentFetcher
+from .rate_limit import PRIORITY_LOW
+from .ttl_cache import TTLCache
+
+
+class RepoResolver:
+    """Converte URLs de repositório (ex: issue['repository_url']) nos dados do repo"""
+
+    def __init__(self, client, cache: Optional[TTLCache] = None, priority: int = PRIORITY_LOW):
+        self.client = client
+        self.cache = cache
+        self.priority = priority
+
+    @staticmethod
+    def full_name(repo_url: str) -> str:
+        """'https://api.github.com/repos/dono/nome' -> 'dono/nome'"""
+        parts = [p for p in urlparse(repo_url).path.split('/') if p]
+        return '/'.join(parts[-2:])
+
+    def resolve(self, repo_urls: Iterable[str]) -> Dict[str, Dict]:
+        """Dados de cada URL distinta (URLs que falharem ficam de fora)"""
+        unique_urls = list(dict.fromkeys(repo_urls))
+        resolved = {}
+
+        missing = []
+        for url in unique_urls:
+            cached = self.cache.get(url) if self.cache else None
+            if cached is not None:
+                resolved[url] = cached
+            else:
+                missing.append(url)
+
+        if missing:
+            if self.client.graphql:
+                by_name = {self.full_name(url).lower(): url for url in missing}
+                repos = self.client.graphql.get_repos(list(by_name))
+                for full_name, repo in repos.items():
+                    resolved[by_name[full_name.lower()]] = repo
+            else:
+                def store(url: str, repo: Dict):
+                    resolved[url] = repo
+
+                ConcurrentFetcher(self.client, priority=self.priority).fetch_json(missing, store)
+
+            if self.cache:
+                for url in missing:
+                    if url in resolved:
+                        self.cache.set(url, resolved[url])
+                self.cache.save()
+
+        return resolved
@@ -0,0 +1,135 @@
+"""
+Política de retentativas para chamadas à GitHub API
+Backoff exponencial com jitter (respeitando Retry-After) e circuit breaker
+"""
+
+import time
+import random
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+
+class CircuitOpenError(Exception):
+    """A API está degradada e o circuito está aberto: chamada não enviada"""
+
+    def __init__(self, retry_in: float):
+        self.retry_in = retry_in
+        super().__init__(f"GitHub API instável: circuito aberto (nova tentativa em {retry_in:.0f}s)")
+
+
+class CircuitBreaker:
+    """
+    Interrompe as chamadas após falhas consecutivas
+    Depois de recovery_timeout, deixa passar uma chamada de teste (meio-aberto).
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 60):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = 'closed'   # closed | open | half-open
+        self.failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        """Levanta CircuitOpenError se o circuito estiver aberto"""
+        with self._lock:
+            if self.state != 'open':
+                return
+            elapsed = time.monotonic() - self.opened_at
+            if elapsed < self.recovery_timeout:
+                raise CircuitOpenError(self.recovery_timeout - elapsed)
+            self.state = 'half-open'
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.state = 'closed'
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == 'half-open' or self.failures >= self.failure_threshold:
+                if self.state != 'open':
+                    self.times_opened += 1
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+
+
+class RetryPolicy:
+    """Decide quando e quanto esperar antes de repetir uma requisição"""
+
+    RETRY_STATUSES = (500, 502, 503, 504)
+    IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+    def __init__(self, max_retries: int = 3, backoff_base: float = 1.0,
+                 backoff_max: float = 30.0, max_retry_after: float = 120.0):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        # Retry-After maior que isso: desiste em vez de esperar (nunca espera menos que o pedido)
+        self.max_retry_after = max_retry_after
+        self.retries = 0
+        self.backoff_seconds = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_secondary_rate_limit(response) -> bool:
+        """Rate limit secundário (abuso): 403/429 com Retry-After ou mensagem específica"""
+        if response.status_code not in (403, 429):
+            return False
+        if 'Retry-After' in response.headers:
+            return True
+        return 'secondary rate limit' in response.text.lower()
+
+    @staticmethod
+    def retry_after(response) -> Optional[float]:
+        """Segundos pedidos pelo cabeçalho Retry-After (número ou data HTTP); None se ausente"""
+        if response is None or 'Retry-After' not in response.headers:
+            return None
+        value = response.headers['Retry-After']
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+    def can_retry(self, method: str, attempt: int) -> bool:
+        """Só repete métodos idempotentes e dentro do limite de tentativas"""
+        return method.upper() in self.IDEMPOTENT_METHODS and attempt < self.max_retries
+
+    def should_retry(self, method: str, attempt: int, response) -> bool:
+        """Indica se a resposta é uma falha transitória que vale repetir"""
+        if not self.can_retry(method, attempt):
+            return False
+        if response.status_code not in self.RETRY_STATUSES and not self.is_secondary_rate_limit(response):
+            return False
+        # Esperar menos que o Retry-After só gera outra recusa: se for longo demais, desiste
+        retry_after = self.retry_after(response)
+        return retry_after is None or retry_after <= self.max_retry_after
+
+    def delay(self, attempt: int, response=None) -> float:
+        """Tempo de espera: Retry-After se houver (sem encurtar), senão backoff exponencial com jitter"""
+        retry_after = self.retry_after(response)
+        if retry_after is not None:
+            return retry_after
+        # "Full jitter": espalha as retentativas de vários workers
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def sleep(self, attempt: int, response=None):
+        """Espera antes da próxima tentativa e contabiliza o tempo gasto"""
+        seconds = self.delay(attempt, response)
+        with self._lock:
+            self.retries += 1
+            self.backoff_seconds += seconds
+        time.sleep(seconds)
+
+    def stats(self) -> Dict[str, float]:
+        """Total de retentativas e tempo gasto em backoff"""
+        with self._lock:
+            return {'retries': self.retries, 'backoff_seconds': round(self.backoff_seconds, 2)}
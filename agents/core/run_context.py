@@ -0,0 +1,92 @@
+"""
+Snapshot de dados compartilhado durante uma execução do orquestrador
+Carrega usuário, repositórios e linguagens uma única vez e serve todos os agentes
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+from .concurrent_fetch import ConcurrentFetcher
+
+
+class RunContext:
+    """
+    Dados do usuário carregados sob demanda e reaproveitados por todos os agentes
+    O conteúdo deve ser tratado como somente leitura pelos agentes.
+    """
+
+    def __init__(self, client, username: str):
+        self.client = client
+        self.username = username
+        self._lock = threading.RLock()
+        # Serializa só a carga das linguagens: leituras de user/repos não esperam o download
+        self._languages_lock = threading.Lock()
+        self._user = None
+        self._repos = None
+        self._languages = None
+
+    def invalidate(self):
+        """Descarta o snapshot (a próxima leitura busca os dados de novo)"""
+        with self._lock:
+            self._user = None
+            self._repos = None
+            self._languages = None
+
+    @property
+    def user(self) -> Dict:
+        """Dados do usuário (/users/{username})"""
+        with self._lock:
+            if self._user is None:
+                self._user = self.client.get_json(f'/users/{self.username}')
+            return self._user
+
+    @property
+    def repos(self) -> Tuple[Dict, ...]:
+        """Todos os repositórios do usuário, ordenados por atualização"""
+        with self._lock:
+            if self._repos is None:
+                if self.client.graphql:
+                    repos = self.client.graphql.iter_repos(self.username)
+                else:
+                    repos = self.client.paginate(
+                        f'/users/{self.username}/repos',
+                        params={'sort': 'updated', 'per_page': 100}
+                    )
+                self._repos = tuple(repos)
+            return self._repos
+
+    @property
+    def languages(self) -> Dict[str, Dict[str, int]]:
+        """Bytes por linguagem de cada repositório (não-fork), indexado por full_name"""
+        with self._languages_lock:
+            with self._lock:
+                if self._languages is not None:
+                    return self._languages
+            repos = self.repos
+
+            # Download fora de self._lock; o resultado só é publicado se o snapshot não mudou
+            languages = {}
+            urls = {}
+            for repo in repos:
+                if repo.get('fork'):
+                    continue
+                if 'languages' in repo:
+                    languages[repo['full_name']] = repo['languages']
+                else:
+                    urls[repo['languages_url']] = repo['full_name']
+
+            def store(url: str, repo_languages: Dict[str, int]):
+                languages[urls[url]] = repo_languages
+
+            ConcurrentFetcher(self.client).fetch_json(urls, store)
+            with self._lock:
+                if self._repos is repos:
+                    self._languages = languages
+            return languages
+
+    def find_repo(self, repo_name: str) -> Optional[Dict]:
+        """Procura um repositório do snapshot pelo nome"""
+        for repo in self.repos:
+            if repo['name'].lower() == repo_name.lower():
+                return repo
+        return None
@@ -0,0 +1,96 @@
+"""
+Cache de resultados da Search API
+A busca tem cota própria e pequena (30/min): resultados são guardados por consulta
+normalizada, com TTL, limite de tamanho (LRU) e stale-while-revalidate
+"""
+
+import re
+import threading
+import contextvars
+from typing import Dict, List, Optional
+
+from .rate_limit import PRIORITY_LOW
+from .ttl_cache import TTLCache
+
+
+# Termos da consulta: palavras, qualificadores e trechos entre aspas (ex: label:"good first issue")
+_TOKEN = re.compile(r'(?:[^\s"]+|"[^"]*")+')
+
+
+class SearchCache:
+    """Busca na Search API servindo repetições do cache"""
+
+    def __init__(self, client, path: Optional[str] = None, ttl: float = 86400,
+                 stale_ttl: float = 86400, max_entries: int = 200):
+        self.client = client
+        self.ttl = ttl
+        # Entradas vencidas continuam servíveis (e são renovadas em background) por stale_ttl
+        self.cache = TTLCache(path, ttl=ttl + stale_ttl, max_entries=max_entries)
+        self._refreshing = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Consultas equivalentes geram a mesma chave (caixa, espaços e ordem dos termos)"""
+        return ' '.join(sorted(token.lower() for token in _TOKEN.findall(query)))
+
+    def make_key(self, endpoint: str, params: Dict) -> str:
+        return '|'.join([
+            endpoint.rstrip('/'),
+            self.normalize_query(params.get('q', '')),
+            str(params.get('sort', '')),
+            str(params.get('order', '')),
+            str(params.get('page', 1)),
+            str(params.get('per_page', 30))
+        ])
+
+    def _fetch(self, key: str, endpoint: str, params: Dict, priority: int) -> List[Dict]:
+        response = self.client.get(endpoint, params=params, priority=priority)
+        response.raise_for_status()
+        items = response.json().get('items', [])
+        self.cache.set(key, items)
+        return items
+
+    def _revalidate(self, key: str, endpoint: str, params: Dict, priority: int):
+        """Renova uma entrada vencida em background (uma vez por chave)"""
+        def run():
+            try:
+                self._fetch(key, endpoint, params, priority)
+            except Exception:
+                # Mantém o valor antigo; nova tentativa na próxima leitura
+                pass
+            finally:
+                with self._lock:
+                    self._refreshing.pop(key, None)
+
+        with self._lock:
+            if key in self._refreshing:
+                return
+            # copy_context: a renovação continua atribuída ao agente que fez a busca (métricas)
+            context = contextvars.copy_context()
+            thread = threading.Thread(target=context.run, args=(run,), daemon=True)
+            self._refreshing[key] = thread
+        thread.start()
+
+    def search(self, endpoint: str, params: Dict, priority: int = PRIORITY_LOW) -> List[Dict]:
+        """Itens da busca: do cache se fresco, stale + renovação se vencido, senão da API"""
+        key = self.make_key(endpoint, params)
+        entry = self.cache.get_entry(key)
+
+        if entry is not None:
+            items, age = entry
+            if age <= self.ttl:
+                return items
+            if age <= self.cache.ttl:
+                self._revalidate(key, endpoint, params, priority)
+                return items
+
+        return self._fetch(key, endpoint, params, priority)
+
+    def close(self):
+        """Aguarda as renovações pendentes e salva o cache em disco"""
+        with self._lock:
+            threads = list(self._refreshing.values())
+        for thread in threads:
+            thread.join()
+        self.cache.save()
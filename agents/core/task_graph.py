@@ -0,0 +1,123 @@
+"""
+Execução de tarefas como grafo de dependências
+Roda tarefas independentes em paralelo num pool de workers, isolando erros
+e a saída de cada tarefa, e mede o tempo de cada uma
+"""
+
+import io
+import sys
+import time
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+class TaskResult:
+    """Resultado de uma tarefa do grafo"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.status = 'pending'   # pending | ok | failed | skipped
+        self.duration = 0.0
+        self.error: Optional[BaseException] = None
+        self.value = None
+        self.output = ''
+
+
+class _ThreadLocalStdout(io.TextIOBase):
+    """Redireciona prints de cada thread para um buffer próprio"""
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self.buffers = {}
+
+    def write(self, text):
+        buffer = self.buffers.get(threading.get_ident())
+        return (buffer or self.fallback).write(text)
+
+    def flush(self):
+        self.fallback.flush()
+
+
+class TaskGraph:
+    """Grafo de tarefas com dependências executado em paralelo"""
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max(1, max_workers)
+        self.tasks: Dict[str, Callable] = {}
+        self.dependencies: Dict[str, List[str]] = {}
+
+    def add(self, name: str, func: Callable, depends_on: Iterable[str] = ()):
+        """Registra uma tarefa; um retorno False conta como falha"""
+        self.tasks[name] = func
+        self.dependencies[name] = list(depends_on)
+
+    def _run_task(self, func: Callable, result: TaskResult, stdout: _ThreadLocalStdout):
+        buffer = io.StringIO()
+        stdout.buffers[threading.get_ident()] = buffer
+        start = time.perf_counter()
+        try:
+            result.value = func()
+            result.status = 'failed' if result.value is False else 'ok'
+        except Exception as e:
+            result.status = 'failed'
+            result.error = e
+            buffer.write(f"❌ Erro em {result.name}: {e}\n")
+        finally:
+            result.duration = time.perf_counter() - start
+            del stdout.buffers[threading.get_ident()]
+            result.output = buffer.getvalue()
+        return result
+
+    def run(self) -> Dict[str, TaskResult]:
+        """Executa o grafo e devolve o resultado de cada tarefa"""
+        for name, deps in self.dependencies.items():
+            missing = [dep for dep in deps if dep not in self.tasks]
+            if missing:
+                raise ValueError(f"Tarefa '{name}' depende de tarefas inexistentes: {missing}")
+
+        results = {name: TaskResult(name) for name in self.tasks}
+        remaining = dict(self.dependencies)
+        running = {}
+
+        stdout = _ThreadLocalStdout(sys.stdout)
+        sys.stdout = stdout
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                while remaining or running:
+                    for name, deps in list(remaining.items()):
+                        statuses = [results[dep].status for dep in deps]
+                        if any(status in ('failed', 'skipped') for status in statuses):
+                            # Dependência falhou: a tarefa não roda, mas o resto do grafo segue
+                            results[name].status = 'skipped'
+                            del remaining[name]
+                        elif all(status == 'ok' for status in statuses):
+                            future = executor.submit(self._run_task, self.tasks[name], results[name], stdout)
+                            running[future] = name
+                            del remaining[name]
+
+                    if not running:
+                        if remaining:
+                            raise ValueError(f"Dependência circular entre: {sorted(remaining)}")
+                        break
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = running.pop(future)
+                        # Saída de cada tarefa impressa em bloco, sem intercalar com as outras
+                        stdout.fallback.write(results[name].output)
+                        stdout.fallback.flush()
+        finally:
+            sys.stdout = stdout.fallback
+
+        return results
+
+    @staticmethod
+    def format_summary(results: Dict[str, TaskResult], total: float) -> str:
+        """Resumo de tempo por tarefa"""
+        icons = {'ok': '✅', 'failed': '❌', 'skipped': '⏭️', 'pending': '⏳'}
+        lines = ["⏱️  Tempo por agente:"]
+        for result in sorted(results.values(), key=lambda r: r.duration, reverse=True):
+            lines.append(f"  {icons[result.status]} {result.name}: {result.duration:.2f}s")
+        lines.append(f"  ⏰ Total: {total:.2f}s")
+        return "\n".join(lines)
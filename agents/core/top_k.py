@@ -0,0 +1,35 @@
+"""
+Seleção incremental dos K maiores itens de um fluxo
+Heap de tamanho K: memória limitada por K, não pela quantidade de itens
+"""
+
+import heapq
+from typing import Any, List, Tuple
+
+
+class TopK:
+    """Os K itens de maior score; empates mantêm a ordem de chegada (como sort estável)"""
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def add(self, score: float, item: Any):
+        # O contador desempata e evita comparar os itens; em empate, sai o que chegou depois
+        entry = (score, -self._count, item)
+        self._count += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif self.k and entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def scored(self) -> List[Tuple[Any, float]]:
+        """(item, score) do maior para o menor"""
+        return [(item, score) for score, _, item in sorted(self._heap, reverse=True)]
+
+    def items(self) -> List[Any]:
+        return [item for item, _ in self.scored()]
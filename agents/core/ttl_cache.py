@@ -0,0 +1,79 @@
+"""
+Cache chave/valor com expiração (TTL), opcionalmente persistido em JSON
+Usado para dados que mudam pouco entre execuções (ex: metadados de repositórios)
+Com max_entries, as entradas menos usadas recentemente são descartadas (LRU)
+"""
+
+import os
+import json
+import time
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+class TTLCache:
+    """Cache com tempo de vida por entrada, salvo em disco entre execuções"""
+
+    def __init__(self, path: Optional[str] = None, ttl: float = 86400,
+                 max_entries: Optional[int] = None):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # chave -> [momento em que foi salvo, valor], da menos para a mais usada
+        self.entries: OrderedDict = OrderedDict()
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.entries = OrderedDict(json.load(f))
+            except (OSError, ValueError):
+                self.entries = OrderedDict()
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, float]]:
+        """(valor, idade em segundos) mesmo se expirado; None se não existir"""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            self.entries.move_to_end(key)
+            return entry[1], time.time() - entry[0]
+
+    def get(self, key: str) -> Optional[Any]:
+        """Valor da chave, ou None se não existir ou estiver expirado"""
+        entry = self.get_entry(key)
+        if entry is None or entry[1] > self.ttl:
+            return None
+        return entry[0]
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self.entries[key] = [time.time(), value]
+            self.entries.move_to_end(key)
+            if self.max_entries is not None:
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+
+    def purge(self):
+        """Remove entradas expiradas"""
+        now = time.time()
+        with self._lock:
+            self.entries = OrderedDict(
+                (key, entry) for key, entry in self.entries.items()
+                if now - entry[0] <= self.ttl
+            )
+
+    def save(self):
+        """Grava o cache em disco (escrita atômica)"""
+        if not self.path:
+            return
+        self.purge()
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            data = json.dumps(self.entries)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
@@ -4,35 +4,39 @@ Responsável por garantir documentação clara e profissional em todos os projet
 """
 
 import os
-import requests
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from ..core import GitHubAgent, GitHubClient, RunContext
 
-class DocumentationAgent:
+
+class DocumentationAgent(GitHubAgent):
     """Agente responsável pela documentação dos projetos"""
 
-    def __init__(self, username: str, github_token: Optional[str] = None):
-        self.username = username
-        self.github_token = github_token or os.getenv('GITHUB_TOKEN')
-        self.api_base = 'https://api.github.com'
-        self.headers = {
-            'Accept': 'application/vnd.github.v3+json',
-        }
-        if self.github_token:
-            self.headers['Authorization'] = f'token {self.github_token}'
+    def __init__(self, username: str, github_token: Optional[str] = None,
+                 client: Optional[GitHubClient] = None,
+                 context: Optional[RunContext] = None):
+        super().__init__(username, github_token, client, context)
 
     def get_repo_info(self, repo_name: str) -> Dict:
         """Obtém informações do repositório"""
+        if self.context:
+            repo = self.context.find_repo(repo_name)
+            if repo:
+                return repo
+        if self.client.graphql:
+            return self.client.graphql.get_repo(self.username, repo_name)
         url = f'{self.api_base}/repos/{self.username}/{repo_name}'
-        response = requests.get(url, headers=self.headers)
+        response = self.client.get(url)
         response.raise_for_status()
         return response.json()
 
     def get_repo_languages(self, repo_name: str) -> Dict[str, int]:
         """Obtém linguagens usadas no repositório"""
+        if self.client.graphql:
+            return self.client.graphql.get_repo(self.username, repo_name)['languages']
         url = f'{self.api_base}/repos/{self.username}/{repo_name}/languages'
-        response = requests.get(url, headers=self.headers)
+        response = self.client.get(url)
         response.raise_for_status()
         return response.json()
 
@@ -1,5 +1,20 @@
 """Agente de Engajamento (Social Dev)"""
 
 from .engagement_agent import EngagementAgent
+from .event_store import EventStore
+from .activity import ActivityAggregator
+from .calendar import ContributionCalendar
+from .batch import BatchEngagement, org_members
+from .webhook import ActivityTracker, WebhookReceiver, verify_signature
 
-__all__ = ['EngagementAgent']
+__all__ = [
+    'EngagementAgent',
+    'EventStore',
+    'ActivityAggregator',
+    'ContributionCalendar',
+    'BatchEngagement',
+    'org_members',
+    'ActivityTracker',
+    'WebhookReceiver',
+    'verify_signature'
+]
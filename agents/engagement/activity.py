@@ -0,0 +1,132 @@
+"""
+Agregação de atividade em várias janelas de tempo numa única passada
+Cada evento tem o timestamp convertido uma vez e alimenta todas as janelas que o contêm
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+from .calendar import ContributionCalendar
+
+
+DEFAULT_WINDOWS = (7, 30, 90, 365)
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Converte '2024-01-31T12:00:00Z' (muito mais rápido que strptime)"""
+    return datetime.fromisoformat(value[:19])
+
+
+class _WindowCounters:
+    """Contadores de atividade de uma janela (mesmo formato de analyze_activity)"""
+
+    def __init__(self, first_day: date):
+        # Dia em que a janela começa (parcial: só conta a partir do horário de corte)
+        self.first_day = first_day
+        self.first_day_active = False
+        self.total_events = 0
+        self.commits = 0
+        self.pull_requests = 0
+        self.issues_opened = 0
+        self.issues_commented = 0
+        self.repos_created = 0
+        self.repos_starred = 0
+        self.repos_forked = 0
+        self.event_types: Dict[str, int] = {}
+        self.repo_activity: Dict[str, int] = {}
+
+    def to_dict(self, calendar: ContributionCalendar, today: date) -> Dict:
+        most_active_repo = None
+        if self.repo_activity:
+            most_active_repo = max(self.repo_activity.items(), key=lambda x: x[1])
+
+        # Dias inteiros vêm do calendário; o dia de corte só conta se houve evento na janela
+        active_days = calendar.active_dates(self.first_day + timedelta(days=1), today)
+        if self.first_day_active:
+            active_days.append(self.first_day)
+
+        return {
+            'total_events': self.total_events,
+            'commits': self.commits,
+            'pull_requests': self.pull_requests,
+            'issues_opened': self.issues_opened,
+            'issues_commented': self.issues_commented,
+            'repos_created': self.repos_created,
+            'repos_starred': self.repos_starred,
+            'repos_forked': self.repos_forked,
+            'active_days': active_days,
+            'active_days_count': len(active_days),
+            'most_active_repo': most_active_repo,
+            'event_types': dict(self.event_types)
+        }
+
+
+class ActivityAggregator:
+    """Calcula os contadores de várias janelas (ex: 7/30/90/365 dias) numa passada"""
+
+    def __init__(self, windows: Iterable[int] = DEFAULT_WINDOWS, now: Optional[datetime] = None):
+        self.windows = sorted(set(windows))
+        self.now = now or datetime.now()
+        self.calendar = ContributionCalendar()
+        self.counters = {
+            days: _WindowCounters((self.now - timedelta(days=days)).date())
+            for days in self.windows
+        }
+
+    def add(self, event: Dict):
+        """Contabiliza um evento em todas as janelas que o contêm"""
+        created_at = parse_timestamp(event['created_at'])
+        age_days = (self.now - created_at).total_seconds() / 86400
+        windows = [days for days in self.windows if age_days <= days]
+        if not windows:
+            return
+
+        event_type = event['type']
+        payload = event.get('payload') or {}
+        event_date = created_at.date()
+        self.calendar.add(created_at, event_type)
+        repo_name = (event.get('repo') or {}).get('name')
+
+        commits = len(payload.get('commits', [])) if event_type == 'PushEvent' else 0
+        is_issue_opened = event_type == 'IssuesEvent' and payload.get('action') == 'opened'
+        is_repo_created = event_type == 'CreateEvent' and payload.get('ref_type') == 'repository'
+
+        for days in windows:
+            counters = self.counters[days]
+            counters.total_events += 1
+            counters.event_types[event_type] = counters.event_types.get(event_type, 0) + 1
+            if event_date == counters.first_day:
+                counters.first_day_active = True
+            counters.commits += commits
+            if event_type == 'PullRequestEvent':
+                counters.pull_requests += 1
+            elif is_issue_opened:
+                counters.issues_opened += 1
+            elif event_type == 'IssueCommentEvent':
+                counters.issues_commented += 1
+            elif is_repo_created:
+                counters.repos_created += 1
+            elif event_type == 'WatchEvent':
+                counters.repos_starred += 1
+            elif event_type == 'ForkEvent':
+                counters.repos_forked += 1
+            if repo_name:
+                counters.repo_activity[repo_name] = counters.repo_activity.get(repo_name, 0) + 1
+
+    def add_all(self, events: Iterable[Dict]) -> 'ActivityAggregator':
+        for event in events:
+            self.add(event)
+        return self
+
+    def result(self) -> Dict[int, Dict]:
+        """Atividade por janela: {dias: dict no formato de analyze_activity}"""
+        today = self.now.date()
+        streaks = {
+            'current_streak': self.calendar.current_streak(today),
+            'longest_streak': self.calendar.longest_streak()
+        }
+        result = {}
+        for days, counters in self.counters.items():
+            result[days] = counters.to_dict(self.calendar, today)
+            result[days].update(streaks)
+        return result
@@ -0,0 +1,126 @@
+"""
+Engajamento em lote para vários usuários (time ou organização)
+Um pool limitado de workers compartilha o cliente HTTP, o cache e o histórico de
+eventos: a vazão cresce com a concorrência em vez de um processo por usuário
+"""
+
+import os
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from ..core import GitHubClient, SearchCache, TTLCache
+from .activity import DEFAULT_WINDOWS
+from .engagement_agent import EngagementAgent
+from .event_store import EventStore
+
+
+def org_members(client: GitHubClient, org: str) -> List[str]:
+    """Logins dos membros (públicos, ou todos com token de membro) da organização"""
+    return [member['login'] for member in client.paginate(f'/orgs/{org}/members', params={'per_page': 100})]
+
+
+class BatchEngagement:
+    """Executa analyze_activity para vários usuários num pool de workers"""
+
+    def __init__(self, usernames: Iterable[str], client: Optional[GitHubClient] = None,
+                 event_store: Optional[EventStore] = None,
+                 repo_cache: Optional[TTLCache] = None,
+                 search_cache: Optional[SearchCache] = None,
+                 max_workers: int = 4):
+        # Remove duplicados mantendo a ordem informada
+        self.usernames = list(dict.fromkeys(name.strip() for name in usernames if name.strip()))
+        self.client = client or GitHubClient()
+        self.max_workers = max(1, max_workers)
+        self.agents = {
+            username: EngagementAgent(
+                username,
+                client=self.client,
+                event_store=event_store,
+                repo_cache=repo_cache,
+                search_cache=search_cache
+            )
+            for username in self.usernames
+        }
+        self.results: Dict[str, Dict[int, Dict]] = {}
+        self.errors: Dict[str, str] = {}
+
+    def run(self, windows: Iterable[int] = DEFAULT_WINDOWS) -> Dict[str, Dict[int, Dict]]:
+        """Atividade por usuário e janela; falhas individuais vão para self.errors"""
+        windows = sorted(set(windows))
+
+        def analyze(username: str) -> Dict[int, Dict]:
+            return self.agents[username].analyze_activity_windows(windows)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Cada tarefa leva uma cópia do contexto (métricas atribuídas ao agente atual)
+            futures = {
+                username: executor.submit(contextvars.copy_context().run, analyze, username)
+                for username in self.usernames
+            }
+            for username, future in futures.items():
+                try:
+                    self.results[username] = future.result()
+                except Exception as e:
+                    self.errors[username] = str(e)
+
+        return self.results
+
+    def leaderboard(self, days: int = 30) -> List[Dict]:
+        """Ranking dos usuários na janela: dias ativos, commits e pull requests"""
+        rows = []
+        for username, windows in self.results.items():
+            activity = windows[days]
+            rows.append({
+                'username': username,
+                'active_days': activity['active_days_count'],
+                'commits': activity['commits'],
+                'pull_requests': activity['pull_requests'],
+                'issues_opened': activity['issues_opened'],
+                'total_events': activity['total_events'],
+                'current_streak': activity['current_streak']
+            })
+
+        rows.sort(key=lambda row: (-row['active_days'], -row['commits'], -row['pull_requests'], row['username']))
+        return rows
+
+    def format_leaderboard(self, days: int = 30) -> str:
+        """Leaderboard combinado em markdown"""
+        lines = [
+            f"# 🏆 Leaderboard de Engajamento (últimos {days} dias)",
+            "",
+            "| # | Usuário | Dias ativos | Commits | PRs | Issues | Eventos | Streak |",
+            "|---|---------|-------------|---------|-----|--------|---------|--------|"
+        ]
+        for position, row in enumerate(self.leaderboard(days), 1):
+            lines.append(
+                f"| {position} | [@{row['username']}](https://github.com/{row['username']}) "
+                f"| {row['active_days']} | {row['commits']} | {row['pull_requests']} "
+                f"| {row['issues_opened']} | {row['total_events']} | {row['current_streak']} |"
+            )
+
+        if self.errors:
+            lines.extend(["", "## ⚠️ Falhas", ""])
+            for username, error in sorted(self.errors.items()):
+                lines.append(f"- @{username}: {error}")
+
+        lines.extend(["", "---", "*Gerado automaticamente pelo Agente de Engajamento*"])
+        return '\n'.join(lines)
+
+    def create_reports(self, output_dir: str = 'engagement_reports',
+                       leaderboard_file: str = 'LEADERBOARD.md', days: int = 30) -> List[str]:
+        """Grava o leaderboard e um relatório por usuário; retorna os arquivos gerados"""
+        os.makedirs(output_dir, exist_ok=True)
+        files = []
+
+        for username, windows in self.results.items():
+            path = os.path.join(output_dir, f'{username}.md')
+            self.agents[username].create_engagement_report(path, windows)
+            files.append(path)
+
+        path = os.path.join(output_dir, leaderboard_file)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.format_leaderboard(days))
+        files.append(path)
+        print(f"✅ Leaderboard salvo em {path}")
+        return files
@@ -0,0 +1,191 @@
+"""
+Calendário de contribuições compacto
+Um array de contagens por tipo de evento, indexado pelo número do dia: atualização
+em O(1) e consultas de streak/heatmap feitas sobre fatias em C (array/bytes)
+"""
+
+import zlib
+import struct
+from array import array
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+
+# Contagem máxima por dia (array 'H' = inteiro sem sinal de 16 bits)
+MAX_DAY_COUNT = 0xFFFF
+TOTAL = '*'
+
+
+class ContributionCalendar:
+    """Contagem diária de eventos por tipo, com histogramas de dia da semana e hora"""
+
+    def __init__(self, origin: Optional[date] = None):
+        # Dia 0 do calendário (ajustado automaticamente para datas anteriores)
+        self.origin = origin
+        self.days: Dict[str, array] = {}
+        self.weekdays = array('L', [0] * 7)
+        self.hours = array('L', [0] * 24)
+
+    def __len__(self) -> int:
+        return len(self.days.get(TOTAL, ()))
+
+    # ------------------------------------------------------------------ escrita
+
+    def _ensure(self, day: date) -> int:
+        """Garante espaço para o dia e retorna seu índice"""
+        if self.origin is None:
+            self.origin = day
+        index = day.toordinal() - self.origin.toordinal()
+
+        if index < 0:
+            # Data anterior à origem: desloca todos os arrays (raro)
+            padding = array('H', bytes(2 * -index))
+            for event_type in self.days:
+                self.days[event_type] = padding + self.days[event_type]
+            self.origin = day
+            index = 0
+
+        for event_type, counts in self.days.items():
+            if len(counts) <= index:
+                counts.frombytes(bytes(2 * (index + 1 - len(counts))))
+        return index
+
+    def add(self, when: datetime, event_type: str, count: int = 1):
+        """Registra eventos de um tipo num instante (O(1) amortizado)"""
+        if event_type not in self.days:
+            self.days[event_type] = array('H', bytes(2 * len(self)))
+        if TOTAL not in self.days:
+            self.days[TOTAL] = array('H')
+
+        index = self._ensure(when.date())
+        for key in (event_type, TOTAL):
+            counts = self.days[key]
+            counts[index] = min(counts[index] + count, MAX_DAY_COUNT)
+
+        self.weekdays[when.weekday()] += count
+        self.hours[when.hour] += count
+
+    def add_event(self, event: Dict):
+        """Registra um evento no formato da API"""
+        when = datetime.fromisoformat(event['created_at'][:19])
+        self.add(when, event['type'])
+
+    # ----------------------------------------------------------------- consultas
+
+    def _index(self, day: date) -> int:
+        return day.toordinal() - self.origin.toordinal()
+
+    def counts(self, start: date, end: date, event_type: str = TOTAL) -> List[int]:
+        """Contagens diárias no intervalo [start, end]"""
+        length = (end - start).days + 1
+        if self.origin is None or length <= 0:
+            return [0] * max(length, 0)
+        counts = self.days.get(event_type, array('H'))
+        first, last = self._index(start), self._index(end)
+        lo, hi = max(first, 0), min(last, len(counts) - 1)
+        window = counts[lo:hi + 1].tolist() if hi >= lo else []
+        head = [0] * min(max(lo - first, 0), length)
+        tail = [0] * (length - len(head) - len(window))
+        return head + window + tail
+
+    def active_flags(self, start: Optional[date] = None, end: Optional[date] = None) -> bytes:
+        """Um byte por dia (1 = ativo), pronto para operações de bytes em C"""
+        if self.origin is None:
+            return b''
+        total = self.days[TOTAL]
+        start = start or self.origin
+        end = end or self.origin + timedelta(days=len(total) - 1)
+        counts = self.counts(start, end)
+        # bool é int: map + bytes convertem sem laço em Python
+        return bytes(map(bool, counts))
+
+    def active_days(self, start: date, end: date) -> int:
+        """Quantidade de dias ativos no intervalo"""
+        return self.active_flags(start, end).count(1)
+
+    def active_dates(self, start: date, end: date) -> List[date]:
+        """Datas com atividade no intervalo (mais recentes primeiro)"""
+        flags = self.active_flags(start, end)
+        return [start + timedelta(days=i) for i in range(len(flags) - 1, -1, -1) if flags[i]]
+
+    def current_streak(self, today: Optional[date] = None) -> int:
+        """Dias seguidos com atividade até hoje (ou até ontem, se hoje ainda não houve)"""
+        if self.origin is None:
+            return 0
+        today = today or date.today()
+        flags = self.active_flags(self.origin, today)
+        if flags and not flags[-1]:
+            flags = flags[:-1]
+        return len(flags) - len(flags.rstrip(b'\x01'))
+
+    def longest_streak(self) -> int:
+        """Maior sequência de dias ativos do histórico"""
+        flags = self.active_flags()
+        return max((len(run) for run in flags.split(b'\x00')), default=0)
+
+    def active_days_per_week(self, weeks: int = 53, today: Optional[date] = None) -> List[int]:
+        """Dias ativos em cada uma das últimas N semanas (semana começando no domingo)"""
+        return [len(column) - column.count(0) for column in self.heatmap(weeks, today)]
+
+    def heatmap(self, weeks: int = 53, today: Optional[date] = None,
+                event_type: str = TOTAL) -> List[List[int]]:
+        """
+        Grade no estilo do gráfico de contribuições do GitHub
+        Uma coluna por semana (domingo a sábado); dias futuros ficam com 0.
+        """
+        today = today or date.today()
+        # Último sábado da grade (fim da semana atual)
+        end = today + timedelta(days=(5 - today.weekday()) % 7)
+        start = end - timedelta(days=7 * weeks - 1)
+        counts = self.counts(start, end, event_type)
+        future = (end - today).days
+        if future:
+            counts[-future:] = [0] * future
+        return [counts[i:i + 7] for i in range(0, len(counts), 7)]
+
+    def weekday_histogram(self) -> List[int]:
+        """Eventos por dia da semana (0 = segunda)"""
+        return self.weekdays.tolist()
+
+    def hour_histogram(self) -> List[int]:
+        """Eventos por hora do dia (UTC)"""
+        return self.hours.tolist()
+
+    # ------------------------------------------------------------ serialização
+
+    def to_bytes(self) -> bytes:
+        """Serializa de forma compacta (arrays esparsos comprimem muito bem)"""
+        if self.origin is None:
+            return b''
+        parts = [struct.pack('<IH', self.origin.toordinal(), len(self.days))]
+        for event_type, counts in self.days.items():
+            name = event_type.encode('utf-8')
+            parts.append(struct.pack('<HI', len(name), len(counts)) + name + counts.tobytes())
+        parts.append(self.weekdays.tobytes() + self.hours.tobytes())
+        return zlib.compress(b''.join(parts), 9)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ContributionCalendar':
+        """Reconstrói um calendário serializado com to_bytes"""
+        calendar = cls()
+        if not data:
+            return calendar
+        raw = zlib.decompress(data)
+        origin, type_count = struct.unpack_from('<IH', raw)
+        calendar.origin = date.fromordinal(origin)
+        offset = struct.calcsize('<IH')
+        for _ in range(type_count):
+            name_length, day_count = struct.unpack_from('<HI', raw, offset)
+            offset += struct.calcsize('<HI')
+            name = raw[offset:offset + name_length].decode('utf-8')
+            offset += name_length
+            counts = array('H')
+            counts.frombytes(raw[offset:offset + 2 * day_count])
+            offset += 2 * day_count
+            calendar.days[name] = counts
+        calendar.weekdays = array('L')
+        calendar.weekdays.frombytes(raw[offset:offset + 7 * calendar.weekdays.itemsize])
+        offset += 7 * calendar.weekdays.itemsize
+        calendar.hours = array('L')
+        calendar.hours.frombytes(raw[offset:offset + 24 * calendar.hours.itemsize])
+        return calendar
@@ -3,104 +3,79 @@ Agente de Engajamento (Social Dev)
 Responsável por fazer o perfil parecer ativo e conectado com a comunidade
 """
 
-import os
 import requests
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-
-
-class EngagementAgent:
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..core import (
+    PRIORITY_LOW,
+    GitHubAgent,
+    GitHubClient,
+    RateLimitExceeded,
+    RepoResolver,
+    SearchCache,
+    TTLCache
+)
+from .activity import DEFAULT_WINDOWS, ActivityAggregator, parse_timestamp
+from .event_store import EventStore
+
+
+class EngagementAgent(GitHubAgent):
     """Agente responsável pelo engajamento e atividade social no GitHub"""
 
-    def __init__(self, username: str, github_token: Optional[str] = None):
-        self.username = username
-        self.github_token = github_token or os.getenv('GITHUB_TOKEN')
-        self.api_base = 'https://api.github.com'
-        self.headers = {
-            'Accept': 'application/vnd.github.v3+json',
-        }
-        if self.github_token:
-            self.headers['Authorization'] = f'token {self.github_token}'
+    def __init__(self, username: str, github_token: Optional[str] = None,
+                 client: Optional[GitHubClient] = None,
+                 event_store: Optional[EventStore] = None,
+                 repo_cache: Optional[TTLCache] = None,
+                 search_cache: Optional[SearchCache] = None):
+        super().__init__(username, github_token, client)
+        # Histórico local de eventos (None = lê só o que a API ainda expõe)
+        self.event_store = event_store
+        # Metadados de repositórios de terceiros reaproveitados entre execuções
+        self.repo_cache = repo_cache
+        # Resultados de busca reaproveitados (a Search API tem cota de 30/min)
+        self.search_cache = search_cache
 
     def get_user_events(self, days: int = 30) -> List[Dict]:
         """Obtém eventos recentes do usuário"""
         url = f'{self.api_base}/users/{self.username}/events'
         params = {'per_page': 100}
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-
-        events = response.json()
 
         # Filtra eventos dos últimos N dias
         cutoff_date = datetime.now() - timedelta(days=days)
         recent_events = []
 
-        for event in events:
-            event_date = datetime.strptime(event['created_at'], '%Y-%m-%dT%H:%M:%SZ')
-            if event_date >= cutoff_date:
-                recent_events.append(event)
+        if self.event_store:
+            # Ingestão incremental: só os eventos novos vêm da API, o período sai do histórico
+            self.event_store.ingest(self.client, self.username)
+            return self.event_store.read(self.username, since=cutoff_date)
+
+        # Eventos vêm do mais novo para o mais antigo: para no primeiro fora do período
+        for event in self.client.paginate(url, params=params):
+            event_date = parse_timestamp(event['created_at'])
+            if event_date < cutoff_date:
+                break
+            recent_events.append(event)
 
         return recent_events
 
+    def analyze_activity_windows(self, windows: Iterable[int] = DEFAULT_WINDOWS) -> Dict[int, Dict]:
+        """Analisa a atividade em várias janelas (dias) com uma única busca de eventos"""
+        windows = sorted(set(windows))
+        events = self.get_user_events(max(windows))
+        return ActivityAggregator(windows).add_all(events).result()
+
     def analyze_activity(self, days: int = 30) -> Dict:
         """Analisa atividade recente do usuário"""
-        events = self.get_user_events(days)
-
-        activity = {
-            'total_events': len(events),
-            'commits': 0,
-            'pull_requests': 0,
-            'issues_opened': 0,
-            'issues_commented': 0,
-            'repos_created': 0,
-            'repos_starred': 0,
-            'repos_forked': 0,
-            'active_days': set(),
-            'most_active_repo': None,
-            'event_types': {}
-        }
+        return self.analyze_activity_windows([days])[days]
 
-        repo_activity = {}
-
-        for event in events:
-            event_type = event['type']
-            activity['event_types'][event_type] = activity['event_types'].get(event_type, 0) + 1
-
-            # Data de atividade
-            event_date = datetime.strptime(event['created_at'], '%Y-%m-%dT%H:%M:%SZ').date()
-            activity['active_days'].add(event_date)
-
-            # Conta atividades por tipo
-            if event_type == 'PushEvent':
-                activity['commits'] += len(event.get('payload', {}).get('commits', []))
-            elif event_type == 'PullRequestEvent':
-                activity['pull_requests'] += 1
-            elif event_type == 'IssuesEvent':
-                if event.get('payload', {}).get('action') == 'opened':
-                    activity['issues_opened'] += 1
-            elif event_type == 'IssueCommentEvent':
-                activity['issues_commented'] += 1
-            elif event_type == 'CreateEvent':
-                if event.get('payload', {}).get('ref_type') == 'repository':
-                    activity['repos_created'] += 1
-            elif event_type == 'WatchEvent':
-                activity['repos_starred'] += 1
-            elif event_type == 'ForkEvent':
-                activity['repos_forked'] += 1
-
-            # Conta atividade por repositório
-            repo_name = event.get('repo', {}).get('name')
-            if repo_name:
-                repo_activity[repo_name] = repo_activity.get(repo_name, 0) + 1
-
-        # Repositório mais ativo
-        if repo_activity:
-            activity['most_active_repo'] = max(repo_activity.items(), key=lambda x: x[1])
-
-        activity['active_days_count'] = len(activity['active_days'])
-        activity['active_days'] = sorted(list(activity['active_days']), reverse=True)
-
-        return activity
+    def search(self, url: str, params: Dict) -> List[Dict]:
+        """Executa uma busca (Search API) passando pelo cache, se configurado"""
+        if self.search_cache:
+            return self.search_cache.search(url, params, priority=PRIORITY_LOW)
+        response = self.client.get(url, params=params, priority=PRIORITY_LOW)
+        response.raise_for_status()
+        return response.json().get('items', [])
 
     def get_trending_repos(self, language: Optional[str] = None, since: str = 'daily') -> List[Dict]:
         """
@@ -123,10 +98,7 @@ class EngagementAgent:
             'per_page': 10
         }
 
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-
-        return response.json().get('items', [])
+        return self.search(url, params)
 
     def suggest_repos_to_star(self, interests: List[str], limit: int = 10) -> List[Dict]:
         """Sugere repositórios para dar estrela baseado em interesses"""
@@ -142,11 +114,10 @@ class EngagementAgent:
             }
 
             try:
-                response = requests.get(url, headers=self.headers, params=params)
-                response.raise_for_status()
-                repos = response.json().get('items', [])
+                repos = self.search(url, params)
                 suggestions.extend(repos[:3])  # Top 3 de cada interesse
-            except:
+            except (requests.RequestException, RateLimitExceeded) as e:
+                print(f"⚠️  Busca por '{interest}' ignorada: {e}")
                 continue
 
         # Remove duplicatas
@@ -161,7 +132,7 @@ class EngagementAgent:
 
     def suggest_repos_to_contribute(self, languages: List[str]) -> List[Dict]:
         """Sugere repositórios para contribuir baseado em linguagens de interesse"""
-        suggestions = []
+        issues = []
 
         for language in languages[:2]:
             # Busca por repos com label "good first issue"
@@ -174,22 +145,21 @@ class EngagementAgent:
             }
 
             try:
-                response = requests.get(url, headers=self.headers, params=params)
-                response.raise_for_status()
-                issues = response.json().get('items', [])
-
-                for issue in issues:
-                    repo_url = issue['repository_url']
-                    repo_response = requests.get(repo_url, headers=self.headers)
-                    if repo_response.status_code == 200:
-                        suggestions.append({
-                            'repo': repo_response.json(),
-                            'issue': issue
-                        })
-            except:
+                issues.extend(self.search(url, params))
+            except (requests.RequestException, RateLimitExceeded) as e:
+                print(f"⚠️  Busca por issues de {language} ignorada: {e}")
                 continue
 
-        return suggestions
+        # Cada repositório é buscado uma vez só, em lote, mesmo com várias issues nele
+        repos = RepoResolver(self.client, self.repo_cache).resolve(
+            issue['repository_url'] for issue in issues
+        )
+
+        return [
+            {'repo': repos[issue['repository_url']], 'issue': issue}
+            for issue in issues
+            if issue['repository_url'] in repos
+        ]
 
     def generate_achievement_post(self, activity: Dict, period_days: int = 30) -> str:
         """Gera post sobre conquistas recentes"""
@@ -248,9 +218,9 @@ class EngagementAgent:
 
         return "\n".join(post)
 
-    def generate_weekly_summary(self) -> str:
+    def generate_weekly_summary(self, activity: Optional[Dict] = None) -> str:
         """Gera resumo semanal de atividades"""
-        activity = self.analyze_activity(days=7)
+        activity = activity or self.analyze_activity(days=7)
 
         summary = [
             "# 📈 Resumo Semanal",
@@ -317,10 +287,13 @@ Sempre buscando aprender e contribuir com a comunidade de desenvolvedores! 💙
 
         return post
 
-    def create_engagement_report(self, output_file: str = 'ENGAGEMENT_REPORT.md'):
+    def create_engagement_report(self, output_file: str = 'ENGAGEMENT_REPORT.md',
+                                 activity_windows: Optional[Dict[int, Dict]] = None):
         """Cria relatório completo de engajamento"""
-        activity_30d = self.analyze_activity(days=30)
-        activity_7d = self.analyze_activity(days=7)
+        # Uma única agregação alimenta todas as seções (30 e 7 dias)
+        activity_windows = activity_windows or self.analyze_activity_windows()
+        activity_30d = activity_windows[30]
+        activity_7d = activity_windows[7]
 
         report = [
             "# 📊 Relatório de Engajamento",
@@ -336,6 +309,7 @@ Sempre buscando aprender e contribuir com a comunidade de desenvolvedores! 💙
             f"- **Comentários em issues**: {activity_30d['issues_commented']}",
             f"- **Repositórios criados**: {activity_30d['repos_created']}",
             f"- **Dias ativos**: {activity_30d['active_days_count']}/30",
+            f"- **Streak atual**: {activity_30d['current_streak']} dias (maior: {activity_30d['longest_streak']})",
             ""
         ]
 
@@ -0,0 +1,143 @@
+"""
+Armazenamento local de eventos do GitHub (SQLite)
+A API só expõe ~90 dias / 300 eventos: a ingestão incremental guarda o histórico
+completo e cada execução baixa apenas os eventos novos (cursor pelo id)
+"""
+
+import os
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+
+# Campos do payload usados nas análises (o payload completo pode ter dezenas de KB)
+PAYLOAD_FIELDS = ('action', 'ref_type', 'ref', 'size', 'distinct_size')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER NOT NULL,
+    username TEXT NOT NULL,
+    type TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    repo TEXT,
+    payload TEXT,
+    PRIMARY KEY (username, id)
+);
+CREATE INDEX IF NOT EXISTS idx_events_user_date ON events (username, created_at);
+CREATE TABLE IF NOT EXISTS cursors (
+    username TEXT PRIMARY KEY,
+    last_event_id INTEGER NOT NULL
+);
+"""
+
+
+class EventStore:
+    """Histórico local de eventos com cursor de ingestão por usuário"""
+
+    def __init__(self, path: str = '.cache/events.sqlite3'):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Uma conexão por operação (seguro para várias threads): commit ao final e fechada sempre
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _compact_payload(payload: Dict) -> Dict:
+        compact = {key: payload[key] for key in PAYLOAD_FIELDS if key in payload}
+        if 'commits' in payload:
+            compact['commits'] = [
+                {'sha': commit.get('sha'), 'message': (commit.get('message') or '')[:200]}
+                for commit in payload['commits']
+            ]
+        return compact
+
+    def last_event_id(self, username: str) -> int:
+        """Id do evento mais recente já armazenado (0 se vazio)"""
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT last_event_id FROM cursors WHERE username = ?', (username,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def ingest(self, client, username: str) -> int:
+        """
+        Baixa apenas os eventos mais novos que o cursor e os adiciona ao histórico
+        Retorna a quantidade de eventos novos.
+        """
+        last_id = self.last_event_id(username)
+        rows = []
+
+        # Eventos vêm do mais novo para o mais antigo: para ao alcançar o cursor
+        for event in client.paginate(f'/users/{username}/events', params={'per_page': 100}):
+            event_id = int(event['id'])
+            if event_id <= last_id:
+                break
+            rows.append((
+                event_id,
+                username,
+                event['type'],
+                event['created_at'],
+                (event.get('repo') or {}).get('name'),
+                json.dumps(self._compact_payload(event.get('payload') or {}))
+            ))
+
+        if not rows:
+            return 0
+
+        with self._connect() as conn:
+            conn.executemany(
+                'INSERT OR IGNORE INTO events (id, username, type, created_at, repo, payload) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                rows
+            )
+            conn.execute(
+                'INSERT INTO cursors (username, last_event_id) VALUES (?, ?) '
+                'ON CONFLICT(username) DO UPDATE SET last_event_id = excluded.last_event_id',
+                (username, max(row[0] for row in rows))
+            )
+        return len(rows)
+
+    def read(self, username: str, since: Optional[datetime] = None,
+             until: Optional[datetime] = None) -> List[Dict]:
+        """Eventos do período (mais novos primeiro), no formato da API"""
+        query = 'SELECT id, type, created_at, repo, payload FROM events WHERE username = ?'
+        params = [username]
+        if since:
+            query += ' AND created_at >= ?'
+            params.append(since.strftime('%Y-%m-%dT%H:%M:%SZ'))
+        if until:
+            query += ' AND created_at < ?'
+            params.append(until.strftime('%Y-%m-%dT%H:%M:%SZ'))
+        query += ' ORDER BY created_at DESC, id DESC'
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        return [
+            {
+                'id': str(event_id),
+                'type': event_type,
+                'created_at': created_at,
+                'repo': {'name': repo} if repo else {},
+                'payload': json.loads(payload) if payload else {}
+            }
+            for event_id, event_type, created_at, repo, payload in rows
+        ]
+
+    def count(self, username: str) -> int:
+        """Total de eventos armazenados para o usuário"""
+        with self._connect() as conn:
+            return conn.execute(
+                'SELECT COUNT(*) FROM events WHERE username = ?', (username,)
+            ).fetchone()[0]
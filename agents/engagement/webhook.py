@@ -0,0 +1,227 @@
+"""
+Receptor local de webhooks do GitHub
+Cada entrega assinada é convertida para o formato da Events API e aplicada
+incrementalmente aos mesmos contadores de analyze_activity (sem polling)
+"""
+
+import hmac
+import json
+import hashlib
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .activity import DEFAULT_WINDOWS, ActivityAggregator, parse_timestamp
+
+
+# Evento do webhook (header X-GitHub-Event) -> tipo equivalente da Events API
+WEBHOOK_EVENT_TYPES = {
+    'push': 'PushEvent',
+    'pull_request': 'PullRequestEvent',
+    'issues': 'IssuesEvent',
+    'issue_comment': 'IssueCommentEvent',
+    'watch': 'WatchEvent',
+    'fork': 'ForkEvent',
+    # Branches e tags; repositórios novos chegam como 'repository' (action 'created')
+    'create': 'CreateEvent',
+    'repository': 'CreateEvent'
+}
+
+# Ações que a Events API registra (as demais, ex: comentário editado ou PR com novo
+# push, são ignoradas para os contadores baterem com analyze_activity)
+WEBHOOK_ACTIONS = {
+    'issue_comment': {'created'},
+    'pull_request': {'opened', 'closed', 'reopened'},
+    'issues': {'opened', 'closed', 'reopened'},
+    'watch': {'started'},
+    'repository': {'created'}
+}
+
+# Entregas já aplicadas lembradas para ignorar reenvios (redeliver)
+MAX_DELIVERIES = 10000
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """Confere o header X-Hub-Signature-256 (HMAC-SHA256 do corpo com o segredo)"""
+    if not secret or not signature or not signature.startswith('sha256='):
+        return False
+    expected = hmac.new(secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(signature[len('sha256='):], expected)
+
+
+def to_event(event_name: str, payload: Dict, delivery: Optional[str] = None) -> Optional[Dict]:
+    """Converte um payload de webhook para o formato da Events API (None se não suportado)"""
+    event_type = WEBHOOK_EVENT_TYPES.get(event_name)
+    if event_type is None:
+        return None
+    actions = WEBHOOK_ACTIONS.get(event_name)
+    if actions is not None and payload.get('action') not in actions:
+        return None
+
+    event_payload = {}
+    if 'action' in payload:
+        event_payload['action'] = payload['action']
+    if event_name == 'push':
+        event_payload['ref'] = payload.get('ref')
+        event_payload['commits'] = [
+            {'sha': commit.get('id'), 'message': (commit.get('message') or '')[:200]}
+            for commit in payload.get('commits', [])
+        ]
+        event_payload['size'] = len(event_payload['commits'])
+    elif event_name == 'create':
+        event_payload['ref_type'] = payload.get('ref_type')
+        event_payload['ref'] = payload.get('ref')
+    elif event_name == 'repository':
+        event_payload['ref_type'] = 'repository'
+        event_payload['ref'] = None
+
+    return {
+        'id': delivery,
+        'type': event_type,
+        # Webhooks chegam em tempo real: o momento da entrega é o do evento
+        'created_at': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'actor': {'login': (payload.get('sender') or {}).get('login')},
+        'repo': {'name': (payload.get('repository') or {}).get('full_name')},
+        'payload': event_payload
+    }
+
+
+class ActivityTracker:
+    """Contadores de atividade por janela atualizados evento a evento"""
+
+    def __init__(self, windows: Iterable[int] = DEFAULT_WINDOWS):
+        self.windows = sorted(set(windows))
+        self.events: List[Dict] = []
+        self._lock = threading.Lock()
+        self.aggregator = ActivityAggregator(self.windows)
+
+    def _roll_over(self):
+        """Na virada do dia as janelas andam: reagrega só o que ainda cabe nelas"""
+        now = datetime.now()
+        if now.date() == self.aggregator.now.date():
+            return
+        self.aggregator = ActivityAggregator(self.windows, now)
+        max_age = max(self.windows) * 86400
+        self.events = [
+            event for event in self.events
+            if (now - parse_timestamp(event['created_at'])).total_seconds() <= max_age
+        ]
+        self.aggregator.add_all(self.events)
+
+    def seed(self, events: Iterable[Dict]):
+        """Carrega o histórico inicial (ex: get_user_events) antes de receber webhooks"""
+        with self._lock:
+            for event in events:
+                self.events.append(event)
+                self.aggregator.add(event)
+
+    def apply(self, event: Dict):
+        with self._lock:
+            self._roll_over()
+            self.events.append(event)
+            self.aggregator.add(event)
+
+    def result(self) -> Dict[int, Dict]:
+        """Atividade por janela, no formato de analyze_activity_windows"""
+        with self._lock:
+            self._roll_over()
+            return self.aggregator.result()
+
+
+class WebhookReceiver:
+    """Valida e aplica entregas de webhook do usuário monitorado"""
+
+    def __init__(self, username: str, secret: str, tracker: Optional[ActivityTracker] = None,
+                 on_event: Optional[Callable[[Dict], None]] = None):
+        self.username = username
+        self.secret = secret
+        self.tracker = tracker or ActivityTracker()
+        # Chamado após cada evento aplicado (ex: regravar os relatórios)
+        self.on_event = on_event
+        self._deliveries: Dict[str, None] = {}
+        self._lock = threading.Lock()
+        # Entregas simultâneas não gravam os relatórios ao mesmo tempo
+        self._callback_lock = threading.Lock()
+
+    def _seen(self, delivery: Optional[str]) -> bool:
+        """Registra a entrega; True se ela já tinha sido aplicada"""
+        if not delivery:
+            return False
+        with self._lock:
+            if delivery in self._deliveries:
+                return True
+            self._deliveries[delivery] = None
+            if len(self._deliveries) > MAX_DELIVERIES:
+                self._deliveries.pop(next(iter(self._deliveries)))
+        return False
+
+    def handle(self, event_name: str, body: bytes, signature: Optional[str],
+               delivery: Optional[str] = None) -> Tuple[int, str]:
+        """Processa uma entrega e retorna (status HTTP, mensagem)"""
+        if not verify_signature(self.secret, body, signature):
+            return 401, 'invalid signature'
+        if event_name == 'ping':
+            return 200, 'pong'
+
+        try:
+            payload = json.loads(body.decode('utf-8'))
+        except ValueError:
+            return 400, 'invalid JSON'
+        if not isinstance(payload, dict):
+            return 400, 'invalid JSON'
+
+        event = to_event(event_name, payload, delivery)
+        if event is None:
+            action = payload.get('action')
+            return 202, f'ignored event: {event_name}' + (f' ({action})' if action else '')
+
+        # A Events API só lista ações do próprio usuário (ex: estrelas recebidas não contam)
+        actor = (event['actor']['login'] or '').lower()
+        if actor != self.username.lower():
+            return 202, f'ignored actor: {actor}'
+
+        if self._seen(delivery):
+            return 200, 'duplicate delivery'
+
+        self.tracker.apply(event)
+        if self.on_event:
+            with self._callback_lock:
+                self.on_event(event)
+        return 200, f'applied {event["type"]}'
+
+    def make_server(self, host: str = '127.0.0.1', port: int = 8787) -> ThreadingHTTPServer:
+        """Servidor HTTP: POST recebe webhooks, GET /activity retorna os contadores"""
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self, status: int, body: str, content_type: str = 'text/plain'):
+                data = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length)
+                status, message = receiver.handle(
+                    self.headers.get('X-GitHub-Event', ''),
+                    body,
+                    self.headers.get('X-Hub-Signature-256'),
+                    self.headers.get('X-GitHub-Delivery')
+                )
+                self._reply(status, message)
+
+            def do_GET(self):
+                if self.path.rstrip('/') != '/activity':
+                    self._reply(404, 'not found')
+                    return
+                self._reply(200, json.dumps(receiver.tracker.result(), default=str),
+                            'application/json')
+
+            def log_message(self, format, *args):
+                print(f"🪝 {self.address_string()} {format % args}")
+
+        return ThreadingHTTPServer((host, port), Handler)
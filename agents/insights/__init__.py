@@ -1,5 +1,19 @@
 """Agente de Insights (Analytics & Feedback)"""
 
 from .insights_agent import InsightsAgent
+from .baseline import BaselineBuilder, CommunityBaseline
+from .metrics_state import MetricsState
+from .render_cache import RenderCache
+from .timeseries import MetricsStore
+from .vector_metrics import HAS_NUMPY, VectorMetricsEngine
 
-__all__ = ['InsightsAgent']
+__all__ = [
+    'InsightsAgent',
+    'BaselineBuilder',
+    'CommunityBaseline',
+    'MetricsState',
+    'MetricsStore',
+    'RenderCache',
+    'VectorMetricsEngine',
+    'HAS_NUMPY'
+]
@@ -0,0 +1,159 @@
+"""
+Base de comparação com a comunidade
+Usuários públicos amostrados têm suas métricas agregadas em sketches KLL (geral e por
+linguagem), persistidos em JSON: percentis reais sem guardar as amostras brutas
+"""
+
+import os
+import json
+import random
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from ..core import PRIORITY_LOW, ConcurrentFetcher, GitHubClient
+from .quantile_sketch import KLLSketch
+
+
+# Métricas por usuário amostrado (e por repositório, prefixo 'repo_stars:<linguagem>')
+USER_METRICS = ('total_repos', 'total_stars', 'avg_stars', 'language_count')
+
+# Ids de usuário do GitHub usados para sortear pontos de partida da amostragem
+MAX_USER_ID = 150_000_000
+
+
+def user_metrics(repos: Iterable[Dict]) -> Dict:
+    """Métricas de um usuário a partir dos seus repositórios (mesmas de calculate_total_metrics)"""
+    total_repos = 0
+    total_stars = 0
+    languages = {}
+    for repo in repos:
+        if repo.get('private', False):
+            continue
+        stars = repo.get('stargazers_count', 0)
+        total_repos += 1
+        total_stars += stars
+        if repo.get('language'):
+            languages.setdefault(repo['language'], []).append(stars)
+    return {
+        'total_repos': total_repos,
+        'total_stars': total_stars,
+        'avg_stars': round(total_stars / total_repos, 2) if total_repos else 0,
+        'language_count': len(languages),
+        'language_stars': languages
+    }
+
+
+class CommunityBaseline:
+    """Sketches de quantis das métricas da comunidade, persistidos em disco"""
+
+    def __init__(self, path: Optional[str] = None, k: int = 200):
+        self.path = path
+        self.k = k
+        self.sketches: Dict[str, KLLSketch] = {}
+        self.users = 0
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.users = data.get('users', 0)
+                self.sketches = {
+                    name: KLLSketch.from_dict(sketch) for name, sketch in data['sketches'].items()
+                }
+            except (OSError, ValueError, KeyError):
+                self.sketches = {}
+                self.users = 0
+
+    def sketch(self, name: str) -> KLLSketch:
+        if name not in self.sketches:
+            self.sketches[name] = KLLSketch(self.k)
+        return self.sketches[name]
+
+    def add_user(self, metrics: Dict):
+        """Agrega as métricas de um usuário amostrado"""
+        with self._lock:
+            self.users += 1
+            for name in USER_METRICS:
+                self.sketch(name).add(metrics[name])
+            for language, stars in metrics['language_stars'].items():
+                self.sketch(f'repo_stars:{language}').add_all(stars)
+
+    def merge(self, other: 'CommunityBaseline'):
+        """Incorpora outra base (ex: construída em outra máquina ou execução)"""
+        with self._lock:
+            self.users += other.users
+            for name, sketch in other.sketches.items():
+                self.sketch(name).merge(sketch)
+
+    def percentile(self, name: str, value: float, min_samples: int = 30) -> Optional[float]:
+        """Percentual da comunidade abaixo do valor (None se a amostra for pequena demais)"""
+        sketch = self.sketches.get(name)
+        if sketch is None or sketch.n < min_samples:
+            return None
+        return sketch.percentile(value)
+
+    def save(self):
+        """Persiste os sketches (escrita atômica)"""
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f'{self.path}.tmp'
+        with self._lock:
+            data = {
+                'users': self.users,
+                'sketches': {name: sketch.to_dict() for name, sketch in self.sketches.items()}
+            }
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+
+class BaselineBuilder:
+    """Amostra usuários públicos e agrega seus repositórios na base da comunidade"""
+
+    def __init__(self, client: GitHubClient, baseline: CommunityBaseline,
+                 max_user_id: int = MAX_USER_ID, seed: Optional[int] = None):
+        self.client = client
+        self.baseline = baseline
+        self.max_user_id = max_user_id
+        self._random = random.Random(seed)
+
+    def sample_logins(self, count: int) -> List[str]:
+        """Logins de usuários (não organizações) a partir de ids sorteados"""
+        logins = []
+        while len(logins) < count:
+            since = self._random.randint(1, self.max_user_id)
+            response = self.client.get('/users', params={'since': since, 'per_page': 100}, priority=PRIORITY_LOW)
+            response.raise_for_status()
+            users = [user for user in response.json() if user.get('type', 'User') == 'User']
+            if not users:
+                break
+            # Alguns usuários de cada ponto de partida espalham a amostra pelo espaço de ids
+            logins.extend(user['login'] for user in users[:max(1, min(10, count - len(logins)))])
+        return logins[:count]
+
+    def build(self, users: int = 100) -> int:
+        """
+        Amostra `users` usuários e agrega os que têm repositórios públicos
+        Lê uma página (até 100 repos) por usuário. Retorna quantos entraram na base.
+        """
+        logins = self.sample_logins(users)
+        urls = [
+            self.client.build_url(f'/users/{login}/repos') + '?per_page=100&type=owner'
+            for login in logins
+        ]
+        added = []
+
+        def on_result(url: str, repos):
+            metrics = user_metrics(repos)
+            # A comparação é com quem publica projetos: contas sem repositórios ficam de fora
+            if metrics['total_repos']:
+                self.baseline.add_user(metrics)
+                added.append(url)
+
+        errors = ConcurrentFetcher(self.client, priority=PRIORITY_LOW).fetch_json(urls, on_result)
+        if errors:
+            print(f"⚠️  {len(errors)} usuários da amostra não puderam ser lidos")
+
+        self.baseline.save()
+        return len(added)
@@ -4,45 +4,96 @@ Responsável por monitorar desempenho e gerar relatórios analíticos
 """
 
 import os
-import requests
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
 from collections import defaultdict, Counter
 
+from ..core import GitHubAgent, GitHubClient, RunContext
+from .baseline import CommunityBaseline
+from .metrics_state import MetricsState
+from .render_cache import RenderCache, write_if_changed
+from .timeseries import MetricsStore, profile_series, repo_series
+from .vector_metrics import HAS_NUMPY, VectorMetricsEngine
 
-class InsightsAgent:
+
+class InsightsAgent(GitHubAgent):
     """Agente responsável por analytics e insights do perfil"""
 
-    def __init__(self, username: str, github_token: Optional[str] = None):
-        self.username = username
-        self.github_token = github_token or os.getenv('GITHUB_TOKEN')
-        self.api_base = 'https://api.github.com'
-        self.headers = {
-            'Accept': 'application/vnd.github.v3+json',
-        }
-        if self.github_token:
-            self.headers['Authorization'] = f'token {self.github_token}'
+    def __init__(self, username: str, github_token: Optional[str] = None,
+                 client: Optional[GitHubClient] = None,
+                 context: Optional[RunContext] = None,
+                 metrics_store: Optional[MetricsStore] = None,
+                 metrics_state: Optional[MetricsState] = None,
+                 engine: str = 'python',
+                 baseline: Optional[CommunityBaseline] = None,
+                 render_cache: Optional[RenderCache] = None,
+                 org: Optional[str] = None):
+        super().__init__(username, github_token, client, context)
+        # Organização analisada (/orgs/{org}/repos) em vez dos repos do usuário
+        self.org = org
+        # Histórico diário de métricas (None = sem crescimento semanal nos relatórios)
+        self.metrics_store = metrics_store
+        # Métricas totais mantidas entre execuções (None = recalcula tudo a cada chamada)
+        self.metrics_state = metrics_state
+        # 'numpy' = métricas vetorizadas (dependência opcional); 'python' = laços sobre os dicts
+        if engine == 'numpy' and not HAS_NUMPY:
+            print("⚠️  NumPy não instalado: usando o motor de métricas em Python")
+            engine = 'python'
+        self.engine = engine
+        # Sketches de quantis da comunidade (None = compara com limites fixos)
+        self.baseline = baseline
+        # Seções já renderizadas do dashboard (None = renderiza e grava sempre)
+        self.render_cache = render_cache
+        self._vector = None
+        self._vector_source = None
 
     def get_user_data(self) -> Dict:
         """Obtém dados do usuário"""
+        if self.context:
+            return self.context.user
         url = f'{self.api_base}/users/{self.username}'
-        response = requests.get(url, headers=self.headers)
+        response = self.client.get(url)
         response.raise_for_status()
         return response.json()
 
-    def get_all_repos(self) -> List[Dict]:
-        """Obtém todos os repositórios"""
+    def iter_repos(self) -> Iterator[Dict]:
+        """Itera sobre todos os repositórios (todas as páginas)"""
+        if self.org:
+            return self.client.paginate(f'/orgs/{self.org}/repos', params={'per_page': 100})
+        if self.context:
+            return iter(self.context.repos)
+        if self.client.graphql:
+            return self.client.graphql.iter_repos(self.username)
         url = f'{self.api_base}/users/{self.username}/repos'
         params = {'per_page': 100}
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        return self.client.paginate(url, params=params)
 
-    def calculate_total_metrics(self) -> Dict:
-        """Calcula métricas totais do perfil"""
-        repos = self.get_all_repos()
+    def get_all_repos(self) -> List[Dict]:
+        """Obtém todos os repositórios"""
+        return list(self.iter_repos())
 
-        metrics = {
+    def vector_engine(self, repos: Optional[List[Dict]] = None) -> Optional[VectorMetricsEngine]:
+        """
+        Motor vetorizado da listagem atual (reaproveitado enquanto a listagem não mudar)
+        Sem snapshot, repos evita baixar de novo uma listagem que o chamador já tem
+        """
+        if self.engine != 'numpy':
+            return None
+        if self.context:
+            repos = self.context.repos
+        elif repos is None:
+            return VectorMetricsEngine.from_repos(self.iter_repos())
+        if self._vector is None or self._vector_source is not repos:
+            self._vector = VectorMetricsEngine.from_repos(repos)
+            self._vector_source = repos
+        return self._vector
+
+    @staticmethod
+    def new_total_metrics() -> Dict:
+        """Métricas totais vazias (formato de calculate_total_metrics)"""
+        return {
             'total_repos': 0,
             'total_stars': 0,
             'total_forks': 0,
@@ -60,82 +111,160 @@ class InsightsAgent:
             'total_size': 0  # em KB
         }
 
-        for repo in repos:
-            if repo.get('private', False):
-                continue
-
-            metrics['total_repos'] += 1
-            stars = repo.get('stargazers_count', 0)
-            forks = repo.get('forks_count', 0)
-
-            metrics['total_stars'] += stars
-            metrics['total_forks'] += forks
-            metrics['total_watchers'] += repo.get('watchers_count', 0)
-            metrics['total_open_issues'] += repo.get('open_issues_count', 0)
-            metrics['total_size'] += repo.get('size', 0)
-
-            # Linguagens
-            if repo.get('language'):
-                metrics['languages'][repo['language']] += 1
-
-            # Topics
-            for topic in repo.get('topics', []):
-                metrics['topics'][topic] += 1
-
-            # Repos com engajamento
-            if stars > 0:
-                metrics['repos_with_stars'] += 1
-            if forks > 0:
-                metrics['repos_with_forks'] += 1
-
-            # Repo mais estrelado
-            if metrics['most_starred_repo'] is None or stars > metrics['most_starred_repo']['stars']:
-                metrics['most_starred_repo'] = {
-                    'name': repo['name'],
-                    'stars': stars,
-                    'url': repo['html_url']
-                }
-
-            # Repo mais forkado
-            if metrics['most_forked_repo'] is None or forks > metrics['most_forked_repo']['forks']:
-                metrics['most_forked_repo'] = {
-                    'name': repo['name'],
-                    'forks': forks,
-                    'url': repo['html_url']
-                }
-
-            # Repo mais novo
-            created_at = datetime.strptime(repo['created_at'], '%Y-%m-%dT%H:%M:%SZ')
-            if metrics['newest_repo'] is None or created_at > metrics['newest_repo']['date']:
-                metrics['newest_repo'] = {
-                    'name': repo['name'],
-                    'date': created_at,
-                    'url': repo['html_url']
-                }
-
-            # Repo mais antigo
-            if metrics['oldest_repo'] is None or created_at < metrics['oldest_repo']['date']:
-                metrics['oldest_repo'] = {
-                    'name': repo['name'],
-                    'date': created_at,
-                    'url': repo['html_url']
-                }
-
-        # Médias
+    @staticmethod
+    def add_repo_metrics(metrics: Dict, repo: Dict):
+        """Contabiliza um repositório público nas métricas totais"""
+        metrics['total_repos'] += 1
+        stars = repo.get('stargazers_count', 0)
+        forks = repo.get('forks_count', 0)
+
+        metrics['total_stars'] += stars
+        metrics['total_forks'] += forks
+        metrics['total_watchers'] += repo.get('watchers_count', 0)
+        metrics['total_open_issues'] += repo.get('open_issues_count', 0)
+        metrics['total_size'] += repo.get('size', 0)
+
+        # Linguagens
+        if repo.get('language'):
+            metrics['languages'][repo['language']] += 1
+
+        # Topics
+        for topic in repo.get('topics', []):
+            metrics['topics'][topic] += 1
+
+        # Repos com engajamento
+        if stars > 0:
+            metrics['repos_with_stars'] += 1
+        if forks > 0:
+            metrics['repos_with_forks'] += 1
+
+        # Repo mais estrelado
+        if metrics['most_starred_repo'] is None or stars > metrics['most_starred_repo']['stars']:
+            metrics['most_starred_repo'] = {
+                'name': repo['name'],
+                'stars': stars,
+                'url': repo['html_url']
+            }
+
+        # Repo mais forkado
+        if metrics['most_forked_repo'] is None or forks > metrics['most_forked_repo']['forks']:
+            metrics['most_forked_repo'] = {
+                'name': repo['name'],
+                'forks': forks,
+                'url': repo['html_url']
+            }
+
+        # Repo mais novo
+        created_at = datetime.strptime(repo['created_at'], '%Y-%m-%dT%H:%M:%SZ')
+        if metrics['newest_repo'] is None or created_at > metrics['newest_repo']['date']:
+            metrics['newest_repo'] = {
+                'name': repo['name'],
+                'date': created_at,
+                'url': repo['html_url']
+            }
+
+        # Repo mais antigo
+        if metrics['oldest_repo'] is None or created_at < metrics['oldest_repo']['date']:
+            metrics['oldest_repo'] = {
+                'name': repo['name'],
+                'date': created_at,
+                'url': repo['html_url']
+            }
+
+    @staticmethod
+    def finish_total_metrics(metrics: Dict) -> Dict:
+        """Calcula as médias depois do último repositório"""
         if metrics['total_repos'] > 0:
             metrics['avg_stars_per_repo'] = round(metrics['total_stars'] / metrics['total_repos'], 2)
-
         return metrics
 
-    def track_repo_growth(self, repo_name: str, days: int = 30) -> Dict:
+    def calculate_total_metrics(self, repos: Optional[List[Dict]] = None) -> Dict:
+        """Calcula métricas totais do perfil (repos = listagem já carregada pelo chamador)"""
+        if self.metrics_state:
+            return self.update_total_metrics(repos)
+
+        if self.engine == 'numpy':
+            # Motor e histórico leem a mesma listagem: sem snapshot, baixa uma vez só
+            if repos is None:
+                repos = self.get_all_repos()
+            engine = self.vector_engine(repos)
+            if self.metrics_store:
+                self.metrics_store.record_repos(r for r in repos if not r.get('private', False))
+            return engine.total_metrics()
+
+        metrics = self.new_total_metrics()
+        # Snapshot do dia com os dados já carregados (sem chamadas extras)
+        public_repos = [] if self.metrics_store else None
+
+        for repo in self.iter_repos() if repos is None else repos:
+            if repo.get('private', False):
+                continue
+            self.add_repo_metrics(metrics, repo)
+            if public_repos is not None:
+                public_repos.append(repo)
+
+        if self.metrics_store:
+            self.metrics_store.record_repos(public_repos)
+
+        return self.finish_total_metrics(metrics)
+
+    def update_total_metrics(self, repos: Optional[List[Dict]] = None) -> Dict:
+        """Métricas totais incrementais: reprocessa só os repos novos, alterados ou removidos"""
+        changed = self.metrics_state.update(self.username, self.iter_repos() if repos is None else repos)
+        self.metrics_state.save()
+
+        # Repos sem mudança mantêm o último snapshot (as leituras usam o valor mais recente)
+        if self.metrics_store and changed:
+            self.metrics_store.record_repos(changed)
+
+        return self.metrics_state.metrics()
+
+    def record_profile_snapshot(self, metrics: Dict, user_data: Dict):
+        """Grava o snapshot do dia do perfil (totais dos repos + seguidores)"""
+        if not self.metrics_store:
+            return
+        self.metrics_store.record({
+            profile_series(self.username): {
+                'stars': metrics['total_stars'],
+                'forks': metrics['total_forks'],
+                'watchers': metrics['total_watchers'],
+                'open_issues': metrics['total_open_issues'],
+                'size': metrics['total_size'],
+                'followers': user_data.get('followers', 0)
+            }
+        })
+
+    @staticmethod
+    def format_delta(delta: Optional[Dict], metric: str) -> str:
+        """Sufixo com a variação semanal (ex: ' (+3 na semana)'); vazio sem histórico"""
+        if not delta:
+            return ''
+        return f" ({delta[metric]:+d} na semana)"
+
+    def get_repo(self, repo_name: str) -> Dict:
+        """Dados de um repositório: do snapshot da execução, se houver, senão da API"""
+        if self.context:
+            repo = self.context.find_repo(repo_name)
+            if repo:
+                return repo
+        if self.client.graphql:
+            return self.client.graphql.get_repo(self.username, repo_name)
+        url = f'{self.api_base}/repos/{self.username}/{repo_name}'
+        response = self.client.get(url)
+        response.raise_for_status()
+        return response.json()
+
+    def track_repo_growth(self, repo_name: str, days: int = 30,
+                          repo: Optional[Dict] = None, record: bool = True) -> Dict:
         """
         Rastreia crescimento de um repositório específico
-        Nota: GitHub API não fornece histórico direto. Esta implementação é limitada.
+        A API não fornece histórico: com metrics_store, a taxa é a variação entre o valor
+        em vigor no início do período (ou o primeiro snapshot) e o atual, dividida pelos dias
+        até hoje; sem snapshot anterior a hoje, usa estrelas atuais / idade do repositório.
+        `repo` reaproveita dados da listagem; record=False quando o snapshot já foi gravado.
         """
-        url = f'{self.api_base}/repos/{self.username}/{repo_name}'
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        repo = response.json()
+        if repo is None:
+            repo = self.get_repo(repo_name)
 
         # Dados atuais
         growth = {
@@ -156,12 +285,29 @@ class InsightsAgent:
 
         growth['age_days'] = age_days
         growth['stars_per_day'] = round(growth['current_stars'] / max(age_days, 1), 2)
+        growth['growth_source'] = 'age'
+        growth['weekly'] = None
+
+        if self.metrics_store:
+            series = repo_series(repo.get('full_name') or f'{self.username}/{repo_name}')
+            if record:
+                self.metrics_store.record_repos([repo])
+            today = date.today()
+            history = self.metrics_store.range(series, since=today - timedelta(days=days), until=today)
+            # Dias sem snapshot mantêm o último valor: o período vai até hoje, não até a última mudança
+            span = (today - date.fromisoformat(history[0]['day'])).days if history else 0
+            if span > 0:
+                growth['stars_per_day'] = round((growth['current_stars'] - history[0]['stars']) / span, 2)
+                growth['growth_source'] = 'history'
+            growth['weekly'] = self.metrics_store.delta(series, days=7)
 
         return growth
 
-    def compare_with_community(self, language: Optional[str] = None) -> Dict:
-        """Compara métricas com a comunidade"""
-        metrics = self.calculate_total_metrics()
+    def compare_with_community(self, language: Optional[str] = None,
+                               metrics: Optional[Dict] = None) -> Dict:
+        """Compara métricas com a comunidade (`metrics` reaproveita totais já calculados)"""
+        if metrics is None:
+            metrics = self.calculate_total_metrics()
 
         comparison = {
             'your_total_stars': metrics['total_stars'],
@@ -171,6 +317,10 @@ class InsightsAgent:
             'insights': []
         }
 
+        if self.baseline and self.baseline.users:
+            self._compare_with_baseline(metrics, comparison, language)
+            return comparison
+
         # Insights baseados em benchmarks gerais
         if metrics['avg_stars_per_repo'] >= 10:
             comparison['insights'].append("🌟 Excelente! Seus repos têm média de estrelas acima da comunidade")
@@ -197,80 +347,168 @@ class InsightsAgent:
 
         return comparison
 
-    def generate_weekly_report(self) -> str:
-        """Gera relatório semanal"""
-        metrics = self.calculate_total_metrics()
-        user_data = self.get_user_data()
+    def _compare_with_baseline(self, metrics: Dict, comparison: Dict, language: Optional[str]):
+        """Insights com percentis reais da comunidade amostrada"""
+        percentiles = {
+            'avg_stars': self.baseline.percentile('avg_stars', metrics['avg_stars_per_repo']),
+            'total_repos': self.baseline.percentile('total_repos', metrics['total_repos']),
+            'language_count': self.baseline.percentile('language_count', len(metrics['languages']))
+        }
 
-        report = [
-            "# 📊 Relatório Semanal de Insights",
-            "",
-            f"**Período**: {datetime.now().strftime('%d/%m/%Y')}",
-            f"**Perfil**: @{self.username}",
-            "",
+        # Estrelas dos seus repos na linguagem principal (ou informada) vs repos da comunidade
+        language = language or (comparison['top_language'][0] if metrics['languages'] else None)
+        if language:
+            stars = [
+                repo.get('stargazers_count', 0) for repo in self.iter_repos()
+                if repo.get('language') == language and not repo.get('private', False)
+            ]
+            if stars:
+                percentiles['language_stars'] = self.baseline.percentile(
+                    f'repo_stars:{language}', sum(stars) / len(stars)
+                )
+        comparison['percentiles'] = percentiles
+        comparison['baseline_users'] = self.baseline.users
+
+        messages = {
+            'avg_stars': ("🌟 Média de estrelas por repo acima de {p:.0f}% da comunidade",
+                          "⭐ Média de estrelas por repo acima de {p:.0f}% da comunidade",
+                          "💡 Média de estrelas acima de só {p:.0f}% da comunidade: foque em qualidade e divulgação"),
+            'total_repos': ("📚 Mais projetos publicados que {p:.0f}% da comunidade",
+                            "📂 Mais projetos publicados que {p:.0f}% da comunidade",
+                            "🚀 Mais projetos que {p:.0f}% da comunidade: continue publicando"),
+            'language_count': ("🎨 Mais linguagens que {p:.0f}% da comunidade",
+                               "💻 Mais linguagens que {p:.0f}% da comunidade",
+                               "🔧 Mais linguagens que {p:.0f}% da comunidade: considere explorar outras"),
+            'language_stars': (f"🏆 Em {language}, seus repos têm mais estrelas que {{p:.0f}}% dos repos da comunidade",
+                               f"💻 Em {language}, seus repos têm mais estrelas que {{p:.0f}}% dos repos da comunidade",
+                               f"💡 Em {language}, seus repos têm mais estrelas que só {{p:.0f}}% dos repos da comunidade")
+        }
+        for name, value in percentiles.items():
+            if value is None:
+                continue
+            high, middle, low = messages[name]
+            template = high if value >= 75 else middle if value >= 50 else low
+            comparison['insights'].append(template.format(p=value))
+
+    def render_section(self, name: str, data, render) -> str:
+        """Renderiza uma seção, reaproveitando o cache se os dados não mudaram"""
+        if self.render_cache:
+            return self.render_cache.render(name, data, render)
+        return render(data)
+
+    @staticmethod
+    def _render_overview(data: Dict) -> str:
+        weekly = data['weekly']
+        return "\n".join([
             "## 📈 Métricas Gerais",
             "",
-            f"- 📦 **Repositórios públicos**: {metrics['total_repos']}",
-            f"- ⭐ **Total de estrelas**: {metrics['total_stars']}",
-            f"- 🍴 **Total de forks**: {metrics['total_forks']}",
-            f"- 👀 **Total de watchers**: {metrics['total_watchers']}",
-            f"- 📊 **Média de estrelas por repo**: {metrics['avg_stars_per_repo']}",
-            f"- 👥 **Seguidores**: {user_data.get('followers', 0)}",
-            f"- 💾 **Tamanho total dos repos**: {round(metrics['total_size'] / 1024, 2)} MB",
+            f"- 📦 **Repositórios públicos**: {data['total_repos']}",
+            f"- ⭐ **Total de estrelas**: {data['total_stars']}{InsightsAgent.format_delta(weekly, 'stars')}",
+            f"- 🍴 **Total de forks**: {data['total_forks']}{InsightsAgent.format_delta(weekly, 'forks')}",
+            f"- 👀 **Total de watchers**: {data['total_watchers']}{InsightsAgent.format_delta(weekly, 'watchers')}",
+            f"- 📊 **Média de estrelas por repo**: {data['avg_stars_per_repo']}",
+            f"- 👥 **Seguidores**: {data['followers']}{InsightsAgent.format_delta(weekly, 'followers')}",
+            f"- 💾 **Tamanho total dos repos**: {round(data['total_size'] / 1024, 2)} MB",
             ""
-        ]
+        ])
+
+    @staticmethod
+    def _render_highlight(repo: Dict) -> str:
+        return "\n".join([
+            "## 🌟 Projeto Mais Popular",
+            "",
+            f"[{repo['name']}]({repo['url']}) - ⭐ {repo['stars']} estrelas",
+            ""
+        ])
+
+    @staticmethod
+    def _render_languages(data: Dict) -> str:
+        lines = ["## 💻 Top Linguagens", ""]
+        for lang, count in data['top']:
+            percentage = round((count / data['total_repos']) * 100, 1)
+            lines.append(f"- **{lang}**: {count} repos ({percentage}%)")
+        lines.append("")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _render_topics(top: List) -> str:
+        lines = ["## 🏷️ Topics Mais Usados", ""]
+        for topic, count in top:
+            lines.append(f"- `{topic}` ({count})")
+        lines.append("")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _render_community(insights: List[str]) -> str:
+        lines = ["## 🎯 Insights e Recomendações", ""]
+        for insight in insights:
+            lines.append(f"- {insight}")
+        return "\n".join(lines)
+
+    def weekly_report_sections(self, metrics: Optional[Dict] = None) -> List[str]:
+        """Seções do relatório semanal (sem datas), cada uma memoizada pelos seus dados"""
+        if metrics is None:
+            metrics = self.calculate_total_metrics()
+        user_data = self.get_user_data()
+        self.record_profile_snapshot(metrics, user_data)
+        weekly = self.metrics_store.delta(profile_series(self.username)) if self.metrics_store else None
+
+        overview = {
+            key: metrics[key] for key in (
+                'total_repos', 'total_stars', 'total_forks', 'total_watchers',
+                'avg_stars_per_repo', 'total_size'
+            )
+        }
+        overview['followers'] = user_data.get('followers', 0)
+        # A data de referência da variação não aparece no texto: fica fora do hash
+        overview['weekly'] = {key: value for key, value in weekly.items() if key != 'since'} if weekly else None
+        sections = [self.render_section('overview', overview, self._render_overview)]
 
         # Destaques
         if metrics['most_starred_repo']:
-            report.extend([
-                "## 🌟 Projeto Mais Popular",
-                "",
-                f"[{metrics['most_starred_repo']['name']}]({metrics['most_starred_repo']['url']}) - ⭐ {metrics['most_starred_repo']['stars']} estrelas",
-                ""
-            ])
+            sections.append(self.render_section('highlight', metrics['most_starred_repo'], self._render_highlight))
 
         # Top linguagens
         if metrics['languages']:
-            report.extend([
-                "## 💻 Top Linguagens",
-                ""
-            ])
-            for lang, count in metrics['languages'].most_common(5):
-                percentage = round((count / metrics['total_repos']) * 100, 1)
-                report.append(f"- **{lang}**: {count} repos ({percentage}%)")
-            report.append("")
+            sections.append(self.render_section('languages', {
+                'top': metrics['languages'].most_common(5),
+                'total_repos': metrics['total_repos']
+            }, self._render_languages))
 
         # Topics mais usados
         if metrics['topics']:
-            report.extend([
-                "## 🏷️ Topics Mais Usados",
-                ""
-            ])
-            for topic, count in metrics['topics'].most_common(5):
-                report.append(f"- `{topic}` ({count})")
-            report.append("")
+            sections.append(self.render_section('topics', metrics['topics'].most_common(5), self._render_topics))
 
         # Comparação com comunidade
-        comparison = self.compare_with_community()
-        report.extend([
-            "## 🎯 Insights e Recomendações",
-            ""
-        ])
-        for insight in comparison['insights']:
-            report.append(f"- {insight}")
+        comparison = self.compare_with_community(metrics=metrics)
+        sections.append(self.render_section('community', comparison['insights'], self._render_community))
+        return sections
 
-        report.extend([
+    def generate_weekly_report(self, sections: Optional[List[str]] = None,
+                               generated_at: Optional[datetime] = None) -> str:
+        """Gera relatório semanal"""
+        sections = sections if sections is not None else self.weekly_report_sections()
+        generated_at = generated_at or datetime.now()
+
+        report = [
+            "# 📊 Relatório Semanal de Insights",
+            "",
+            f"**Período**: {generated_at.strftime('%d/%m/%Y')}",
+            f"**Perfil**: @{self.username}",
+            "",
+            *sections,
             "",
             "---",
             "",
-            f"🤖 Gerado automaticamente em {datetime.now().strftime('%d/%m/%Y às %H:%M')}"
-        ])
+            f"🤖 Gerado automaticamente em {generated_at.strftime('%d/%m/%Y às %H:%M')}"
+        ]
 
         return "\n".join(report)
 
-    def generate_repo_spotlight(self, repo_name: str) -> str:
+    def generate_repo_spotlight(self, repo_name: str, growth: Optional[Dict] = None) -> str:
         """Gera spotlight detalhado de um repositório"""
-        growth = self.track_repo_growth(repo_name)
+        if growth is None:
+            growth = self.track_repo_growth(repo_name)
 
         spotlight = [
             f"# 🔦 Spotlight: {repo_name}",
@@ -284,11 +522,28 @@ class InsightsAgent:
             f"- 📅 **Idade**: {growth['age_days']} dias",
             f"- 📈 **Taxa de crescimento**: {growth['stars_per_day']} estrelas/dia",
             f"- 💻 **Linguagem principal**: {growth['language']}",
-            "",
-            "## 💡 Análise",
             ""
         ]
 
+        weekly = growth['weekly']
+        if weekly:
+            spotlight.extend([
+                f"## 📆 Últimos {weekly['days']} Dias (desde {weekly['since']})",
+                "",
+                f"- ⭐ **Estrelas**: {weekly['stars']:+d}",
+                f"- 🍴 **Forks**: {weekly['forks']:+d}",
+                f"- 👀 **Watchers**: {weekly['watchers']:+d}",
+                f"- 🐛 **Issues abertas**: {weekly['open_issues']:+d}",
+                ""
+            ])
+        elif self.metrics_store:
+            spotlight.extend(["_Histórico semanal em construção: variações a partir dos próximos snapshots._", ""])
+
+        spotlight.extend([
+            "## 💡 Análise",
+            ""
+        ])
+
         # Análises
         if growth['stars_per_day'] >= 1:
             spotlight.append("🚀 Crescimento excepcional! Projeto com alta tração.")
@@ -309,9 +564,40 @@ class InsightsAgent:
 
         return "\n".join(spotlight)
 
-    def suggest_focus_areas(self) -> List[str]:
-        """Sugere áreas de foco baseadas em análise"""
-        metrics = self.calculate_total_metrics()
+    def generate_spotlights(self, output_dir: str = 'spotlights', top_n: Optional[int] = None,
+                            max_workers: int = 8) -> List[str]:
+        """
+        Spotlights de todos os repositórios públicos (ou dos top_n por estrelas)
+        Os dados vêm da listagem já baixada, sem requisições por repositório; os
+        snapshots são gravados numa única transação e a renderização roda em paralelo.
+        Retorna os arquivos gerados.
+        """
+        repos = [repo for repo in self.iter_repos() if not repo.get('private', False)]
+        if top_n is not None:
+            repos = sorted(repos, key=lambda r: r.get('stargazers_count', 0), reverse=True)[:top_n]
+        if not repos:
+            return []
+
+        if self.metrics_store:
+            self.metrics_store.record_repos(repos)
+        os.makedirs(output_dir, exist_ok=True)
+
+        def render(repo: Dict) -> str:
+            growth = self.track_repo_growth(repo['name'], repo=repo, record=False)
+            path = os.path.join(output_dir, f"{repo['name']}.md")
+            write_if_changed(path, self.generate_repo_spotlight(repo['name'], growth))
+            return path
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Cada tarefa leva uma cópia do contexto (métricas atribuídas ao agente atual)
+            futures = [executor.submit(contextvars.copy_context().run, render, repo) for repo in repos]
+            return [future.result() for future in futures]
+
+    def suggest_focus_areas(self, metrics: Optional[Dict] = None,
+                            repos: Optional[List[Dict]] = None) -> List[str]:
+        """Sugere áreas de foco baseadas em análise (repos = listagem já carregada)"""
+        if metrics is None:
+            metrics = self.calculate_total_metrics(repos)
         suggestions = []
 
         # Análise de engajamento
@@ -325,8 +611,14 @@ class InsightsAgent:
                 )
 
         # Análise de documentação
-        repos = self.get_all_repos()
-        repos_without_description = sum(1 for r in repos if not r.get('description') and not r.get('private'))
+        engine = self.vector_engine(repos)
+        if engine:
+            repos_without_description = engine.repos_without_description()
+        else:
+            repos_without_description = sum(
+                1 for r in (self.iter_repos() if repos is None else repos)
+                if not r.get('description') and not r.get('private')
+            )
 
         if repos_without_description > 0:
             suggestions.append(
@@ -361,54 +653,109 @@ class InsightsAgent:
 
         return suggestions
 
-    def create_insights_dashboard(self, output_file: str = 'INSIGHTS_DASHBOARD.md'):
-        """Cria dashboard completo de insights"""
-        metrics = self.calculate_total_metrics()
-
-        dashboard = [
-            "# 📊 Dashboard de Insights",
-            "",
-            f"Última atualização: {datetime.now().strftime('%d/%m/%Y às %H:%M')}",
-            "",
-            "## 🎯 Visão Geral",
-            "",
-            self.generate_weekly_report(),
+    @staticmethod
+    def _render_focus_areas(suggestions: List[str]) -> str:
+        lines = ["## 💡 Áreas de Foco Sugeridas", ""]
+        for suggestion in suggestions:
+            lines.append(f"### {suggestion}")
+            lines.append("")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _render_distribution(data: Dict) -> str:
+        percentiles = data['percentiles']
+        rates = data['rates']
+        return "\n".join([
+            "## 📐 Distribuição dos Repositórios",
             "",
-            "## 💡 Áreas de Foco Sugeridas",
+            f"- ⭐ **Estrelas por repo**: mediana {percentiles[0]:g} · p90 {percentiles[1]:g} · p99 {percentiles[2]:g}",
+            f"- 🤝 **Engajamento**: {rates['with_stars']}% com estrelas · {rates['with_forks']}% com forks · {rates['forks_per_star']} forks/estrela",
+            "- 💤 **Dias sem atualização**: " + " · ".join(
+                f"{label}: {count}" for label, count in data['inactivity']
+            ),
             ""
-        ]
-
-        suggestions = self.suggest_focus_areas()
-        for suggestion in suggestions:
-            dashboard.append(f"### {suggestion}")
-            dashboard.append("")
+        ])
 
-        # Tabela de todos os repos com métricas
-        dashboard.extend([
+    @staticmethod
+    def _render_repo_table(rows: List) -> str:
+        lines = [
             "## 📋 Tabela de Repositórios",
             "",
             "| Repositório | ⭐ Stars | 🍴 Forks | Linguagem | Atualizado |",
             "|------------|---------|---------|-----------|------------|"
-        ])
+        ]
+        for name, url, stars, forks, lang, updated in rows:
+            lines.append(f"| [{name}]({url}) | {stars} | {forks} | {lang} | {updated} |")
+        return "\n".join(lines)
 
+    def create_insights_dashboard(self, output_file: str = 'INSIGHTS_DASHBOARD.md') -> bool:
+        """
+        Cria dashboard completo de insights
+        Com render_cache, as datas só mudam quando o conteúdo muda e o arquivo não é
+        regravado se ficar idêntico. Retorna True se o arquivo foi gravado.
+        """
+        # Listagem e totais carregados uma vez e compartilhados por todas as seções
         repos = self.get_all_repos()
+        metrics = self.calculate_total_metrics(repos)
+        sections = [self.render_section('focus_areas', self.suggest_focus_areas(metrics, repos),
+                                        self._render_focus_areas)]
+
+        # Distribuição (percentis, engajamento e inatividade): só com insights.engine = "numpy";
+        # o motor em Python mantém o dashboard sem essa seção
+        engine = self.vector_engine(repos)
+        if engine and len(engine.columns):
+            sections.append(self.render_section('distribution', {
+                'percentiles': list(engine.percentiles('stars', (50, 90, 99)).values()),
+                'rates': engine.engagement_rates(),
+                'inactivity': list(engine.inactivity_buckets().items())
+            }, self._render_distribution))
+
+        # Tabela de todos os repos com métricas
+        rows = []
         for repo in sorted(repos, key=lambda x: x.get('stargazers_count', 0), reverse=True)[:20]:
             if repo.get('private'):
                 continue
+            rows.append((
+                repo['name'],
+                repo['html_url'],
+                repo.get('stargazers_count', 0),
+                repo.get('forks_count', 0),
+                repo.get('language', 'N/A'),
+                datetime.strptime(repo['updated_at'], '%Y-%m-%dT%H:%M:%SZ').strftime('%d/%m/%Y')
+            ))
+        sections.append(self.render_section('repo_table', rows, self._render_repo_table))
+
+        weekly_sections = self.weekly_report_sections(metrics)
+
+        # Data exibida = última mudança de conteúdo (execuções sem mudança geram o mesmo arquivo)
+        if self.render_cache:
+            content = "\n".join([self.username] + weekly_sections + sections)
+            updated_at = self.render_cache.stamp(output_file, content)
+        else:
+            updated_at = datetime.now()
 
-            name = repo['name']
-            stars = repo.get('stargazers_count', 0)
-            forks = repo.get('forks_count', 0)
-            lang = repo.get('language', 'N/A')
-            updated = datetime.strptime(repo['updated_at'], '%Y-%m-%dT%H:%M:%SZ').strftime('%d/%m/%Y')
-
-            dashboard.append(f"| [{name}]({repo['html_url']}) | {stars} | {forks} | {lang} | {updated} |")
+        dashboard = [
+            "# 📊 Dashboard de Insights",
+            "",
+            f"Última atualização: {updated_at.strftime('%d/%m/%Y às %H:%M')}",
+            "",
+            "## 🎯 Visão Geral",
+            "",
+            self.generate_weekly_report(weekly_sections, updated_at),
+            "",
+            *sections
+        ]
 
         # Salva dashboard
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("\n".join(dashboard))
+        written = write_if_changed(output_file, "\n".join(dashboard))
+        if self.render_cache:
+            self.render_cache.save()
 
-        print(f"✅ Dashboard de insights salvo em {output_file}")
+        if written:
+            print(f"✅ Dashboard de insights salvo em {output_file}")
+        else:
+            print(f"✅ Dashboard de insights sem mudanças ({output_file} mantido)")
+        return written
 
 
 def main():
@@ -0,0 +1,229 @@
+"""
+Estado persistido das métricas totais do perfil
+Só os repositórios cujo updated_at/pushed_at (ou contadores) mudaram são reprocessados:
+totais e contadores recebem deltas, e adições/remoções entram como +/- um registro
+"""
+
+import os
+import json
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+
+# Campos de um registro compacto (lista, para caber bem em JSON)
+VERSION, STARS, FORKS, WATCHERS, OPEN_ISSUES, SIZE, LANGUAGE, TOPICS, NAME, URL, CREATED_AT = range(11)
+
+TOTALS = ('total_repos', 'total_stars', 'total_forks', 'total_watchers',
+          'total_open_issues', 'total_size', 'repos_with_stars', 'repos_with_forks')
+
+
+def repo_version(repo: Dict) -> List:
+    """Identifica uma versão do repositório: se não mudou, sua contribuição também não"""
+    return [
+        repo.get('updated_at'),
+        repo.get('pushed_at'),
+        repo.get('stargazers_count', 0),
+        repo.get('forks_count', 0),
+        repo.get('open_issues_count', 0)
+    ]
+
+
+class MetricsState:
+    """Métricas de calculate_total_metrics mantidas incrementalmente entre execuções"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.owner: Optional[str] = None
+        # full_name -> registro compacto, na ordem da última listagem
+        self.repos: Dict[str, list] = {}
+        self.totals = dict.fromkeys(TOTALS, 0)
+        self.languages: Dict[str, int] = {}
+        self.topics: Dict[str, int] = {}
+        self._result: Optional[Dict] = None
+        self.dirty = False
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.owner = data['owner']
+                self.repos = data['repos']
+                self.totals = data['totals']
+                self.languages = data['languages']
+                self.topics = data['topics']
+            except (OSError, ValueError, KeyError):
+                self.reset()
+
+    def reset(self, owner: Optional[str] = None):
+        self.owner = owner
+        self.repos = {}
+        self.totals = dict.fromkeys(TOTALS, 0)
+        self.languages = {}
+        self.topics = {}
+        self._result = None
+        self.dirty = True
+
+    @staticmethod
+    def _record(repo: Dict) -> list:
+        return [
+            repo_version(repo),
+            repo.get('stargazers_count', 0),
+            repo.get('forks_count', 0),
+            repo.get('watchers_count', 0),
+            repo.get('open_issues_count', 0),
+            repo.get('size', 0),
+            repo.get('language'),
+            list(repo.get('topics', [])),
+            repo['name'],
+            repo['html_url'],
+            repo['created_at']
+        ]
+
+    @staticmethod
+    def _count(counter: Dict[str, int], key: str, sign: int):
+        value = counter.get(key, 0) + sign
+        if value:
+            counter[key] = value
+        else:
+            counter.pop(key, None)
+
+    def _apply(self, record: list, sign: int):
+        """Soma (+1) ou remove (-1) a contribuição de um repositório"""
+        totals = self.totals
+        totals['total_repos'] += sign
+        totals['total_stars'] += sign * record[STARS]
+        totals['total_forks'] += sign * record[FORKS]
+        totals['total_watchers'] += sign * record[WATCHERS]
+        totals['total_open_issues'] += sign * record[OPEN_ISSUES]
+        totals['total_size'] += sign * record[SIZE]
+        totals['repos_with_stars'] += sign * (record[STARS] > 0)
+        totals['repos_with_forks'] += sign * (record[FORKS] > 0)
+        if record[LANGUAGE]:
+            self._count(self.languages, record[LANGUAGE], sign)
+        for topic in record[TOPICS]:
+            self._count(self.topics, topic, sign)
+
+    def update(self, owner: str, repos: Iterable[Dict]) -> List[Dict]:
+        """
+        Aplica a listagem atual (repos públicos) ao estado
+        Retorna os repositórios novos ou alterados desde a última execução.
+        """
+        if owner != self.owner:
+            self.reset(owner)
+
+        previous = self.repos
+        current: Dict[str, list] = {}
+        changed = []
+
+        for repo in repos:
+            if repo.get('private', False):
+                continue
+            key = repo['full_name']
+            record = previous.get(key)
+            if record is not None and record[VERSION] == repo_version(repo):
+                current[key] = record
+                continue
+
+            # Repositório novo ou alterado: troca a contribuição antiga pela nova
+            if record is not None:
+                self._apply(record, -1)
+            record = self._record(repo)
+            self._apply(record, +1)
+            current[key] = record
+            changed.append(repo)
+
+        removed = previous.keys() - current.keys()
+        for key in removed:
+            self._apply(previous[key], -1)
+
+        # A ordem da listagem decide empates (extremos e most_common), como no cálculo completo
+        if changed or removed or list(previous) != list(current):
+            self._result = None
+            self.dirty = True
+        self.repos = current
+        return changed
+
+    def _fold(self) -> Dict:
+        """Extremos e ordem dos contadores: uma passada simples sobre os registros compactos"""
+        most_starred = most_forked = newest = oldest = None
+        languages = {}
+        topics = {}
+
+        for record in self.repos.values():
+            if most_starred is None or record[STARS] > most_starred[STARS]:
+                most_starred = record
+            if most_forked is None or record[FORKS] > most_forked[FORKS]:
+                most_forked = record
+            # Datas ISO 8601 no mesmo formato comparam como datetime
+            if newest is None or record[CREATED_AT] > newest[CREATED_AT]:
+                newest = record
+            if oldest is None or record[CREATED_AT] < oldest[CREATED_AT]:
+                oldest = record
+            if record[LANGUAGE] and record[LANGUAGE] not in languages:
+                languages[record[LANGUAGE]] = self.languages[record[LANGUAGE]]
+            for topic in record[TOPICS]:
+                if topic not in topics:
+                    topics[topic] = self.topics[topic]
+
+        def repo_ref(record, field, value):
+            if record is None:
+                return None
+            return {'name': record[NAME], field: value, 'url': record[URL]}
+
+        def dated(record):
+            if record is None:
+                return None
+            return repo_ref(record, 'date', datetime.strptime(record[CREATED_AT], '%Y-%m-%dT%H:%M:%SZ'))
+
+        return {
+            'languages': languages,
+            'topics': topics,
+            'most_starred_repo': repo_ref(most_starred, 'stars', most_starred and most_starred[STARS]),
+            'most_forked_repo': repo_ref(most_forked, 'forks', most_forked and most_forked[FORKS]),
+            'newest_repo': dated(newest),
+            'oldest_repo': dated(oldest)
+        }
+
+    def metrics(self) -> Dict:
+        """Métricas no formato de InsightsAgent.calculate_total_metrics"""
+        if self._result is None:
+            self._result = self._fold()
+
+        result = self._result
+        metrics = {
+            'total_repos': self.totals['total_repos'],
+            'total_stars': self.totals['total_stars'],
+            'total_forks': self.totals['total_forks'],
+            'total_watchers': self.totals['total_watchers'],
+            'total_open_issues': self.totals['total_open_issues'],
+            'languages': Counter(result['languages']),
+            'topics': Counter(result['topics']),
+            'repos_with_stars': self.totals['repos_with_stars'],
+            'repos_with_forks': self.totals['repos_with_forks'],
+            'most_starred_repo': dict(result['most_starred_repo']) if result['most_starred_repo'] else None,
+            'most_forked_repo': dict(result['most_forked_repo']) if result['most_forked_repo'] else None,
+            'newest_repo': dict(result['newest_repo']) if result['newest_repo'] else None,
+            'oldest_repo': dict(result['oldest_repo']) if result['oldest_repo'] else None,
+            'avg_stars_per_repo': 0,
+            'total_size': self.totals['total_size']
+        }
+        if metrics['total_repos'] > 0:
+            metrics['avg_stars_per_repo'] = round(metrics['total_stars'] / metrics['total_repos'], 2)
+        return metrics
+
+    def save(self):
+        """Persiste o estado (escrita atômica) se houve mudanças"""
+        if not self.path or not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'owner': self.owner,
+                'repos': self.repos,
+                'totals': self.totals,
+                'languages': self.languages,
+                'topics': self.topics
+            }, f)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
@@ -0,0 +1,118 @@
+"""
+Sketch de quantis KLL (Karnin, Lang, Liberty)
+Memória limitada (~3·k itens, ~600 para k=200) independente do volume de dados, mesclável
+e serializável: a base de comparação cresce entre execuções sem guardar as amostras
+"""
+
+import math
+import random
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional
+
+
+class KLLSketch:
+    """Quantis aproximados de um fluxo de valores (erro de rank ~1.7/k)"""
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        self.k = k
+        self.n = 0
+        # Nível h guarda itens com peso 2^h
+        self.compactors: List[List[float]] = [[]]
+        self._random = random.Random(seed)
+        self._cdf = None
+
+    def _capacity(self, level: int) -> int:
+        # Níveis mais altos (mais pesados) guardam mais itens: c = 2/3 por nível abaixo do topo
+        depth = len(self.compactors) - level - 1
+        return int(math.ceil((2 / 3) ** depth * self.k)) + 1
+
+    def _max_size(self) -> int:
+        return sum(self._capacity(level) for level in range(len(self.compactors)))
+
+    def _size(self) -> int:
+        return sum(len(compactor) for compactor in self.compactors)
+
+    def _compress(self):
+        """Compacta o primeiro nível cheio: metade dos itens (alternados) sobe com peso dobrado"""
+        for level, compactor in enumerate(self.compactors):
+            if len(compactor) < self._capacity(level):
+                continue
+            if level + 1 == len(self.compactors):
+                self.compactors.append([])
+            compactor.sort()
+            # Mantém o último item se a quantidade for ímpar
+            keep = [compactor.pop()] if len(compactor) % 2 else []
+            offset = self._random.randint(0, 1)
+            self.compactors[level + 1].extend(compactor[offset::2])
+            self.compactors[level] = keep
+            return
+
+    def add(self, value: float):
+        self.compactors[0].append(float(value))
+        self.n += 1
+        self._cdf = None
+        if self._size() >= self._max_size():
+            self._compress()
+
+    def add_all(self, values: Iterable[float]) -> 'KLLSketch':
+        for value in values:
+            self.add(value)
+        return self
+
+    def merge(self, other: 'KLLSketch') -> 'KLLSketch':
+        """Incorpora outro sketch (ex: amostras de uma nova execução)"""
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append([])
+        for level, compactor in enumerate(other.compactors):
+            self.compactors[level].extend(compactor)
+        self.n += other.n
+        self._cdf = None
+        while self._size() >= self._max_size():
+            self._compress()
+        return self
+
+    def _weighted(self):
+        """Itens ordenados com pesos acumulados (calculado uma vez até a próxima escrita)"""
+        if self._cdf is None:
+            items = sorted(
+                (value, 1 << level)
+                for level, compactor in enumerate(self.compactors)
+                for value in compactor
+            )
+            values = [value for value, _ in items]
+            cumulative = []
+            total = 0
+            for _, weight in items:
+                total += weight
+                cumulative.append(total)
+            self._cdf = (values, cumulative, total)
+        return self._cdf
+
+    def percentile(self, value: float) -> float:
+        """Percentual (0-100) da amostra abaixo do valor, contando empates pela metade"""
+        values, cumulative, total = self._weighted()
+        if not total:
+            return 0.0
+        below = bisect_left(values, value)
+        through = bisect_right(values, value)
+        weight_below = cumulative[below - 1] if below else 0
+        weight_through = cumulative[through - 1] if through else 0
+        return (weight_below + weight_through) / 2 / total * 100
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Valor aproximado no quantil q (0-1)"""
+        values, cumulative, total = self._weighted()
+        if not total:
+            return None
+        index = bisect_left(cumulative, q * total)
+        return values[min(index, len(values) - 1)]
+
+    def to_dict(self) -> Dict:
+        return {'k': self.k, 'n': self.n, 'compactors': self.compactors}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'KLLSketch':
+        sketch = cls(data['k'])
+        sketch.n = data['n']
+        sketch.compactors = [list(compactor) for compactor in data['compactors']] or [[]]
+        return sketch
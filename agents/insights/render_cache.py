@@ -0,0 +1,88 @@
+"""
+Cache de renderização de documentos Markdown por seção
+Cada seção é identificada pelo hash dos dados de entrada: seções sem mudança vêm do
+cache, e o horário do documento só avança quando o conteúdo muda de fato
+"""
+
+import os
+import json
+import hashlib
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+
+def data_hash(data: Any) -> str:
+    """Hash estável dos dados de uma seção (ordem das chaves não importa)"""
+    payload = json.dumps(data, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class RenderCache:
+    """Seções renderizadas e horário da última mudança de cada documento"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        # nome da seção -> [hash dos dados, texto renderizado]
+        self.sections = {}
+        # arquivo -> [hash do conteúdo, horário da última mudança (ISO)]
+        self.documents = {}
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.sections = data['sections']
+                self.documents = data['documents']
+            except (OSError, ValueError, KeyError):
+                self.sections = {}
+                self.documents = {}
+
+    def render(self, name: str, data: Any, render: Callable[[Any], str]) -> str:
+        """Texto da seção: do cache se os dados não mudaram, senão render(data)"""
+        key = data_hash(data)
+        cached = self.sections.get(name)
+        if cached and cached[0] == key:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        text = render(data)
+        self.sections[name] = [key, text]
+        self.dirty = True
+        return text
+
+    def stamp(self, document: str, content: str, now: Optional[datetime] = None) -> datetime:
+        """Horário a exibir no documento: mantém o anterior se o conteúdo não mudou"""
+        key = data_hash(content)
+        cached = self.documents.get(document)
+        if cached and cached[0] == key:
+            return datetime.fromisoformat(cached[1])
+
+        now = (now or datetime.now()).replace(microsecond=0)
+        self.documents[document] = [key, now.isoformat()]
+        self.dirty = True
+        return now
+
+    def save(self):
+        """Persiste o cache (escrita atômica) se houve mudanças"""
+        if not self.path or not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'sections': self.sections, 'documents': self.documents}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+
+def write_if_changed(path: str, content: str) -> bool:
+    """Grava o arquivo só se o conteúdo for diferente; retorna True se gravou"""
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                return False
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True
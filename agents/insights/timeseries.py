@@ -0,0 +1,181 @@
+"""
+Série temporal local de métricas (SQLite)
+A API só informa os valores atuais: um snapshot diário por repositório e por perfil
+permite calcular crescimento real (ex: estrelas ganhas na semana) sem chamadas extras
+"""
+
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+METRICS = ('stars', 'forks', 'watchers', 'open_issues', 'size', 'followers')
+
+# Uma linha por série e dia; a chave primária (série, dia) ordena os dados no disco
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    series TEXT NOT NULL,
+    day TEXT NOT NULL,
+    stars INTEGER NOT NULL DEFAULT 0,
+    forks INTEGER NOT NULL DEFAULT 0,
+    watchers INTEGER NOT NULL DEFAULT 0,
+    open_issues INTEGER NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL DEFAULT 0,
+    followers INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (series, day)
+) WITHOUT ROWID;
+"""
+
+# Agrupamentos aceitos por downsample (formato strftime do SQLite)
+BUCKETS = {
+    'week': '%Y-%W',
+    'month': '%Y-%m',
+    'year': '%Y'
+}
+
+
+def repo_series(full_name: str) -> str:
+    return f'repo:{full_name}'
+
+
+def profile_series(username: str) -> str:
+    return f'user:{username}'
+
+
+class MetricsStore:
+    """Snapshots diários (append-only) de métricas por repositório e perfil"""
+
+    def __init__(self, path: str = '.cache/timeseries.sqlite3'):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Uma conexão por operação (seguro para várias threads): commit ao final e fechada sempre
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _row(values: Dict) -> tuple:
+        return tuple(int(values.get(metric) or 0) for metric in METRICS)
+
+    def record(self, snapshots: Dict[str, Dict], day: Optional[date] = None):
+        """
+        Grava {série: {métrica: valor}} no dia informado (padrão: hoje)
+        Novas execuções no mesmo dia substituem o snapshot do dia; dias anteriores não mudam.
+        """
+        day = (day or date.today()).isoformat()
+        rows = [(series, day) + self._row(values) for series, values in snapshots.items()]
+        if not rows:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO snapshots (series, day, {', '.join(METRICS)}) "
+                f"VALUES (?, ?, {', '.join('?' * len(METRICS))})",
+                rows
+            )
+
+    def record_repos(self, repos: Iterable[Dict], day: Optional[date] = None):
+        """Snapshot dos repositórios no formato da API REST"""
+        self.record({
+            repo_series(repo['full_name']): {
+                'stars': repo.get('stargazers_count', 0),
+                'forks': repo.get('forks_count', 0),
+                'watchers': repo.get('watchers_count', 0),
+                'open_issues': repo.get('open_issues_count', 0),
+                'size': repo.get('size', 0)
+            }
+            for repo in repos
+        }, day)
+
+    def range(self, series: str, since: Optional[date] = None,
+              until: Optional[date] = None) -> List[Dict]:
+        """
+        Snapshots da série no intervalo [since, until], do mais antigo ao mais novo
+        Só os dias com mudança têm snapshot: com `since`, o intervalo começa pelo último
+        snapshot até esse dia (valor em vigor), datado de `since`.
+        """
+        columns = f"day, {', '.join(METRICS)}"
+        query = f"SELECT {columns} FROM snapshots WHERE series = ?"
+        params = [series]
+        if since:
+            query += ' AND day > ?'
+            params.append(since.isoformat())
+        if until:
+            query += ' AND day <= ?'
+            params.append(until.isoformat())
+        query += ' ORDER BY day'
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+            if since and (until is None or since <= until):
+                seed = conn.execute(
+                    f"SELECT {columns} FROM snapshots WHERE series = ? AND day <= ? ORDER BY day DESC LIMIT 1",
+                    (series, since.isoformat())
+                ).fetchone()
+                if seed:
+                    rows.insert(0, (since.isoformat(),) + seed[1:])
+        return [dict(zip(('day',) + METRICS, row)) for row in rows]
+
+    def at(self, series: str, day: date) -> Optional[Dict]:
+        """Último snapshot da série até o dia informado (inclusive)"""
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT day, {', '.join(METRICS)} FROM snapshots "
+                "WHERE series = ? AND day <= ? ORDER BY day DESC LIMIT 1",
+                (series, day.isoformat())
+            ).fetchone()
+        return dict(zip(('day',) + METRICS, row)) if row else None
+
+    def downsample(self, series: str, bucket: str = 'week', since: Optional[date] = None,
+                   until: Optional[date] = None) -> List[Dict]:
+        """Um ponto por semana/mês/ano: o último snapshot de cada período"""
+        fmt = BUCKETS[bucket]
+        query = (
+            f"SELECT strftime('{fmt}', day) AS bucket, MAX(day), {', '.join(METRICS)} "
+            "FROM snapshots WHERE series = ?"
+        )
+        params = [series]
+        if since:
+            query += ' AND day >= ?'
+            params.append(since.isoformat())
+        if until:
+            query += ' AND day <= ?'
+            params.append(until.isoformat())
+        # Com MAX() o SQLite devolve as demais colunas da linha do último dia do grupo
+        query += ' GROUP BY bucket ORDER BY bucket'
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [dict(zip(('bucket', 'day') + METRICS, row)) for row in rows]
+
+    def delta(self, series: str, days: int = 7, today: Optional[date] = None) -> Optional[Dict]:
+        """
+        Variação das métricas entre o valor em vigor hoje e o de `days` dias antes
+        (séries sem mudança no período têm variação zero). Retorna None se não houver
+        histórico anterior ao período.
+        """
+        today = today or date.today()
+        since = today - timedelta(days=days)
+        current = self.at(series, today)
+        previous = self.at(series, since)
+        if current is None or previous is None:
+            return None
+
+        result = {metric: current[metric] - previous[metric] for metric in METRICS}
+        result['since'] = since.isoformat()
+        result['days'] = days
+        return result
+
+    def series_count(self) -> int:
+        """Total de séries com pelo menos um snapshot"""
+        with self._connect() as conn:
+            return conn.execute('SELECT COUNT(DISTINCT series) FROM snapshots').fetchone()[0]
@@ -0,0 +1,178 @@
+"""
+Motor vetorizado de métricas (NumPy, opcional)
+A listagem de repositórios vira colunas (arrays) e totais, médias, percentis, top-K,
+taxas de engajamento e faixas de inatividade saem de operações vetorizadas
+"""
+
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Dependência opcional: sem NumPy o InsightsAgent usa os laços em Python
+    np = None
+
+
+HAS_NUMPY = np is not None
+
+NUMERIC_FIELDS = {
+    'stars': 'stargazers_count',
+    'forks': 'forks_count',
+    'watchers': 'watchers_count',
+    'open_issues': 'open_issues_count',
+    'size': 'size'
+}
+
+# Limites (dias desde a última atualização) das faixas de inatividade
+INACTIVITY_EDGES = (30, 90, 180, 365)
+
+
+def _codes(values: Iterable[Optional[str]], vocabulary: Dict[str, int]) -> List[int]:
+    """Códigos inteiros na ordem da primeira ocorrência (-1 = ausente)"""
+    codes = []
+    for value in values:
+        if value is None:
+            codes.append(-1)
+            continue
+        code = vocabulary.get(value)
+        if code is None:
+            code = vocabulary[value] = len(vocabulary)
+        codes.append(code)
+    return codes
+
+
+class RepoColumns:
+    """Repositórios públicos em formato colunar"""
+
+    def __init__(self, repos: Iterable[Dict]):
+        if not HAS_NUMPY:
+            raise RuntimeError('NumPy não está instalado (pip install numpy)')
+
+        repos = [repo for repo in repos if not repo.get('private', False)]
+        self.names = [repo['name'] for repo in repos]
+        self.urls = [repo['html_url'] for repo in repos]
+
+        for field, key in NUMERIC_FIELDS.items():
+            setattr(self, field, np.array([repo.get(key, 0) or 0 for repo in repos], dtype=np.int64))
+
+        # Timestamps ISO 8601 ('...Z') convertidos de uma vez pelo NumPy
+        self.created = np.array([repo['created_at'][:19] for repo in repos], dtype='datetime64[s]')
+        self.updated = np.array([repo['updated_at'][:19] for repo in repos], dtype='datetime64[s]')
+        self.has_description = np.array([bool(repo.get('description')) for repo in repos], dtype=bool)
+
+        self.language_vocabulary: Dict[str, int] = {}
+        self.language = np.array(
+            _codes((repo.get('language') or None for repo in repos), self.language_vocabulary),
+            dtype=np.int32
+        )
+
+        # Topics: lista achatada de códigos (a ordem de ocorrência é a mesma da listagem)
+        self.topic_vocabulary: Dict[str, int] = {}
+        self.topics = np.array(
+            _codes((topic for repo in repos for topic in repo.get('topics', [])), self.topic_vocabulary),
+            dtype=np.int32
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class VectorMetricsEngine:
+    """Métricas do perfil calculadas sobre RepoColumns"""
+
+    def __init__(self, columns: RepoColumns):
+        self.columns = columns
+
+    @classmethod
+    def from_repos(cls, repos: Iterable[Dict]) -> 'VectorMetricsEngine':
+        return cls(RepoColumns(repos))
+
+    @staticmethod
+    def _counter(codes, vocabulary: Dict[str, int]) -> Counter:
+        counts = np.bincount(codes[codes >= 0], minlength=len(vocabulary))
+        # Vocabulário em ordem de primeira ocorrência: mesmos empates de most_common()
+        return Counter({value: int(counts[code]) for value, code in vocabulary.items()})
+
+    def _repo_ref(self, index: int, field: str, value) -> Dict:
+        return {'name': self.columns.names[index], field: value, 'url': self.columns.urls[index]}
+
+    def total_metrics(self) -> Dict:
+        """Mesmo resultado de InsightsAgent.calculate_total_metrics"""
+        c = self.columns
+        total = len(c)
+        metrics = {
+            'total_repos': total,
+            'total_stars': int(c.stars.sum()),
+            'total_forks': int(c.forks.sum()),
+            'total_watchers': int(c.watchers.sum()),
+            'total_open_issues': int(c.open_issues.sum()),
+            'languages': self._counter(c.language, c.language_vocabulary),
+            'topics': self._counter(c.topics, c.topic_vocabulary),
+            'repos_with_stars': int(np.count_nonzero(c.stars)),
+            'repos_with_forks': int(np.count_nonzero(c.forks)),
+            'most_starred_repo': None,
+            'most_forked_repo': None,
+            'newest_repo': None,
+            'oldest_repo': None,
+            'avg_stars_per_repo': 0,
+            'total_size': int(c.size.sum())
+        }
+
+        if total > 0:
+            # argmax/argmin retornam a primeira ocorrência, como a comparação estrita do laço
+            starred = int(c.stars.argmax())
+            forked = int(c.forks.argmax())
+            newest = int(c.created.argmax())
+            oldest = int(c.created.argmin())
+            metrics['most_starred_repo'] = self._repo_ref(starred, 'stars', int(c.stars[starred]))
+            metrics['most_forked_repo'] = self._repo_ref(forked, 'forks', int(c.forks[forked]))
+            metrics['newest_repo'] = self._repo_ref(newest, 'date', c.created[newest].item())
+            metrics['oldest_repo'] = self._repo_ref(oldest, 'date', c.created[oldest].item())
+            metrics['avg_stars_per_repo'] = round(metrics['total_stars'] / total, 2)
+
+        return metrics
+
+    def percentiles(self, field: str = 'stars', qs: Sequence[float] = (50, 90, 99)) -> Dict[float, float]:
+        """Percentis de uma métrica numérica (stars, forks, watchers, open_issues, size)"""
+        values = getattr(self.columns, field)
+        if not len(values):
+            return {q: 0.0 for q in qs}
+        return {q: float(value) for q, value in zip(qs, np.percentile(values, qs))}
+
+    def top_k(self, field: str = 'stars', k: int = 10) -> List[Tuple[str, int]]:
+        """Os K maiores valores (empates na ordem da listagem), sem ordenar tudo"""
+        values = getattr(self.columns, field)
+        if not len(values) or k <= 0:
+            return []
+        k = min(k, len(values))
+        threshold = np.partition(values, len(values) - k)[len(values) - k]
+        candidates = np.flatnonzero(values >= threshold)
+        order = candidates[np.argsort(-values[candidates], kind='stable')][:k]
+        return [(self.columns.names[i], int(values[i])) for i in order]
+
+    def engagement_rates(self) -> Dict[str, float]:
+        """Percentual de repos com estrelas/forks e forks por estrela"""
+        c = self.columns
+        total = len(c)
+        stars = int(c.stars.sum())
+        return {
+            'with_stars': round(int(np.count_nonzero(c.stars)) / total * 100, 1) if total else 0.0,
+            'with_forks': round(int(np.count_nonzero(c.forks)) / total * 100, 1) if total else 0.0,
+            'forks_per_star': round(int(c.forks.sum()) / stars, 2) if stars else 0.0
+        }
+
+    def inactivity_buckets(self, now: Optional[datetime] = None,
+                           edges: Sequence[int] = INACTIVITY_EDGES) -> Dict[str, int]:
+        """Quantidade de repos por faixa de dias desde a última atualização"""
+        now = np.datetime64((now or datetime.now()).replace(microsecond=0), 's')
+        idle_days = (now - self.columns.updated) / np.timedelta64(1, 'D')
+        counts = np.bincount(np.searchsorted(edges, idle_days, side='left'), minlength=len(edges) + 1)
+
+        labels = [f'≤{edges[0]}d']
+        labels += [f'{low + 1}-{high}d' for low, high in zip(edges, edges[1:])]
+        labels.append(f'>{edges[-1]}d')
+        return {label: int(count) for label, count in zip(labels, counts)}
+
+    def repos_without_description(self) -> int:
+        return int(np.count_nonzero(~self.columns.has_description))
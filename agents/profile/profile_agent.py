@@ -3,56 +3,69 @@ Agente de Perfil (Bio & Branding)
 Responsável por montar e atualizar automaticamente o README do perfil
 """
 
-import os
-import json
-import requests
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
+from ..core import PRIORITY_HIGH, ConcurrentFetcher, GitHubAgent, GitHubClient, RunContext
 
-class ProfileAgent:
+
+class ProfileAgent(GitHubAgent):
     """Agente responsável pela gestão do perfil do GitHub"""
 
-    def __init__(self, username: str, github_token: Optional[str] = None):
-        self.username = username
-        self.github_token = github_token or os.getenv('GITHUB_TOKEN')
-        self.api_base = 'https://api.github.com'
-        self.headers = {
-            'Accept': 'application/vnd.github.v3+json',
-        }
-        if self.github_token:
-            self.headers['Authorization'] = f'token {self.github_token}'
+    def __init__(self, username: str, github_token: Optional[str] = None,
+                 client: Optional[GitHubClient] = None,
+                 context: Optional[RunContext] = None):
+        super().__init__(username, github_token, client, context)
 
     def get_user_data(self) -> Dict:
         """Obtém dados do usuário via GitHub API"""
+        if self.context:
+            return self.context.user
         url = f'{self.api_base}/users/{self.username}'
-        response = requests.get(url, headers=self.headers)
+        # Dados essenciais para o README: passam na frente quando o orçamento está curto
+        response = self.client.get(url, priority=PRIORITY_HIGH)
         response.raise_for_status()
         return response.json()
 
-    def get_user_repos(self) -> List[Dict]:
-        """Obtém repositórios do usuário"""
+    def iter_user_repos(self) -> Iterator[Dict]:
+        """Itera sobre todos os repositórios do usuário (todas as páginas)"""
+        if self.context:
+            return iter(self.context.repos)
+        if self.client.graphql:
+            return self.client.graphql.iter_repos(self.username)
         url = f'{self.api_base}/users/{self.username}/repos'
         params = {'sort': 'updated', 'per_page': 100}
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        return self.client.paginate(url, params=params)
+
+    def get_user_repos(self) -> List[Dict]:
+        """Obtém repositórios do usuário"""
+        return list(self.iter_user_repos())
 
     def get_language_stats(self) -> Dict[str, int]:
         """Calcula estatísticas de linguagens usadas"""
-        repos = self.get_user_repos()
         languages = {}
 
-        for repo in repos:
+        def merge(lang_url: str, repo_languages: Dict[str, int]):
+            for lang, bytes_count in repo_languages.items():
+                languages[lang] = languages.get(lang, 0) + bytes_count
+
+        if self.context:
+            for repo_languages in self.context.languages.values():
+                merge(None, repo_languages)
+            return languages
+
+        lang_urls = []
+        for repo in self.iter_user_repos():
             if repo['fork']:
                 continue
-
-            lang_url = repo['languages_url']
-            response = requests.get(lang_url, headers=self.headers)
-            if response.status_code == 200:
-                repo_languages = response.json()
-                for lang, bytes_count in repo_languages.items():
-                    languages[lang] = languages.get(lang, 0) + bytes_count
+            # O backend GraphQL já traz as linguagens junto com o repositório
+            if 'languages' in repo:
+                merge(repo['languages_url'], repo['languages'])
+            else:
+                lang_urls.append(repo['languages_url'])
+
+        # Busca todos os endpoints de linguagens em paralelo; falhas são ignoradas
+        ConcurrentFetcher(self.client).fetch_json(lang_urls, merge)
 
         return languages
 
@@ -1,5 +1,13 @@
 """Agente de Projetos (Curadoria e Destaque)"""
 
 from .projects_agent import ProjectsAgent
+from .scoring import HAS_NUMPY, FeaturedRanking, ScoringEngine, VectorScoringEngine, create_scoring_engine
 
-__all__ = ['ProjectsAgent']
+__all__ = [
+    'ProjectsAgent',
+    'ScoringEngine',
+    'VectorScoringEngine',
+    'FeaturedRanking',
+    'create_scoring_engine',
+    'HAS_NUMPY'
+]
@@ -3,93 +3,56 @@ Agente de Projetos (Curadoria e Destaque)
 Responsável por escolher e organizar repositórios em destaque
 """
 
-import os
-import requests
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from collections import defaultdict
 
+from ..core import GitHubAgent, GitHubClient, RunContext
+from .scoring import FeaturedRanking, ScoringEngine
 
-class ProjectsAgent:
-    """Agente responsável pela curadoria e destaque de projetos"""
 
-    def __init__(self, username: str, github_token: Optional[str] = None):
-        self.username = username
-        self.github_token = github_token or os.getenv('GITHUB_TOKEN')
-        self.api_base = 'https://api.github.com'
-        self.headers = {
-            'Accept': 'application/vnd.github.v3+json',
-        }
-        if self.github_token:
-            self.headers['Authorization'] = f'token {self.github_token}'
+class ProjectsAgent(GitHubAgent):
+    """Agente responsável pela curadoria e destaque de projetos"""
 
-    def get_all_repos(self) -> List[Dict]:
-        """Obtém todos os repositórios do usuário"""
+    def __init__(self, username: str, github_token: Optional[str] = None,
+                 client: Optional[GitHubClient] = None,
+                 context: Optional[RunContext] = None,
+                 org: Optional[str] = None,
+                 scoring: Optional[ScoringEngine] = None):
+        super().__init__(username, github_token, client, context)
+        # Organização analisada (/orgs/{org}/repos) em vez dos repos do usuário
+        self.org = org
+        # Pesos e fatores do score (None = pesos padrão, em Python)
+        self.scoring = scoring or ScoringEngine()
+        # Ranking mantido entre chamadas: só repositórios alterados são recalculados
+        self.ranking = FeaturedRanking(self.scoring)
+
+    def iter_repos(self) -> Iterator[Dict]:
+        """Itera sobre todos os repositórios do usuário (todas as páginas)"""
+        if self.org:
+            return self.client.paginate(f'/orgs/{self.org}/repos', params={'per_page': 100})
+        if self.context:
+            return iter(self.context.repos)
+        if self.client.graphql:
+            return self.client.graphql.iter_repos(self.username)
         url = f'{self.api_base}/users/{self.username}/repos'
         params = {'sort': 'updated', 'per_page': 100}
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
-
-    def calculate_repo_score(self, repo: Dict) -> float:
-        """Calcula score de relevância do repositório"""
-        score = 0.0
-
-        # Pontos por estrelas
-        score += repo.get('stargazers_count', 0) * 3
-
-        # Pontos por forks
-        score += repo.get('forks_count', 0) * 2
-
-        # Pontos por watchers
-        score += repo.get('watchers_count', 0) * 1
-
-        # Pontos por issues abertas (indica atividade)
-        score += repo.get('open_issues_count', 0) * 0.5
-
-        # Bonus se não for fork
-        if not repo.get('fork', False):
-            score += 10
-
-        # Bonus se tiver descrição
-        if repo.get('description'):
-            score += 5
-
-        # Bonus se tiver homepage
-        if repo.get('homepage'):
-            score += 3
-
-        # Bonus se tiver topics/tags
-        score += len(repo.get('topics', [])) * 2
-
-        # Penalidade por inatividade (mais de 1 ano)
-        updated_at = datetime.strptime(repo['updated_at'], '%Y-%m-%dT%H:%M:%SZ')
-        days_since_update = (datetime.now() - updated_at).days
-        if days_since_update > 365:
-            score *= 0.5
+        return self.client.paginate(url, params=params)
 
-        return score
+    def get_all_repos(self) -> List[Dict]:
+        """Obtém todos os repositórios do usuário"""
+        return list(self.iter_repos())
 
     def get_top_repos(self, limit: int = 6) -> List[Dict]:
         """Retorna os top repositórios por score"""
-        repos = self.get_all_repos()
-        repos_with_score = [
-            (repo, self.calculate_repo_score(repo))
-            for repo in repos
-            if not repo.get('private', False)
-        ]
-
-        # Ordena por score
-        repos_with_score.sort(key=lambda x: x[1], reverse=True)
-
-        return [repo for repo, score in repos_with_score[:limit]]
+        self.ranking.update(self.iter_repos())
+        return self.ranking.top(limit)
 
     def get_repos_by_language(self) -> Dict[str, List[Dict]]:
         """Agrupa repositórios por linguagem"""
-        repos = self.get_all_repos()
         by_language = defaultdict(list)
 
-        for repo in repos:
+        for repo in self.iter_repos():
             if repo.get('private', False) or repo.get('fork', False):
                 continue
 
@@ -215,8 +178,7 @@ class ProjectsAgent:
         portfolio.append("## 📋 Todos os Projetos")
         portfolio.append("")
 
-        repos = self.get_all_repos()
-        for repo in repos:
+        for repo in self.iter_repos():
             if repo.get('private', False):
                 continue
 
@@ -246,12 +208,11 @@ class ProjectsAgent:
 
         print(f"✅ Portfólio gerado em {output_file}")
 
-    def analyze_repos_health(self) -> Dict:
-        """Analisa a saúde geral dos repositórios"""
-        repos = self.get_all_repos()
-
-        stats = {
-            'total_repos': len(repos),
+    @staticmethod
+    def new_health_stats() -> Dict:
+        """Contadores vazios de analyze_repos_health"""
+        return {
+            'total_repos': 0,
             'repos_without_description': 0,
             'repos_without_topics': 0,
             'repos_without_license': 0,
@@ -261,39 +222,47 @@ class ProjectsAgent:
             'total_forks': 0
         }
 
-        for repo in repos:
-            if repo.get('private', False):
-                continue
+    @staticmethod
+    def add_repo_health(stats: Dict, repo: Dict):
+        """Contabiliza um repositório nos contadores de saúde"""
+        stats['total_repos'] += 1
+        if repo.get('private', False):
+            return
 
-            # Contadores
-            if not repo.get('description'):
-                stats['repos_without_description'] += 1
+        # Contadores
+        if not repo.get('description'):
+            stats['repos_without_description'] += 1
 
-            if not repo.get('topics') or len(repo.get('topics', [])) == 0:
-                stats['repos_without_topics'] += 1
+        if not repo.get('topics') or len(repo.get('topics', [])) == 0:
+            stats['repos_without_topics'] += 1
 
-            if not repo.get('license'):
-                stats['repos_without_license'] += 1
+        if not repo.get('license'):
+            stats['repos_without_license'] += 1
 
-            # Inatividade
-            updated_at = datetime.strptime(repo['updated_at'], '%Y-%m-%dT%H:%M:%SZ')
-            days_since_update = (datetime.now() - updated_at).days
-            if days_since_update > 365:
-                stats['inactive_repos'] += 1
+        # Inatividade
+        updated_at = datetime.strptime(repo['updated_at'], '%Y-%m-%dT%H:%M:%SZ')
+        days_since_update = (datetime.now() - updated_at).days
+        if days_since_update > 365:
+            stats['inactive_repos'] += 1
 
-            # Linguagens
-            lang = repo.get('language', 'Other')
-            stats['top_languages'][lang] = stats['top_languages'].get(lang, 0) + 1
+        # Linguagens
+        lang = repo.get('language', 'Other')
+        stats['top_languages'][lang] = stats['top_languages'].get(lang, 0) + 1
 
-            # Totais
-            stats['total_stars'] += repo.get('stargazers_count', 0)
-            stats['total_forks'] += repo.get('forks_count', 0)
+        # Totais
+        stats['total_stars'] += repo.get('stargazers_count', 0)
+        stats['total_forks'] += repo.get('forks_count', 0)
 
+    def analyze_repos_health(self) -> Dict:
+        """Analisa a saúde geral dos repositórios"""
+        stats = self.new_health_stats()
+        for repo in self.iter_repos():
+            self.add_repo_health(stats, repo)
         return stats
 
-    def generate_health_report(self) -> str:
+    def generate_health_report(self, stats: Optional[Dict] = None) -> str:
         """Gera relatório de saúde dos repositórios"""
-        stats = self.analyze_repos_health()
+        stats = stats or self.analyze_repos_health()
 
         report = [
             "# 📊 Relatório de Saúde dos Repositórios",
@@ -0,0 +1,238 @@
+"""
+Motor de score dos projetos em destaque
+Pesos e fatores vêm da seção `projects.scoring` da configuração; o motor vetorizado
+(NumPy, opcional) calcula o score de toda a listagem numa única passada e o ranking
+incremental só recalcula os repositórios que mudaram
+"""
+
+import heapq
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Dependência opcional: sem NumPy o score é calculado em Python
+    np = None
+
+
+HAS_NUMPY = np is not None
+
+# Pontos por unidade de cada fator (mesmos valores do score original)
+DEFAULT_WEIGHTS = {
+    'stars': 3,
+    'forks': 2,
+    'watchers': 1,
+    'open_issues': 0.5,
+    'topics': 2,
+    'not_fork': 10,
+    'description': 5,
+    'homepage': 3
+}
+
+# Penalidade por inatividade: multiplica o score por inactive_factor após inactive_days
+# sem atualização; com half_life_days > 0, o score decai continuamente (meia-vida em dias)
+DEFAULT_RECENCY = {
+    'inactive_days': 365,
+    'inactive_factor': 0.5,
+    'half_life_days': 0
+}
+
+# Campos da API por fator numérico
+COUNT_FIELDS = {
+    'stars': 'stargazers_count',
+    'forks': 'forks_count',
+    'watchers': 'watchers_count',
+    'open_issues': 'open_issues_count'
+}
+
+# Campos lidos pelo score: se nenhum mudar, o score do repositório também não muda
+SCORE_FIELDS = tuple(COUNT_FIELDS.values()) + ('fork', 'description', 'homepage', 'topics', 'updated_at')
+
+
+class ScoringEngine:
+    """Score de relevância dos repositórios (um repositório por vez)"""
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None,
+                 recency: Optional[Dict[str, float]] = None,
+                 now: Optional[datetime] = None):
+        unknown = set(weights or {}) - set(DEFAULT_WEIGHTS)
+        if unknown:
+            raise ValueError(f"Pesos de score desconhecidos: {', '.join(sorted(unknown))}")
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.recency = {**DEFAULT_RECENCY, **(recency or {})}
+        # Horário de referência fixo durante o dia: repositórios sem mudança mantêm o score
+        self.now = (now or datetime.now()).replace(microsecond=0)
+
+    def refresh(self, now: Optional[datetime] = None) -> bool:
+        """Avança o horário de referência se o dia mudou (sessões longas); True se avançou"""
+        now = (now or datetime.now()).replace(microsecond=0)
+        if now.date() == self.now.date():
+            return False
+        self.now = now
+        return True
+
+    def recency_factor(self, days_since_update: int) -> float:
+        half_life = self.recency['half_life_days']
+        if half_life:
+            return 0.5 ** (max(days_since_update, 0) / half_life)
+        if days_since_update > self.recency['inactive_days']:
+            return self.recency['inactive_factor']
+        return 1
+
+    def score(self, repo: Dict) -> float:
+        """Calcula score de relevância do repositório"""
+        w = self.weights
+        score = 0.0
+        for factor, field in COUNT_FIELDS.items():
+            score += (repo.get(field) or 0) * w[factor]
+
+        # Bônus de qualidade da página do projeto
+        if not repo.get('fork', False):
+            score += w['not_fork']
+        if repo.get('description'):
+            score += w['description']
+        if repo.get('homepage'):
+            score += w['homepage']
+        score += len(repo.get('topics') or []) * w['topics']
+
+        # Timestamps ISO 8601 ('...Z'): fromisoformat é bem mais rápido que strptime
+        updated_at = datetime.fromisoformat(repo['updated_at'][:19])
+        return score * self.recency_factor((self.now - updated_at).days)
+
+    def score_all(self, repos: Sequence[Dict]) -> List[float]:
+        """Scores de vários repositórios, na mesma ordem"""
+        return [self.score(repo) for repo in repos]
+
+
+class VectorScoringEngine(ScoringEngine):
+    """Mesmo score de ScoringEngine, calculado em colunas NumPy"""
+
+    def __init__(self, *args, **kwargs):
+        if not HAS_NUMPY:
+            raise RuntimeError('NumPy não está instalado (pip install numpy)')
+        super().__init__(*args, **kwargs)
+
+    def score_all(self, repos: Sequence[Dict]) -> List[float]:
+        if not repos:
+            return []
+        w = self.weights
+        score = np.zeros(len(repos))
+        for factor, field in COUNT_FIELDS.items():
+            score += np.array([repo.get(field) or 0 for repo in repos], dtype=np.float64) * w[factor]
+
+        flags = np.array([
+            (not repo.get('fork', False), bool(repo.get('description')), bool(repo.get('homepage')))
+            for repo in repos
+        ], dtype=bool).reshape(len(repos), 3)
+        score += flags[:, 0] * w['not_fork']
+        score += flags[:, 1] * w['description']
+        score += flags[:, 2] * w['homepage']
+        score += np.array([len(repo.get('topics') or []) for repo in repos], dtype=np.float64) * w['topics']
+
+        # Dias completos desde a atualização (arredondados para baixo, como timedelta.days)
+        updated = np.array([repo['updated_at'][:19] for repo in repos], dtype='datetime64[s]')
+        days = (np.datetime64(self.now, 's') - updated) // np.timedelta64(1, 'D')
+        half_life = self.recency['half_life_days']
+        if half_life:
+            factor = 0.5 ** (np.maximum(days, 0) / half_life)
+        else:
+            factor = np.where(days > self.recency['inactive_days'], self.recency['inactive_factor'], 1)
+        return (score * factor).tolist()
+
+
+def create_scoring_engine(config: Optional[Dict] = None) -> ScoringEngine:
+    """Motor a partir da seção `projects.scoring` ('engine': 'python' ou 'numpy')"""
+    config = config or {}
+    engine = config.get('engine', 'python')
+    if engine == 'numpy' and not HAS_NUMPY:
+        print("⚠️  NumPy não instalado: usando o motor de score em Python")
+        engine = 'python'
+    engine_class = VectorScoringEngine if engine == 'numpy' else ScoringEngine
+    return engine_class(config.get('weights'), config.get('recency'))
+
+
+class FeaturedRanking:
+    """
+    Ranking incremental dos repositórios por score
+    Heap com remoção preguiçosa: a cada atualização só os repositórios alterados são
+    recalculados (numa passada do motor) e o top-K sai sem ordenar a listagem inteira
+    """
+
+    def __init__(self, engine: ScoringEngine):
+        self.engine = engine
+        # chave -> (score, posição na listagem, valores dos campos de score)
+        self._entries: Dict[str, Tuple[float, int, tuple]] = {}
+        self._repos: Dict[str, Dict] = {}
+        # (-score, posição, chave); entradas obsoletas são descartadas na leitura
+        self._heap: List[Tuple[float, int, str]] = []
+        # Horário de referência usado nos scores guardados
+        self._scored_at: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def version(repo: Dict) -> tuple:
+        return tuple(map(repo.get, SCORE_FIELDS))
+
+    def _set(self, key: str, score: float, position: int, version: tuple):
+        self._entries[key] = (score, position, version)
+        heapq.heappush(self._heap, (-score, position, key))
+
+    def update(self, repos: Iterable[Dict]) -> int:
+        """Sincroniza com a listagem atual; retorna quantos repositórios foram recalculados"""
+        self.engine.refresh()
+        if self.engine.now != self._scored_at:
+            # Novo dia: a recência de todos os repositórios mudou, recalcula tudo
+            self._entries.clear()
+            self._repos.clear()
+            self._heap = []
+            self._scored_at = self.engine.now
+
+        changed = []
+        seen = set()
+        public = (repo for repo in repos if not repo.get('private', False))
+        for position, repo in enumerate(public):
+            key = repo.get('full_name') or repo['name']
+            seen.add(key)
+            self._repos[key] = repo
+            version = self.version(repo)
+            entry = self._entries.get(key)
+            if entry is None or entry[2] != version:
+                changed.append((key, position, version, repo))
+            elif entry[1] != position:
+                # Mesmo score, nova posição (desempate pela ordem da listagem)
+                self._set(key, entry[0], position, version)
+
+        for key in set(self._entries) - seen:
+            del self._entries[key]
+            del self._repos[key]
+
+        scores = self.engine.score_all([repo for _, _, _, repo in changed])
+        for (key, position, version, _), score in zip(changed, scores):
+            self._set(key, score, position, version)
+
+        # Reconstrói o heap quando as entradas obsoletas passam das válidas
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [(-score, position, key) for key, (score, position, _) in self._entries.items()]
+            heapq.heapify(self._heap)
+        return len(changed)
+
+    def top(self, k: int) -> List[Dict]:
+        """Os K repositórios de maior score (empates na ordem da listagem)"""
+        result = []
+        kept = []
+        taken = set()
+        while self._heap and len(result) < k:
+            item = heapq.heappop(self._heap)
+            neg_score, position, key = item
+            entry = self._entries.get(key)
+            # Obsoleta (repo removido ou rescorado) ou duplicada: sai do heap de vez
+            if entry is None or (entry[0], entry[1]) != (-neg_score, position) or key in taken:
+                continue
+            taken.add(key)
+            kept.append(item)
+            result.append(self._repos[key])
+        for item in kept:
+            heapq.heappush(self._heap, item)
+        return result
@@ -5,28 +5,23 @@ Responsável por revisar código e sugerir melhorias de qualidade
 
 import os
 import re
-import requests
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
+from ..core import GitHubAgent, GitHubClient
 
-class QualityAgent:
+
+class QualityAgent(GitHubAgent):
     """Agente responsável pela qualidade de código"""
 
-    def __init__(self, username: str, github_token: Optional[str] = None):
-        self.username = username
-        self.github_token = github_token or os.getenv('GITHUB_TOKEN')
-        self.api_base = 'https://api.github.com'
-        self.headers = {
-            'Accept': 'application/vnd.github.v3+json',
-        }
-        if self.github_token:
-            self.headers['Authorization'] = f'token {self.github_token}'
+    def __init__(self, username: str, github_token: Optional[str] = None,
+                 client: Optional[GitHubClient] = None):
+        super().__init__(username, github_token, client)
 
     def analyze_repo_structure(self, repo_name: str) -> Dict:
         """Analisa estrutura do repositório"""
         url = f'{self.api_base}/repos/{self.username}/{repo_name}/contents'
-        response = requests.get(url, headers=self.headers)
+        response = self.client.get(url)
 
         if response.status_code != 200:
             return {'error': 'Não foi possível acessar o repositório'}
@@ -71,7 +66,7 @@ class QualityAgent:
         github_dir = next((item for item in contents if item['name'] == '.github'), None)
         if github_dir:
             workflows_url = f"{github_dir['url']}/workflows"
-            workflows_response = requests.get(workflows_url, headers=self.headers)
+            workflows_response = self.client.get(workflows_url)
             if workflows_response.status_code == 200:
                 analysis['has_ci_cd'] = True
 
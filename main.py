@@ -6,9 +6,12 @@ Execute este arquivo para rodar todos os agentes
 import os
 import sys
 import json
+import time
 import argparse
+import functools
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 
 # Configurar encoding UTF-8 para Windows
 if sys.platform == 'win32':
@@ -24,23 +27,135 @@ from agents import (
     InsightsAgent,
     QualityAgent
 )
+from agents.insights import (
+    BaselineBuilder,
+    CommunityBaseline,
+    MetricsState,
+    MetricsStore,
+    RenderCache
+)
+from agents.projects import create_scoring_engine
+from agents.engagement import (
+    ActivityTracker,
+    BatchEngagement,
+    EventStore,
+    WebhookReceiver,
+    org_members
+)
+from agents.core import (
+    CircuitBreaker,
+    GitHubClient,
+    HTTPCache,
+    RateLimitScheduler,
+    RetryPolicy,
+    RequestMetrics,
+    RunContext,
+    SearchCache,
+    TaskGraph,
+    TopK,
+    TTLCache,
+    agent_scope
+)
+
+
+def agent_task(name: str):
+    """Atribui as requisições HTTP feitas pelo método ao agente informado (métricas)"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with agent_scope(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
 
 
 class AgentOrchestrator:
     """Orquestrador principal dos agentes"""
 
-    def __init__(self, config_path: str = 'config/agents_config.json'):
+    def __init__(self, config_path: str = 'config/agents_config.json',
+                 api_base: Optional[str] = None):
         self.config = self.load_config(config_path)
         self.username = self.config['github']['username']
         self.github_token = os.getenv('GITHUB_TOKEN', self.config['github'].get('token'))
 
+        # Cliente HTTP único (pool de conexões) compartilhado por todos os agentes
+        http_config = self.config.get('http', {})
+        cache_dir = http_config.get('cache_dir')
+        rate_limit_config = self.config.get('rate_limit', {})
+        retry_config = self.config.get('retry', {})
+        self.client = GitHubClient(
+            self.github_token,
+            # --api-base tem prioridade sobre http.api_base (ex: GitHub Enterprise, mock local)
+            api_base=api_base or http_config.get('api_base', 'https://api.github.com'),
+            pool_size=http_config.get('pool_size', 10),
+            timeout=http_config.get('timeout', 30),
+            cache=HTTPCache(cache_dir, http_config.get('cache_max_age_days', 8)) if cache_dir else None,
+            prefetch_pages=http_config.get('prefetch_pages', False),
+            max_concurrency=http_config.get('max_concurrency', 8),
+            use_graphql=http_config.get('use_graphql', False),
+            rate_limiter=RateLimitScheduler(
+                authenticated=bool(self.github_token),
+                reserve=rate_limit_config.get('reserve'),
+                max_wait=rate_limit_config.get('max_wait', 120)
+            ),
+            retry_policy=RetryPolicy(
+                max_retries=retry_config.get('max_retries', 3),
+                backoff_base=retry_config.get('backoff_base', 1.0),
+                backoff_max=retry_config.get('backoff_max', 30.0),
+                max_retry_after=retry_config.get('max_retry_after', 120.0)
+            ),
+            circuit_breaker=CircuitBreaker(
+                failure_threshold=retry_config.get('failure_threshold', 5),
+                recovery_timeout=retry_config.get('recovery_timeout', 60)
+            ),
+            metrics=RequestMetrics()
+        )
+
+        # Snapshot (usuário, repos, linguagens) carregado uma vez por execução
+        self.context = RunContext(self.client, self.username)
+
         # Inicializa agentes
-        self.profile_agent = ProfileAgent(self.username, self.github_token)
-        self.projects_agent = ProjectsAgent(self.username, self.github_token)
-        self.documentation_agent = DocumentationAgent(self.username, self.github_token)
-        self.engagement_agent = EngagementAgent(self.username, self.github_token)
-        self.insights_agent = InsightsAgent(self.username, self.github_token)
-        self.quality_agent = QualityAgent(self.username, self.github_token)
+        self.profile_agent = ProfileAgent(self.username, client=self.client, context=self.context)
+        self.projects_agent = ProjectsAgent(
+            self.username, client=self.client, context=self.context,
+            scoring=create_scoring_engine(self.config.get('projects', {}).get('scoring'))
+        )
+        self.documentation_agent = DocumentationAgent(self.username, client=self.client, context=self.context)
+        engagement_config = self.config.get('engagement', {})
+        event_store_path = engagement_config.get('event_store')
+        search_config = engagement_config.get('search_cache', {})
+        self.engagement_agent = EngagementAgent(
+            self.username,
+            client=self.client,
+            event_store=EventStore(event_store_path) if event_store_path else None,
+            repo_cache=TTLCache(
+                engagement_config.get('repo_cache'),
+                ttl=engagement_config.get('repo_cache_ttl_hours', 24) * 3600
+            ),
+            search_cache=SearchCache(
+                self.client,
+                search_config.get('path'),
+                ttl=search_config.get('ttl_hours', 24) * 3600,
+                stale_ttl=search_config.get('stale_hours', 24) * 3600,
+                max_entries=search_config.get('max_entries', 200)
+            )
+        )
+        insights_config = self.config.get('insights', {})
+        metrics_store_path = insights_config.get('metrics_store')
+        metrics_state_path = insights_config.get('metrics_state')
+        baseline_path = insights_config.get('community_baseline')
+        render_cache_path = insights_config.get('render_cache')
+        self.insights_agent = InsightsAgent(
+            self.username,
+            client=self.client,
+            context=self.context,
+            metrics_store=MetricsStore(metrics_store_path) if metrics_store_path else None,
+            metrics_state=MetricsState(metrics_state_path) if metrics_state_path else None,
+            engine=insights_config.get('engine', 'python'),
+            baseline=CommunityBaseline(baseline_path) if baseline_path else None,
+            render_cache=RenderCache(render_cache_path) if render_cache_path else None
+        )
+        self.quality_agent = QualityAgent(self.username, client=self.client)
 
     def load_config(self, config_path: str) -> dict:
         """Carrega configuração"""
@@ -55,15 +170,19 @@ class AgentOrchestrator:
 
         return config
 
+    @agent_task('profile')
     def run_profile_update(self):
         """Executa atualização do perfil"""
         print("\n🎨 Executando Agente de Perfil...")
         try:
             self.profile_agent.update_readme(self.config['profile'])
             print("✅ Perfil atualizado com sucesso!")
+            return True
         except Exception as e:
             print(f"❌ Erro ao atualizar perfil: {e}")
+            return False
 
+    @agent_task('projects')
     def run_projects_analysis(self):
         """Executa análise de projetos"""
         print("\n📂 Executando Agente de Projetos...")
@@ -73,9 +192,12 @@ class AgentOrchestrator:
             with open('PROJECTS_HEALTH.md', 'w', encoding='utf-8') as f:
                 f.write(report)
             print("✅ Análise de projetos concluída!")
+            return True
         except Exception as e:
             print(f"❌ Erro na análise de projetos: {e}")
+            return False
 
+    @agent_task('documentation')
     def run_documentation_check(self, repo_name: str = None):
         """Executa verificação de documentação"""
         print("\n📝 Executando Agente de Documentação...")
@@ -88,27 +210,229 @@ class AgentOrchestrator:
         except Exception as e:
             print(f"❌ Erro ao gerar documentação: {e}")
 
+    @agent_task('engagement')
     def run_engagement_analysis(self):
         """Executa análise de engajamento"""
         print("\n🤝 Executando Agente de Engajamento...")
         try:
-            self.engagement_agent.create_engagement_report('ENGAGEMENT_REPORT.md')
-            weekly = self.engagement_agent.generate_weekly_summary()
-            with open('WEEKLY_SUMMARY.md', 'w', encoding='utf-8') as f:
-                f.write(weekly)
+            # Eventos buscados e agregados uma vez para o relatório e o resumo semanal
+            activity_windows = self.engagement_agent.analyze_activity_windows()
+            self.write_engagement_reports(activity_windows)
             print("✅ Análise de engajamento concluída!")
+            return True
         except Exception as e:
             print(f"❌ Erro na análise de engajamento: {e}")
-
+            return False
+
+    def write_engagement_reports(self, activity_windows: dict):
+        """Grava o relatório de engajamento e o resumo semanal a partir dos contadores"""
+        self.engagement_agent.create_engagement_report('ENGAGEMENT_REPORT.md', activity_windows)
+        weekly = self.engagement_agent.generate_weekly_summary(activity_windows[7])
+        with open('WEEKLY_SUMMARY.md', 'w', encoding='utf-8') as f:
+            f.write(weekly)
+
+    @agent_task('engagement')
+    def run_batch_engagement(self, usernames: list = None, org: str = None):
+        """Executa a análise de engajamento para vários usuários (lista ou membros da org)"""
+        print("\n🤝 Executando Agente de Engajamento em lote...")
+        batch_config = self.config.get('engagement', {}).get('batch', {})
+        try:
+            usernames = list(usernames or [])
+            if org:
+                usernames.extend(org_members(self.client, org))
+            if not usernames:
+                print("❌ Nenhum usuário informado")
+                return False
+
+            # Cliente, histórico de eventos e caches compartilhados por todos os usuários
+            batch = BatchEngagement(
+                usernames,
+                client=self.client,
+                event_store=self.engagement_agent.event_store,
+                repo_cache=self.engagement_agent.repo_cache,
+                search_cache=self.engagement_agent.search_cache,
+                max_workers=batch_config.get('max_workers', 4)
+            )
+            start = time.perf_counter()
+            batch.run()
+            batch.create_reports(batch_config.get('output_dir', 'engagement_reports'))
+            print(f"✅ {len(batch.results)} usuários analisados em {time.perf_counter() - start:.1f}s")
+            for username, error in batch.errors.items():
+                print(f"⚠️  @{username}: {error}")
+            return not batch.errors
+        except Exception as e:
+            print(f"❌ Erro na análise de engajamento em lote: {e}")
+            return False
+
+    @agent_task('engagement')
+    def run_webhook_server(self, host: str = None, port: int = None):
+        """Recebe webhooks do GitHub e mantém os relatórios de engajamento atualizados"""
+        webhook_config = self.config.get('engagement', {}).get('webhook', {})
+        host = host or webhook_config.get('host', '127.0.0.1')
+        port = port or webhook_config.get('port', 8787)
+        secret = os.getenv('GITHUB_WEBHOOK_SECRET', webhook_config.get('secret', ''))
+        if not secret or secret.startswith('${'):
+            print("❌ Configure GITHUB_WEBHOOK_SECRET (mesmo segredo cadastrado no webhook)")
+            return False
+
+        print("\n🪝 Iniciando receptor de webhooks...")
+        # Histórico inicial buscado uma vez; depois disso só os webhooks atualizam os contadores
+        tracker = ActivityTracker()
+        tracker.seed(self.engagement_agent.get_user_events(max(tracker.windows)))
+        receiver = WebhookReceiver(
+            self.username,
+            secret,
+            tracker,
+            on_event=lambda event: self.write_engagement_reports(tracker.result())
+        )
+        self.write_engagement_reports(tracker.result())
+
+        server = receiver.make_server(host, port)
+        print(f"✅ Ouvindo em http://{host}:{port} (GET /activity para os contadores)")
+        print("   Pressione Ctrl+C para encerrar")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n👋 Receptor de webhooks encerrado")
+        finally:
+            server.server_close()
+        return True
+
+    @agent_task('insights')
     def run_insights_generation(self):
         """Executa geração de insights"""
         print("\n📊 Executando Agente de Insights...")
         try:
             self.insights_agent.create_insights_dashboard('INSIGHTS_DASHBOARD.md')
             print("✅ Dashboard de insights gerado!")
+            return True
         except Exception as e:
             print(f"❌ Erro ao gerar insights: {e}")
+            return False
+
+    @agent_task('insights')
+    def run_spotlights(self, top_n: int = None, output_dir: str = 'spotlights'):
+        """Gera spotlights dos repositórios a partir da listagem (sem requisições por repo)"""
+        print("\n🔦 Gerando spotlights dos repositórios...")
+        try:
+            start = time.perf_counter()
+            files = self.insights_agent.generate_spotlights(
+                output_dir, top_n=top_n,
+                max_workers=self.config.get('execution', {}).get('max_workers', 4)
+            )
+            print(f"✅ {len(files)} spotlights salvos em {output_dir}/ ({time.perf_counter() - start:.1f}s)")
+            return True
+        except Exception as e:
+            print(f"❌ Erro ao gerar spotlights: {e}")
+            return False
+
+    @agent_task('insights')
+    def run_org_analysis(self, org: str, output_file: str = 'ORG_REPORT.md'):
+        """
+        Métricas, saúde e top projetos de uma organização numa única passada
+        Cada página de /orgs/{org}/repos é agregada e descartada: a memória depende
+        só dos contadores e dos K projetos em destaque, não da quantidade de repos
+        """
+        print(f"\n🏢 Analisando organização @{org}...")
+        try:
+            insights = InsightsAgent(org, client=self.client, org=org)
+            projects = ProjectsAgent(org, client=self.client, org=org, scoring=self.projects_agent.scoring)
+            top_n = self.config.get('projects', {}).get('featured_count', 6)
+            projects.scoring.refresh()
+
+            metrics = insights.new_total_metrics()
+            health = projects.new_health_stats()
+            top = TopK(top_n)
+
+            def rank(page: list):
+                # Score da página numa passada do motor; só os campos exibidos ficam no top-K
+                for repo, score in zip(page, projects.scoring.score_all(page)):
+                    top.add(score, {
+                        key: repo.get(key) for key in
+                        ('name', 'html_url', 'stargazers_count', 'forks_count', 'language')
+                    })
+                page.clear()
+
+            start = time.perf_counter()
+            page = []
+            for repo in self.client.paginate(f'/orgs/{org}/repos', params={'per_page': 100}):
+                projects.add_repo_health(health, repo)
+                if repo.get('private', False):
+                    continue
+                insights.add_repo_metrics(metrics, repo)
+                page.append(repo)
+                if len(page) == 100:
+                    rank(page)
+            rank(page)
+            insights.finish_total_metrics(metrics)
+            elapsed = time.perf_counter() - start
+
+            overview = {
+                key: metrics[key] for key in (
+                    'total_repos', 'total_stars', 'total_forks', 'total_watchers',
+                    'avg_stars_per_repo', 'total_size'
+                )
+            }
+            overview['followers'] = self.client.get_json(f'/orgs/{org}').get('followers', 0)
+            overview['weekly'] = None
+
+            report = [
+                f"# 🏢 Organização: {org}",
+                "",
+                f"Gerado em: {datetime.now().strftime('%d/%m/%Y às %H:%M')}",
+                "",
+                InsightsAgent._render_overview(overview)
+            ]
+            if metrics['most_starred_repo']:
+                report.append(InsightsAgent._render_highlight(metrics['most_starred_repo']))
+            if metrics['languages']:
+                report.append(InsightsAgent._render_languages({
+                    'top': metrics['languages'].most_common(5),
+                    'total_repos': metrics['total_repos']
+                }))
+            if metrics['topics']:
+                report.append(InsightsAgent._render_topics(metrics['topics'].most_common(5)))
+
+            report.extend([
+                f"## 🏆 Top {top_n} Projetos",
+                "",
+                "| # | Repositório | Score | ⭐ Stars | 🍴 Forks | Linguagem |",
+                "|---|------------|-------|---------|---------|-----------|"
+            ])
+            for position, (repo, score) in enumerate(top.scored(), 1):
+                report.append(
+                    f"| {position} | [{repo['name']}]({repo['html_url']}) | {score:g} "
+                    f"| {repo['stargazers_count']} | {repo['forks_count']} | {repo['language'] or 'N/A'} |"
+                )
+            report.extend(["", projects.generate_health_report(health)])
+
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write("\n".join(report))
+
+            print(f"✅ {health['total_repos']} repositórios agregados em {elapsed:.1f}s")
+            print(f"✅ Relatório da organização salvo em {output_file}")
+            return True
+        except Exception as e:
+            print(f"❌ Erro na análise da organização: {e}")
+            return False
+
+    @agent_task('insights')
+    def run_baseline_build(self, users: int = 100):
+        """Amostra usuários públicos e amplia a base de comparação com a comunidade"""
+        print(f"\n📐 Ampliando base da comunidade ({users} usuários)...")
+        baseline = self.insights_agent.baseline
+        if baseline is None:
+            print("❌ Configure insights.community_baseline")
+            return False
+        try:
+            added = BaselineBuilder(self.client, baseline).build(users)
+            print(f"✅ {added} usuários agregados (total na base: {baseline.users})")
+            return True
+        except Exception as e:
+            print(f"❌ Erro ao construir a base da comunidade: {e}")
+            return False
 
+    @agent_task('quality')
     def run_quality_check(self, repo_name: str = None):
         """Executa verificação de qualidade"""
         print("\n🔍 Executando Agente de Qualidade...")
@@ -123,15 +447,38 @@ class AgentOrchestrator:
         except Exception as e:
             print(f"❌ Erro ao verificar qualidade: {e}")
 
+    @agent_task('snapshot')
+    def load_snapshot(self):
+        """Carrega o snapshot compartilhado (usuário e repositórios)"""
+        print("\n📥 Carregando dados do GitHub...")
+        user = self.context.user
+        repos = self.context.repos
+        print(f"✅ {len(repos)} repositórios carregados para @{user.get('login', self.username)}")
+        return True
+
     def run_all(self):
         """Executa todos os agentes"""
         print("🚀 Iniciando execução de todos os agentes...")
         print(f"⏰ Hora: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
 
-        self.run_profile_update()
-        self.run_projects_analysis()
-        self.run_engagement_analysis()
-        self.run_insights_generation()
+        # Nova execução: dados frescos, baixados uma única vez para todos os agentes
+        self.context.invalidate()
+
+        # Agentes são I/O bound e independentes: rodam em paralelo após o snapshot
+        graph = TaskGraph(max_workers=self.config.get('execution', {}).get('max_workers', 4))
+        graph.add('snapshot', self.load_snapshot)
+        graph.add('profile', self.run_profile_update, depends_on=['snapshot'])
+        graph.add('projects', self.run_projects_analysis, depends_on=['snapshot'])
+        graph.add('engagement', self.run_engagement_analysis)
+        graph.add('insights', self.run_insights_generation, depends_on=['snapshot'])
+
+        start = time.perf_counter()
+        results = graph.run()
+        print("\n" + TaskGraph.format_summary(results, time.perf_counter() - start))
+
+        retry_stats = self.client.retry_policy.stats()
+        if retry_stats['retries']:
+            print(f"🔁 Retentativas: {retry_stats['retries']} ({retry_stats['backoff_seconds']}s em backoff)")
 
         print("\n✨ Execução completa de todos os agentes!")
         print("📁 Arquivos gerados:")
@@ -142,6 +489,29 @@ class AgentOrchestrator:
         print("  - WEEKLY_SUMMARY.md")
         print("  - INSIGHTS_DASHBOARD.md")
 
+    def shutdown(self):
+        """Finaliza a execução: persiste caches e fecha as conexões"""
+        self.engagement_agent.search_cache.close()
+        if self.client.cache is not None:
+            removed = self.client.cache.prune()
+            if removed:
+                print(f"🧹 Cache HTTP: {removed} entradas sem uso removidas")
+        self.write_metrics()
+        self.client.close()
+
+    def write_metrics(self):
+        """Salva as métricas HTTP da execução (JSON e textfile do Prometheus)"""
+        metrics_config = self.config.get('metrics', {})
+        json_path = metrics_config.get('json_path')
+        prometheus_path = metrics_config.get('prometheus_path')
+        if json_path:
+            self.client.metrics.write_json(json_path)
+        if prometheus_path:
+            self.client.metrics.write_prometheus(prometheus_path)
+        if json_path or prometheus_path:
+            total = self.client.metrics.summary()['total_requests']
+            print(f"\n📈 Métricas HTTP salvas ({total} requisições)")
+
     def interactive_menu(self):
         """Menu interativo"""
         while True:
@@ -160,6 +530,7 @@ class AgentOrchestrator:
             print("\n" + "=" * 60)
 
             choice = input("\nDigite sua escolha: ").strip()
+            self.context.invalidate()
 
             if choice == '0':
                 print("\n👋 Até logo!")
@@ -186,6 +557,59 @@ class AgentOrchestrator:
             input("\nPressione ENTER para continuar...")
 
 
+def dispatch(orchestrator: AgentOrchestrator, args: argparse.Namespace):
+    """Executa o modo escolhido na linha de comando"""
+    # Modo interativo
+    if args.interactive:
+        orchestrator.interactive_menu()
+        return
+
+    # Modo lote (vários usuários)
+    if args.users or (args.org and args.agent == 'engagement'):
+        usernames = args.users.split(',') if args.users else []
+        orchestrator.run_batch_engagement(usernames, org=args.org if args.agent == 'engagement' else None)
+        return
+
+    # Modo organização (métricas, saúde e top projetos numa única passada)
+    if args.org:
+        orchestrator.run_org_analysis(args.org)
+        return
+
+    # Base da comunidade (percentis reais em compare_with_community)
+    if args.baseline:
+        orchestrator.run_baseline_build(args.baseline)
+        return
+
+    # Spotlights em lote
+    if args.spotlights is not None:
+        orchestrator.run_spotlights(args.spotlights or None)
+        return
+
+    # Modo webhook
+    if args.webhook:
+        orchestrator.run_webhook_server(port=args.port)
+        return
+
+    # Modo CLI
+    if args.agent == 'profile':
+        orchestrator.run_profile_update()
+    elif args.agent == 'projects':
+        orchestrator.run_projects_analysis()
+    elif args.agent == 'docs':
+        orchestrator.run_documentation_check(args.repo)
+    elif args.agent == 'engagement':
+        orchestrator.run_engagement_analysis()
+    elif args.agent == 'insights':
+        orchestrator.run_insights_generation()
+    elif args.agent == 'quality':
+        orchestrator.run_quality_check(args.repo)
+    elif args.agent == 'all':
+        orchestrator.run_all()
+    else:
+        # Se nenhum agente especificado, mostra menu
+        orchestrator.interactive_menu()
+
+
 def main():
     """Função principal"""
     parser = argparse.ArgumentParser(
@@ -205,6 +629,43 @@ def main():
         action='store_true',
         help='Modo interativo'
     )
+    parser.add_argument(
+        '--users',
+        help='Usuários separados por vírgula (engajamento em lote)'
+    )
+    parser.add_argument(
+        '--org',
+        help='Organização: repositórios (insights/projetos) ou, com --agent engagement, membros'
+    )
+    parser.add_argument(
+        '--baseline',
+        type=int,
+        metavar='N',
+        help='Amostra N usuários públicos para a base de comparação com a comunidade'
+    )
+    parser.add_argument(
+        '--spotlights',
+        type=int,
+        nargs='?',
+        const=0,
+        metavar='N',
+        help='Gera spotlights em spotlights/ (todos os repositórios ou os N com mais estrelas)'
+    )
+    parser.add_argument(
+        '--webhook',
+        action='store_true',
+        help='Inicia o receptor local de webhooks (engajamento em tempo real)'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        help='Porta do receptor de webhooks'
+    )
+    parser.add_argument(
+        '--api-base',
+        metavar='URL',
+        help='URL base da API (padrão: http.api_base da configuração ou https://api.github.com)'
+    )
     parser.add_argument(
         '--config',
         default='config/agents_config.json',
@@ -220,31 +681,14 @@ def main():
         print("   Configure: export GITHUB_TOKEN=seu_token_aqui\n")
 
     # Inicializa orquestrador
-    orchestrator = AgentOrchestrator(args.config)
-
-    # Modo interativo
-    if args.interactive:
-        orchestrator.interactive_menu()
-        return
-
-    # Modo CLI
-    if args.agent == 'profile':
-        orchestrator.run_profile_update()
-    elif args.agent == 'projects':
-        orchestrator.run_projects_analysis()
-    elif args.agent == 'docs':
-        orchestrator.run_documentation_check(args.repo)
-    elif args.agent == 'engagement':
-        orchestrator.run_engagement_analysis()
-    elif args.agent == 'insights':
-        orchestrator.run_insights_generation()
-    elif args.agent == 'quality':
-        orchestrator.run_quality_check(args.repo)
-    elif args.agent == 'all':
-        orchestrator.run_all()
-    else:
-        # Se nenhum agente especificado, mostra menu
-        orchestrator.interactive_menu()
+    orchestrator = AgentOrchestrator(args.config, api_base=args.api_base)
+
+    # shutdown() roda mesmo se um agente falhar: métricas e caches das execuções com erro
+    # são justamente as mais úteis para diagnóstico
+    try:
+        dispatch(orchestrator, args)
+    finally:
+        orchestrator.shutdown()
 
 
 if __name__ == '__main__':
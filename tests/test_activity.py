@@ -0,0 +1,88 @@
+import random
+from datetime import datetime, timedelta
+
+from agents.engagement.activity import ActivityAggregator
+
+NOW = datetime(2026, 3, 15, 10, 30, 0)
+EVENT_TYPES = ['PushEvent', 'PullRequestEvent', 'IssuesEvent', 'IssueCommentEvent',
+               'CreateEvent', 'WatchEvent', 'ForkEvent', 'DeleteEvent']
+
+
+def make_event(rng):
+    created_at = NOW - timedelta(seconds=rng.randint(0, 400 * 86400))
+    event_type = rng.choice(EVENT_TYPES)
+    payload = {}
+    if event_type == 'PushEvent':
+        payload['commits'] = [{'sha': str(i)} for i in range(rng.randint(0, 4))]
+    elif event_type == 'IssuesEvent':
+        payload['action'] = rng.choice(['opened', 'closed'])
+    elif event_type == 'CreateEvent':
+        payload['ref_type'] = rng.choice(['repository', 'branch'])
+    return {
+        'type': event_type,
+        'created_at': created_at.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'repo': {'name': rng.choice(['dev/app', 'dev/lib', 'org/site'])} if rng.random() < 0.9 else {},
+        'payload': payload
+    }
+
+
+def reference_activity(events, days):
+    """analyze_activity original: uma passada por janela sobre os eventos filtrados"""
+    since = NOW - timedelta(days=days)
+    events = [e for e in events if datetime.strptime(e['created_at'], '%Y-%m-%dT%H:%M:%SZ') >= since]
+    activity = {
+        'total_events': len(events), 'commits': 0, 'pull_requests': 0, 'issues_opened': 0,
+        'issues_commented': 0, 'repos_created': 0, 'repos_starred': 0, 'repos_forked': 0,
+        'event_types': {}
+    }
+    active_days = set()
+    repo_activity = {}
+    for event in events:
+        event_type = event['type']
+        payload = event['payload']
+        activity['event_types'][event_type] = activity['event_types'].get(event_type, 0) + 1
+        active_days.add(datetime.strptime(event['created_at'], '%Y-%m-%dT%H:%M:%SZ').date())
+        if event_type == 'PushEvent':
+            activity['commits'] += len(payload.get('commits', []))
+        elif event_type == 'PullRequestEvent':
+            activity['pull_requests'] += 1
+        elif event_type == 'IssuesEvent' and payload.get('action') == 'opened':
+            activity['issues_opened'] += 1
+        elif event_type == 'IssueCommentEvent':
+            activity['issues_commented'] += 1
+        elif event_type == 'CreateEvent' and payload.get('ref_type') == 'repository':
+            activity['repos_created'] += 1
+        elif event_type == 'WatchEvent':
+            activity['repos_starred'] += 1
+        elif event_type == 'ForkEvent':
+            activity['repos_forked'] += 1
+        repo_name = event['repo'].get('name')
+        if repo_name:
+            repo_activity[repo_name] = repo_activity.get(repo_name, 0) + 1
+    activity['most_active_repo'] = max(repo_activity.items(), key=lambda x: x[1]) if repo_activity else None
+    activity['active_days'] = sorted(active_days, reverse=True)
+    activity['active_days_count'] = len(active_days)
+    return activity
+
+
+def test_single_pass_matches_one_pass_per_window():
+    rng = random.Random(12)
+    events = [make_event(rng) for _ in range(2000)]
+    result = ActivityAggregator(now=NOW).add_all(events).result()
+
+    assert sorted(result) == [7, 30, 90, 365]
+    for days, activity in result.items():
+        expected = reference_activity(events, days)
+        activity = dict(activity)
+        assert isinstance(activity.pop('current_streak'), int)
+        assert isinstance(activity.pop('longest_streak'), int)
+        activity['active_days'] = sorted(activity['active_days'], reverse=True)
+        assert activity == expected, days
+
+
+def test_events_outside_every_window_are_ignored():
+    old = {'type': 'PushEvent', 'created_at': '2020-01-01T00:00:00Z', 'payload': {'commits': [{}]}}
+    result = ActivityAggregator(windows=(7,), now=NOW).add_all([old]).result()
+    assert result[7]['total_events'] == 0
+    assert result[7]['active_days'] == []
+    assert result[7]['longest_streak'] == 0
@@ -0,0 +1,34 @@
+from agents import (
+    DocumentationAgent,
+    EngagementAgent,
+    InsightsAgent,
+    ProfileAgent,
+    ProjectsAgent,
+    QualityAgent
+)
+from agents.core import GitHubAgent, GitHubClient, RunContext
+
+AGENTS = (ProfileAgent, ProjectsAgent, DocumentationAgent, EngagementAgent, InsightsAgent, QualityAgent)
+
+
+def test_agents_share_injected_client_and_context():
+    client = GitHubClient('token', api_base='http://localhost:8000/')
+    context = RunContext(client, 'dev')
+    for agent_class in AGENTS:
+        kwargs = {'client': client}
+        if 'context' in agent_class.__init__.__code__.co_varnames:
+            kwargs['context'] = context
+        agent = agent_class('dev', **kwargs)
+        assert isinstance(agent, GitHubAgent)
+        assert agent.client is client
+        assert agent.context is kwargs.get('context')
+        assert agent.api_base == 'http://localhost:8000'
+        assert agent.headers['Authorization'] == 'token token'
+
+
+def test_standalone_agent_creates_own_client(monkeypatch):
+    monkeypatch.delenv('GITHUB_TOKEN', raising=False)
+    first, second = ProfileAgent('dev', 'abc'), ProfileAgent('dev', 'abc')
+    assert first.client is not second.client
+    assert first.github_token == 'abc'
+    assert first.context is None
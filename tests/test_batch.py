@@ -0,0 +1,41 @@
+from agents.core import GitHubClient
+from agents.engagement import BatchEngagement
+from agents.engagement.engagement_agent import EngagementAgent
+
+
+def activity(active_days, commits, pull_requests=0):
+    return {
+        'active_days_count': active_days, 'commits': commits, 'pull_requests': pull_requests,
+        'issues_opened': 0, 'total_events': commits + pull_requests, 'current_streak': 1
+    }
+
+
+ACTIVITY = {
+    'ana': activity(10, 5),
+    'bia': activity(10, 9),
+    'caio': activity(3, 40, 2),
+}
+
+
+def test_run_shares_client_and_ranks_users(monkeypatch):
+    def analyze(self, windows):
+        if self.username == 'falha':
+            raise RuntimeError('usuário não encontrado')
+        return {days: ACTIVITY[self.username] for days in windows}
+
+    monkeypatch.setattr(EngagementAgent, 'analyze_activity_windows', analyze)
+    client = GitHubClient('token')
+    batch = BatchEngagement([' ana', 'bia', 'ana', '', 'caio', 'falha'], client=client, max_workers=3)
+
+    assert batch.usernames == ['ana', 'bia', 'caio', 'falha']
+    assert all(agent.client is client for agent in batch.agents.values())
+
+    results = batch.run(windows=(30, 7, 30))
+    assert set(results) == {'ana', 'bia', 'caio'}
+    assert sorted(results['ana']) == [7, 30]
+    assert batch.errors == {'falha': 'usuário não encontrado'}
+
+    assert [row['username'] for row in batch.leaderboard(30)] == ['bia', 'ana', 'caio']
+    text = batch.format_leaderboard(30)
+    assert '| 1 | [@bia](https://github.com/bia) | 10 | 9 |' in text
+    assert '- @falha: usuário não encontrado' in text
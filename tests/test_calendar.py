@@ -0,0 +1,96 @@
+import random
+from collections import Counter
+from datetime import date, datetime, timedelta
+
+from agents.engagement.calendar import ContributionCalendar
+
+TODAY = date(2026, 3, 15)
+
+
+def build(seed, events=1500, span_days=400):
+    rng = random.Random(seed)
+    calendar = ContributionCalendar()
+    per_day = Counter()
+    for _ in range(events):
+        when = datetime(2026, 3, 15, 23) - timedelta(hours=rng.randint(0, 24 * span_days))
+        event_type = rng.choice(['PushEvent', 'IssuesEvent', 'WatchEvent'])
+        calendar.add(when, event_type)
+        per_day[when.date()] += 1
+    return calendar, per_day
+
+
+def reference_streaks(per_day, today):
+    days = sorted(per_day)
+    longest = run = 0
+    previous = None
+    for day in days:
+        run = run + 1 if previous and (day - previous).days == 1 else 1
+        longest = max(longest, run)
+        previous = day
+    current = 0
+    day = today if per_day.get(today) else today - timedelta(days=1)
+    while per_day.get(day):
+        current += 1
+        day -= timedelta(days=1)
+    return current, longest
+
+
+def test_queries_match_per_day_counts():
+    calendar, per_day = build(13, events=600)
+    start, end = TODAY - timedelta(days=120), TODAY
+    expected = [per_day.get(start + timedelta(days=i), 0) for i in range((end - start).days + 1)]
+    assert calendar.counts(start, end) == expected
+    assert calendar.active_days(start, end) == sum(1 for n in expected if n)
+    assert calendar.active_dates(start, end) == sorted(
+        (day for day in per_day if start <= day <= end), reverse=True
+    )
+    assert (calendar.current_streak(TODAY), calendar.longest_streak()) == reference_streaks(per_day, TODAY)
+    # Intervalos fora do histórico
+    assert calendar.counts(TODAY + timedelta(days=1), TODAY + timedelta(days=3)) == [0, 0, 0]
+    assert calendar.counts(TODAY, TODAY - timedelta(days=1)) == []
+
+
+def test_streaks_on_sparse_history():
+    calendar = ContributionCalendar()
+    for offset in (0, 1, 2, 5, 6, 9, 10, 11, 12):
+        calendar.add(datetime(2026, 3, 15, 8) - timedelta(days=offset), 'PushEvent')
+    assert calendar.longest_streak() == 4
+    assert calendar.current_streak(TODAY) == 3
+    # Hoje ainda sem atividade: conta até ontem
+    assert calendar.current_streak(TODAY + timedelta(days=1)) == 3
+    assert calendar.current_streak(TODAY + timedelta(days=2)) == 0
+    assert ContributionCalendar().current_streak(TODAY) == 0
+
+
+def test_heatmap_weeks_start_on_sunday():
+    calendar, per_day = build(5, events=800, span_days=120)
+    grid = calendar.heatmap(weeks=4, today=TODAY)
+    assert len(grid) == 4 and all(len(column) == 7 for column in grid)
+    # TODAY é domingo: primeira célula da última semana; o resto da semana é futuro
+    assert TODAY.weekday() == 6
+    assert grid[-1] == [per_day.get(TODAY, 0)] + [0] * 6
+    first_sunday = TODAY - timedelta(days=21)
+    assert grid[0] == [per_day.get(first_sunday + timedelta(days=i), 0) for i in range(7)]
+    assert calendar.active_days_per_week(4, TODAY) == [sum(1 for n in column if n) for column in grid]
+
+
+def test_dates_before_origin_and_per_type_counts():
+    calendar = ContributionCalendar()
+    calendar.add(datetime(2026, 3, 10, 9), 'PushEvent', count=3)
+    calendar.add(datetime(2026, 3, 1, 22), 'WatchEvent')
+    calendar.add_event({'type': 'PushEvent', 'created_at': '2026-03-12T10:00:00Z'})
+    assert calendar.origin == date(2026, 3, 1)
+    assert calendar.counts(date(2026, 3, 1), date(2026, 3, 12), 'PushEvent')[9:] == [3, 0, 1]
+    assert calendar.counts(date(2026, 3, 1), date(2026, 3, 2), 'WatchEvent') == [1, 0]
+    assert calendar.weekday_histogram()[date(2026, 3, 10).weekday()] == 3
+    assert calendar.hour_histogram()[22] == 1
+
+
+def test_serialization_roundtrip():
+    calendar, _ = build(21, events=300)
+    restored = ContributionCalendar.from_bytes(calendar.to_bytes())
+    assert restored.origin == calendar.origin
+    assert restored.days == calendar.days
+    assert restored.weekday_histogram() == calendar.weekday_histogram()
+    assert restored.hour_histogram() == calendar.hour_histogram()
+    assert ContributionCalendar.from_bytes(b'').origin is None
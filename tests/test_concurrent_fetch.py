@@ -0,0 +1,46 @@
+import contextvars
+
+from agents.core import ConcurrentFetcher
+
+current = contextvars.ContextVar('current', default=None)
+
+
+class FakeResponse:
+    def __init__(self, url):
+        self.url = url
+
+    def raise_for_status(self):
+        if self.url.endswith('/erro'):
+            raise ValueError(self.url)
+
+    def json(self):
+        return {'url': self.url, 'context': current.get()}
+
+
+class FakeClient:
+    max_concurrency = 4
+
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, priority=None):
+        self.calls.append(url)
+        return FakeResponse(url)
+
+
+def test_fetch_json_collects_results_and_errors():
+    client = FakeClient()
+    results = {}
+    current.set('insights')
+    urls = [f'/repos/{i}' for i in range(20)] + ['/repos/0', '/erro']
+    errors = ConcurrentFetcher(client).fetch_json(urls, results.__setitem__)
+
+    assert sorted(client.calls) == sorted(set(urls))
+    assert list(errors) == ['/erro']
+    assert len(results) == 20
+    # O contexto de quem chamou (agente atual) chega às threads
+    assert {data['context'] for data in results.values()} == {'insights'}
+
+
+def test_fetch_json_empty():
+    assert ConcurrentFetcher(FakeClient(), max_concurrency=0).fetch_json([], print) == {}
@@ -0,0 +1,69 @@
+from datetime import datetime
+
+from agents.engagement import EventStore
+
+
+def make_event(event_id, day, event_type='PushEvent', repo='dev/app', **payload):
+    return {
+        'id': str(event_id),
+        'type': event_type,
+        'created_at': f'2026-03-{day:02d}T12:00:00Z',
+        'repo': {'name': repo},
+        'payload': payload
+    }
+
+
+class FakeClient:
+    """Eventos do mais novo para o mais antigo, como /users/{user}/events"""
+
+    def __init__(self, events):
+        self.events = events
+        self.served = 0
+
+    def paginate(self, path, params=None):
+        for event in sorted(self.events, key=lambda e: -int(e['id'])):
+            self.served += 1
+            yield event
+
+
+def test_ingest_only_downloads_new_events(tmp_path):
+    store = EventStore(str(tmp_path / 'events.sqlite3'))
+    client = FakeClient([make_event(i, i) for i in range(1, 6)])
+    assert store.ingest(client, 'dev') == 5
+    assert store.last_event_id('dev') == 5
+
+    client.events.append(make_event(6, 6))
+    client.served = 0
+    assert store.ingest(client, 'dev') == 1
+    # Para no primeiro evento já armazenado
+    assert client.served == 2
+    assert store.ingest(client, 'dev') == 0
+    assert store.count('dev') == 6
+    assert store.count('outro') == 0
+
+
+def test_history_survives_reopen_and_api_window(tmp_path):
+    path = str(tmp_path / 'events.sqlite3')
+    EventStore(path).ingest(FakeClient([make_event(1, 1), make_event(2, 2)]), 'dev')
+    # A API já não expõe os eventos antigos: o histórico local continua com eles
+    store = EventStore(path)
+    store.ingest(FakeClient([make_event(3, 3)]), 'dev')
+    assert [event['id'] for event in store.read('dev')] == ['3', '2', '1']
+
+
+def test_read_filters_period_and_compacts_payload(tmp_path):
+    store = EventStore(str(tmp_path / 'events.sqlite3'))
+    commits = [{'sha': 'abc', 'message': 'x' * 500, 'author': {'name': 'dev'}}]
+    store.ingest(FakeClient([
+        make_event(1, 1, commits=commits, size=1, head='f' * 40),
+        make_event(2, 10, 'CreateEvent', ref_type='repository', ref=None),
+        make_event(3, 20, 'WatchEvent', action='started')
+    ]), 'dev')
+
+    events = store.read('dev', since=datetime(2026, 3, 5), until=datetime(2026, 3, 20, 12))
+    assert [event['type'] for event in events] == ['CreateEvent']
+    assert events[0]['repo'] == {'name': 'dev/app'}
+    assert events[0]['payload'] == {'ref_type': 'repository', 'ref': None}
+
+    push = store.read('dev', until=datetime(2026, 3, 2))[0]
+    assert push['payload'] == {'size': 1, 'commits': [{'sha': 'abc', 'message': 'x' * 200}]}
@@ -0,0 +1,131 @@
+import re
+
+import pytest
+
+from agents.core import GraphQLBackend
+
+
+def node(full_name):
+    owner, name = full_name.split('/')
+    return {
+        'name': name,
+        'nameWithOwner': full_name,
+        'url': f'https://github.com/{full_name}',
+        'description': None,
+        'homepageUrl': None,
+        'isFork': False,
+        'isPrivate': False,
+        'isArchived': False,
+        'stargazerCount': 1,
+        'forkCount': 0,
+        'diskUsage': 10,
+        'createdAt': '2024-01-01T00:00:00Z',
+        'updatedAt': '2024-01-02T00:00:00Z',
+        'pushedAt': '2024-01-02T00:00:00Z',
+        'owner': {'login': owner},
+        'watchers': {'totalCount': 0},
+        'issues': {'totalCount': 1},
+        'pullRequests': {'totalCount': 2},
+        'primaryLanguage': {'name': 'Python'},
+        'licenseInfo': None,
+        'repositoryTopics': {'nodes': []},
+        'languages': {'edges': [{'size': 100, 'node': {'name': 'Python'}}]}
+    }
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class FakeClient:
+    """Responde como a API GraphQL: aliases de repositórios inexistentes vêm null com erro"""
+
+    api_base = 'https://api.github.com'
+
+    def __init__(self, existing):
+        self.existing = set(existing)
+        self.posts = 0
+
+    def build_url(self, path):
+        return self.api_base + path
+
+    def post(self, url, json=None):
+        self.posts += 1
+        variables = json['variables']
+        data, errors = {}, []
+        if 'owner' in variables:
+            aliases = {'repository': (variables['owner'], variables['name'])}
+        else:
+            aliases = {
+                f'r{i}': (variables[f'o{i}'], variables[f'n{i}'])
+                for i in map(int, re.findall(r'\$o(\d+):', json['query']))
+            }
+        for alias, (owner, name) in aliases.items():
+            full_name = f'{owner}/{name}'
+            if full_name in self.existing:
+                data[alias] = node(full_name)
+            else:
+                data[alias] = None
+                errors.append({'type': 'NOT_FOUND', 'path': [alias],
+                               'message': f"Could not resolve to a Repository with the name '{full_name}'."})
+        payload = {'data': data}
+        if errors:
+            payload['errors'] = errors
+        return FakeResponse(payload)
+
+
+def test_get_repos_keeps_partial_data():
+    client = FakeClient(['dev/a', 'dev/c'])
+    backend = GraphQLBackend(client)
+    repos = backend.get_repos(['dev/a', 'dev/removido', 'dev/c'])
+    assert sorted(repos) == ['dev/a', 'dev/c']
+    assert repos['dev/a']['open_issues_count'] == 3
+    assert repos['dev/a']['languages'] == {'Python': 100}
+    assert client.posts == 1
+
+
+def test_query_raises_without_data():
+    class NoData(FakeClient):
+        def post(self, url, json=None):
+            return FakeResponse({'data': None, 'errors': [{'message': 'Bad credentials'}]})
+
+    backend = GraphQLBackend(NoData([]))
+    with pytest.raises(RuntimeError, match='Bad credentials'):
+        backend.get_repos(['dev/a'])
+
+
+def test_query_is_strict_by_default():
+    backend = GraphQLBackend(FakeClient(['dev/a']))
+    with pytest.raises(RuntimeError, match='NOT_FOUND|Could not resolve'):
+        backend.query('query($o0: String!, $n0: String!) { r0: repository(owner: $o0, name: $n0) { name } }',
+                      {'o0': 'dev', 'n0': 'x'})
+
+
+def test_get_repo_uses_bounded_memo():
+    client = FakeClient(['dev/a', 'dev/b', 'dev/c'])
+    backend = GraphQLBackend(client, memo_size=2)
+    backend.get_repos(['dev/a', 'dev/b', 'dev/c'])
+    assert len(backend._repo_memo.entries) == 2
+
+    posts = client.posts
+    assert backend.get_repo('dev', 'c')['full_name'] == 'dev/c'
+    assert client.posts == posts
+    # 'dev/a' saiu do memo (LRU): busca de novo
+    backend.get_repo('dev', 'a')
+    assert client.posts == posts + 1
+
+    with pytest.raises(RuntimeError, match='não encontrado'):
+        backend.get_repo('dev', 'removido')
+
+
+def test_enterprise_endpoint():
+    client = FakeClient([])
+    client.api_base = 'https://ghe.example.com/api/v3'
+    assert GraphQLBackend(client).endpoint == 'https://ghe.example.com/api/graphql'
@@ -0,0 +1,109 @@
+import json
+import os
+import time
+
+import requests
+
+from agents.core import GitHubClient, HTTPCache
+
+
+def make_response(status=200, body=None, headers=None, url='https://api.github.com/x'):
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body if body is not None else {}).encode('utf-8')
+    response.headers.update(headers or {})
+    response.url = url
+    return response
+
+
+class FakeSession:
+    """Responde /user com o login informado e registra as requisições"""
+
+    def __init__(self, login='dev', etag='"v1"'):
+        self.login = login
+        self.etag = etag
+        self.calls = []
+        self.headers = {}
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((url, kwargs.get('headers') or {}))
+        if url.endswith('/user'):
+            if self.login is None:
+                return make_response(403, {'message': 'Resource not accessible by integration'})
+            return make_response(200, {'login': self.login})
+        if (kwargs.get('headers') or {}).get('If-None-Match') == self.etag:
+            return make_response(304, url=url)
+        return make_response(200, {'url': url}, {'ETag': self.etag}, url=url)
+
+    def close(self):
+        pass
+
+
+def client_with(cache, token, session):
+    client = GitHubClient(token, cache=cache)
+    client.session = session
+    return client
+
+
+def test_key_ignores_token_and_depends_on_identity(tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    key = cache.make_key('https://api.github.com/users/dev', {'page': 1}, 'user:dev')
+    assert key == cache.make_key('https://api.github.com/users/dev', {'page': 1}, 'user:dev')
+    assert key != cache.make_key('https://api.github.com/users/dev', {'page': 1}, 'anonymous')
+    assert key != cache.make_key('https://api.github.com/users/dev', {'page': 2}, 'user:dev')
+
+
+def test_new_token_for_same_login_reuses_entries(tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    first = client_with(cache, 'token-job-1', FakeSession())
+    assert first.get('/users/dev').from_cache is False
+
+    second_session = FakeSession()
+    second = client_with(cache, 'token-job-2', second_session)
+    response = second.get('/users/dev')
+    assert response.from_cache is True
+    assert response.json() == {'url': 'https://api.github.com/users/dev'}
+    # /user é consultado uma única vez por cliente
+    second.get('/users/dev')
+    assert [url for url, _ in second_session.calls].count('https://api.github.com/user') == 1
+
+
+def test_identity_without_user_access(tmp_path):
+    assert client_with(None, None, FakeSession()).cache_identity == 'anonymous'
+    assert client_with(None, 'ghs_x', FakeSession(login=None)).cache_identity == 'authenticated'
+    assert client_with(None, 'ghp_x', FakeSession(login='dev')).cache_identity == 'user:dev'
+
+
+def test_prune_removes_only_stale_untouched_entries(tmp_path):
+    old = time.time() - 30 * 86400
+
+    previous = HTTPCache(str(tmp_path))
+    keys = [previous.make_key(f'https://api.github.com/{name}') for name in ('a', 'b', 'c')]
+    for key in keys:
+        previous.store(key, make_response(headers={'ETag': '"x"'}))
+        os.utime(previous._path(key), (old, old))
+
+    recent_key = previous.make_key('https://api.github.com/recent')
+    previous.store(recent_key, make_response(headers={'ETag': '"x"'}))
+
+    cache = HTTPCache(str(tmp_path))
+    assert cache.load(keys[0]) is not None
+    cache.store(keys[1], make_response(headers={'ETag': '"y"'}))
+
+    assert cache.prune() == 1
+    assert cache.load(keys[0]) is not None
+    assert cache.load(keys[1]) is not None
+    assert cache.load(keys[2]) is None
+    # Entrada de outro agendamento, ainda dentro da janela
+    assert cache.load(recent_key) is not None
+
+
+def test_load_refreshes_modification_time(tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    key = cache.make_key('https://api.github.com/a')
+    cache.store(key, make_response(headers={'ETag': '"x"'}))
+    old = time.time() - 30 * 86400
+    os.utime(cache._path(key), (old, old))
+
+    HTTPCache(str(tmp_path)).load(key)
+    assert HTTPCache(str(tmp_path)).prune() == 0
@@ -0,0 +1,84 @@
+import random
+
+import pytest
+
+from agents.core import GitHubClient
+from agents.insights import InsightsAgent
+from agents.insights.vector_metrics import HAS_NUMPY
+
+ENGINES = ['python', pytest.param('numpy', marks=pytest.mark.skipif(not HAS_NUMPY, reason='NumPy não instalado'))]
+
+
+def make_repo(rng, i):
+    return {
+        'full_name': f'dev/r{i}',
+        'name': f'r{i}',
+        'html_url': f'https://github.com/dev/r{i}',
+        'private': rng.random() < 0.1,
+        'description': rng.choice(['', None, 'descrição']),
+        'stargazers_count': rng.randint(0, 50),
+        'forks_count': rng.randint(0, 3),
+        'watchers_count': rng.randint(0, 5),
+        'open_issues_count': rng.randint(0, 2),
+        'size': rng.randint(0, 100),
+        'language': rng.choice([None, '', 'Python', 'JavaScript', 'Go']),
+        'topics': rng.sample(['api', 'cli', 'web', 'data'], rng.randint(0, 3)),
+        'created_at': f'20{rng.randint(10, 24)}-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}T00:00:00Z',
+        'updated_at': f'202{rng.randint(3, 6)}-0{rng.randint(1, 9)}-10T00:00:00Z'
+    }
+
+
+class ListingAgent(InsightsAgent):
+    """Agente sem rede: a listagem vem de self.repos e cada leitura é contada"""
+
+    def __init__(self, repos, **kwargs):
+        super().__init__('dev', client=GitHubClient('token'), **kwargs)
+        self.repos = repos
+        self.listings = 0
+
+    def iter_repos(self):
+        self.listings += 1
+        return iter(self.repos)
+
+    def get_user_data(self):
+        return {'login': 'dev', 'followers': 3}
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason='NumPy não instalado')
+@pytest.mark.parametrize('size', [0, 1, 5, 300])
+def test_vector_engine_matches_python_loop(size):
+    rng = random.Random(size)
+    repos = [make_repo(rng, i) for i in range(size)]
+    python = ListingAgent(repos).calculate_total_metrics()
+    vector_agent = ListingAgent(repos, engine='numpy')
+    vector = vector_agent.calculate_total_metrics()
+
+    assert python == vector
+    assert python['languages'].most_common() == vector['languages'].most_common()
+    assert python['topics'].most_common() == vector['topics'].most_common()
+
+    public = [repo for repo in repos if not repo['private']]
+    expected = sorted(public, key=lambda repo: -repo['stargazers_count'])[:7]
+    assert vector_agent.vector_engine(repos).top_k('stars', 7) == [
+        (repo['name'], repo['stargazers_count']) for repo in expected
+    ]
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_dashboard_lists_repos_once(tmp_path, engine):
+    rng = random.Random(7)
+    agent = ListingAgent([make_repo(rng, i) for i in range(40)], engine=engine)
+    agent.create_insights_dashboard(str(tmp_path / 'INSIGHTS_DASHBOARD.md'))
+    assert agent.listings == 1
+
+    content = (tmp_path / 'INSIGHTS_DASHBOARD.md').read_text(encoding='utf-8')
+    # Seção de distribuição só existe no motor vetorizado
+    assert ('Distribuição dos Repositórios' in content) == (engine == 'numpy')
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason='NumPy não instalado')
+def test_numpy_totals_list_repos_once():
+    rng = random.Random(3)
+    agent = ListingAgent([make_repo(rng, i) for i in range(20)], engine='numpy')
+    agent.calculate_total_metrics()
+    assert agent.listings == 1
@@ -0,0 +1,50 @@
+import json
+
+from agents.core import RequestMetrics, agent_scope
+from agents.core.metrics import endpoint_template
+
+
+def test_endpoint_template():
+    assert endpoint_template('https://api.github.com/users/dev/repos?page=2') == '/users/{user}/repos'
+    assert endpoint_template('https://api.github.com/orgs/acme/repos') == '/orgs/{org}/repos'
+    assert endpoint_template('https://api.github.com/repos/dev/app/languages') == '/repos/{owner}/{repo}/languages'
+    assert endpoint_template('https://api.github.com/repos/dev/app/contents/docs/README.md') == \
+        '/repos/{owner}/{repo}/contents/{path}'
+    assert endpoint_template('https://api.github.com/search/issues') == '/search/issues'
+
+
+def test_requests_are_grouped_by_agent_and_endpoint():
+    metrics = RequestMetrics()
+    with agent_scope('profile'):
+        metrics.record('https://api.github.com/users/dev', 200, 0.04, 100, cache_hit=False)
+        metrics.record('https://api.github.com/users/dev', 200, 0.3, 0, cache_hit=True,
+                       headers={'X-RateLimit-Remaining': '4990', 'X-RateLimit-Resource': 'core'})
+    metrics.record('https://api.github.com/users/outro', 'error', 2.0)
+
+    summary = metrics.summary()
+    assert summary['total_requests'] == 3
+    assert set(summary['by_agent']) == {'profile', 'standalone'}
+    profile = summary['by_agent']['profile']
+    assert profile['count'] == 2
+    assert profile['cache_hits'] == 1 and profile['cache_misses'] == 1
+    assert profile['latency_buckets']['0.05'] == 1 and profile['latency_buckets']['0.5'] == 2
+    assert summary['by_endpoint']['/users/{user}']['statuses'] == {'200': 2, 'error': 1}
+    assert summary['rate_limit_remaining'] == {'core': 4990}
+
+
+def test_exports(tmp_path):
+    metrics = RequestMetrics()
+    with agent_scope('insights'):
+        metrics.record('https://api.github.com/users/dev/repos', 200, 0.2, 512, cache_hit=False)
+
+    metrics.write_json(str(tmp_path / 'metrics' / 'http.json'))
+    data = json.loads((tmp_path / 'metrics' / 'http.json').read_text(encoding='utf-8'))
+    assert data['by_agent']['insights']['bytes'] == 512
+
+    metrics.write_prometheus(str(tmp_path / 'http.prom'))
+    text = (tmp_path / 'http.prom').read_text(encoding='utf-8')
+    labels = 'agent="insights",endpoint="/users/{user}/repos"'
+    assert f'github_agents_http_request_duration_seconds_bucket{{{labels},le="0.25"}} 1' in text
+    assert f'github_agents_http_request_duration_seconds_bucket{{{labels},le="0.1"}} 0' in text
+    assert f'github_agents_http_requests_total{{{labels},status="200"}} 1' in text
+    assert f'github_agents_http_cache_requests_total{{{labels},result="miss"}} 1' in text
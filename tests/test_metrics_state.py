@@ -0,0 +1,82 @@
+import random
+
+from agents.core import GitHubClient
+from agents.insights import InsightsAgent, MetricsState
+
+
+def make_repo(rng, i):
+    return {
+        'full_name': f'dev/r{i}',
+        'name': f'r{i}',
+        'html_url': f'https://github.com/dev/r{i}',
+        'private': rng.random() < 0.1,
+        'stargazers_count': rng.randint(0, 5),
+        'forks_count': rng.randint(0, 3),
+        'watchers_count': rng.randint(0, 5),
+        'open_issues_count': rng.randint(0, 2),
+        'size': rng.randint(0, 100),
+        'language': rng.choice([None, 'Python', 'JavaScript', 'Go']),
+        'topics': rng.sample(['api', 'cli', 'web', 'data'], rng.randint(0, 3)),
+        'created_at': f'2020-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}T00:00:00Z',
+        'updated_at': '2024-01-01T00:00:00Z'
+    }
+
+
+class ListingAgent(InsightsAgent):
+    def __init__(self, repos, **kwargs):
+        super().__init__('dev', client=GitHubClient('token'), **kwargs)
+        self.repos = repos
+
+    def iter_repos(self):
+        return iter(self.repos)
+
+
+def assert_same_metrics(expected, actual):
+    assert expected == actual
+    assert expected['languages'].most_common() == actual['languages'].most_common()
+    assert expected['topics'].most_common() == actual['topics'].most_common()
+
+
+def test_incremental_metrics_match_full_recompute(tmp_path):
+    rng = random.Random(19)
+    repos = [make_repo(rng, i) for i in range(200)]
+    path = str(tmp_path / 'metrics_state.json')
+    full = ListingAgent(repos)
+    next_id = len(repos)
+
+    for step in range(120):
+        for _ in range(rng.randint(0, 8)):
+            op = rng.random()
+            if op < 0.3 and repos:
+                repos.pop(rng.randrange(len(repos)))
+            elif op < 0.5:
+                repos.insert(rng.randrange(len(repos) + 1), make_repo(rng, next_id))
+                next_id += 1
+            elif op < 0.9 and repos:
+                repo = rng.choice(repos)
+                repo['stargazers_count'] = rng.randint(0, 6)
+                repo['language'] = rng.choice([None, 'Python', 'Rust'])
+                repo['topics'] = rng.sample(['api', 'cli', 'ml'], rng.randint(0, 2))
+                repo['updated_at'] = f'2024-02-{step % 28 + 1:02d}T00:00:00Z'
+            elif repos:
+                rng.shuffle(repos)
+
+        # Estado recarregado do disco a cada passo, como entre execuções
+        incremental = ListingAgent(repos, metrics_state=MetricsState(path))
+        assert_same_metrics(full.calculate_total_metrics(), incremental.calculate_total_metrics())
+
+
+def test_update_returns_only_changed_repos(tmp_path):
+    rng = random.Random(1)
+    repos = [make_repo(rng, i) for i in range(10)]
+    for repo in repos:
+        repo['private'] = False
+    state = MetricsState(str(tmp_path / 'state.json'))
+    assert len(state.update('dev', repos)) == 10
+    assert state.update('dev', repos) == []
+
+    repos[3] = dict(repos[3], stargazers_count=99)
+    assert [repo['name'] for repo in state.update('dev', repos)] == ['r3']
+
+    # Outro dono: o estado recomeça do zero
+    assert len(state.update('outro', repos)) == 10
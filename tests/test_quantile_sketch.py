@@ -0,0 +1,75 @@
+import random
+from bisect import bisect_left
+
+import pytest
+
+from agents.insights import CommunityBaseline
+from agents.insights.baseline import user_metrics
+from agents.insights.quantile_sketch import KLLSketch
+
+
+def rank_error(sketch, values):
+    """Maior erro de rank (fração de n) dos quantis estimados"""
+    ordered = sorted(values)
+    worst = 0.0
+    for q in [i / 100 for i in range(1, 100)]:
+        estimate = sketch.quantile(q)
+        rank = bisect_left(ordered, estimate) / len(ordered)
+        worst = max(worst, abs(rank - q))
+    return worst
+
+
+def test_rank_error_and_memory_are_bounded():
+    rng = random.Random(21)
+    values = [rng.lognormvariate(2, 1.5) for _ in range(100_000)]
+    sketch = KLLSketch(k=200, seed=1).add_all(values)
+
+    assert sketch.n == len(values)
+    assert sketch._size() <= 3 * sketch.k + len(sketch.compactors)
+    # Erro teórico ~1.7/k (0,85%); folga para a aleatoriedade das compactações
+    assert rank_error(sketch, values) < 0.02
+    assert abs(sketch.percentile(sorted(values)[50_000]) - 50) < 2
+
+
+def test_merge_matches_single_stream():
+    rng = random.Random(5)
+    values = [rng.randint(0, 1000) for _ in range(40_000)]
+    left = KLLSketch(seed=2).add_all(values[:25_000])
+    right = KLLSketch(seed=3).add_all(values[25_000:])
+    merged = left.merge(right)
+    assert merged.n == len(values)
+    assert rank_error(merged, values) < 0.02
+
+
+def test_small_inputs_are_exact_and_serializable():
+    sketch = KLLSketch().add_all([3, 1, 2, 2])
+    assert sketch.quantile(0.5) == 2
+    assert sketch.percentile(2) == 50
+    assert sketch.percentile(0) == 0 and sketch.percentile(10) == 100
+    assert KLLSketch().quantile(0.5) is None and KLLSketch().percentile(1) == 0
+
+    restored = KLLSketch.from_dict(sketch.to_dict())
+    assert (restored.n, restored.quantile(0.5)) == (4, 2)
+
+
+def test_community_baseline_persists_and_needs_min_samples(tmp_path):
+    path = str(tmp_path / 'baseline.json')
+    baseline = CommunityBaseline(path)
+    for stars in range(40):
+        baseline.add_user(user_metrics([
+            {'stargazers_count': stars, 'language': 'Python'},
+            {'stargazers_count': 0, 'language': None},
+            {'stargazers_count': 100, 'private': True}
+        ]))
+    baseline.save()
+
+    restored = CommunityBaseline(path)
+    assert restored.users == 40
+    # 20 usuários abaixo de 20 estrelas e um empate (conta pela metade): 20,5 de 40
+    assert restored.percentile('total_stars', 20) == baseline.percentile('total_stars', 20) == pytest.approx(51.25)
+    assert restored.percentile('repo_stars:Python', 39.5) == 100
+    assert restored.percentile('total_stars', 20, min_samples=41) is None
+    assert restored.percentile('inexistente', 1) is None
+
+    restored.merge(baseline)
+    assert restored.users == 80 and restored.sketches['total_repos'].n == 80
@@ -0,0 +1,93 @@
+import threading
+import time
+
+import pytest
+
+from agents.core import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    RateLimitExceeded,
+    RateLimitScheduler
+)
+
+
+def test_resource_for():
+    assert RateLimitScheduler.resource_for('https://api.github.com/graphql') == 'graphql'
+    assert RateLimitScheduler.resource_for('https://ghe.example.com/api/graphql') == 'graphql'
+    assert RateLimitScheduler.resource_for('https://api.github.com/search/issues?q=x') == 'search'
+    assert RateLimitScheduler.resource_for('https://api.github.com/users/dev/repos') == 'core'
+
+
+def test_low_priority_cannot_spend_reserve():
+    scheduler = RateLimitScheduler(reserve={'core': 2}, max_wait=10)
+    scheduler.update('core', {
+        'X-RateLimit-Remaining': '4',
+        'X-RateLimit-Limit': '5000',
+        'X-RateLimit-Reset': str(time.time() + 3600)
+    })
+    scheduler.acquire('core', PRIORITY_NORMAL)
+    scheduler.acquire('core', PRIORITY_NORMAL)
+    scheduler.acquire('core', PRIORITY_HIGH)
+    # Sobrou 1 token: abaixo da reserva (2 x prioridade baixa), só chamadas essenciais
+    scheduler.max_wait = 0
+    with pytest.raises(RateLimitExceeded):
+        scheduler.acquire('core', PRIORITY_LOW)
+    scheduler.acquire('core', PRIORITY_HIGH)
+    assert scheduler.status()['core']['remaining'] == 0
+
+
+def test_exhausted_budget_waits_for_reset():
+    scheduler = RateLimitScheduler(max_wait=5)
+    scheduler.update('search', {
+        'X-RateLimit-Remaining': '0',
+        'X-RateLimit-Limit': '30',
+        'X-RateLimit-Reset': str(time.time() + 0.2)
+    })
+    start = time.monotonic()
+    scheduler.acquire('search', PRIORITY_HIGH)
+    assert 0.1 <= time.monotonic() - start < 3
+    assert scheduler.status()['search']['remaining'] == 29
+
+
+def test_wait_longer_than_max_wait_raises():
+    scheduler = RateLimitScheduler(max_wait=1)
+    scheduler.update('core', {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(time.time() + 600)})
+    with pytest.raises(RateLimitExceeded) as error:
+        scheduler.acquire('core')
+    assert error.value.resource == 'core'
+
+
+def test_out_of_order_responses_keep_lowest_remaining():
+    scheduler = RateLimitScheduler()
+    reset = str(time.time() + 3600)
+    scheduler.update('core', {'X-RateLimit-Remaining': '100', 'X-RateLimit-Reset': reset})
+    scheduler.update('core', {'X-RateLimit-Remaining': '98', 'X-RateLimit-Reset': reset})
+    scheduler.update('core', {'X-RateLimit-Remaining': '99', 'X-RateLimit-Reset': reset})
+    assert scheduler.status()['core']['remaining'] == 98
+    # Nova janela: o servidor volta a ser a fonte da verdade
+    scheduler.update('core', {'X-RateLimit-Remaining': '4999', 'X-RateLimit-Reset': str(time.time() + 7200)})
+    assert scheduler.status()['core']['remaining'] == 4999
+
+
+def test_concurrent_acquire_never_overspends():
+    scheduler = RateLimitScheduler(reserve={'core': 0}, max_wait=0)
+    scheduler.update('core', {'X-RateLimit-Remaining': '50', 'X-RateLimit-Reset': str(time.time() + 3600)})
+    granted = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(10):
+            try:
+                scheduler.acquire('core', PRIORITY_NORMAL)
+            except RateLimitExceeded:
+                return
+            with lock:
+                granted.append(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(granted) == 50
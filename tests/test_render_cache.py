@@ -0,0 +1,73 @@
+from datetime import datetime
+
+from agents.core import GitHubClient
+from agents.insights import InsightsAgent, RenderCache
+from agents.insights.render_cache import data_hash, write_if_changed
+
+REPOS = [
+    {
+        'full_name': f'dev/r{i}', 'name': f'r{i}', 'html_url': f'https://github.com/dev/r{i}',
+        'stargazers_count': i, 'forks_count': i % 2, 'watchers_count': i, 'open_issues_count': 0,
+        'size': 10, 'language': 'Python', 'topics': [], 'description': 'x',
+        'created_at': '2024-01-01T00:00:00Z', 'updated_at': '2025-06-01T00:00:00Z'
+    }
+    for i in range(5)
+]
+
+
+class ListingAgent(InsightsAgent):
+    def __init__(self, **kwargs):
+        super().__init__('dev', client=GitHubClient('token'), **kwargs)
+
+    def iter_repos(self):
+        return iter(REPOS)
+
+    def get_user_data(self):
+        return {'login': 'dev', 'followers': 3}
+
+
+def test_sections_render_once_per_data():
+    cache = RenderCache()
+    calls = []
+
+    def render(data):
+        calls.append(data)
+        return f"total: {data['total']}"
+
+    assert cache.render('overview', {'total': 1, 'extra': [1]}, render) == 'total: 1'
+    assert cache.render('overview', {'extra': [1], 'total': 1}, render) == 'total: 1'
+    assert cache.render('overview', {'total': 2, 'extra': [1]}, render) == 'total: 2'
+    assert len(calls) == 2 and (cache.hits, cache.misses) == (1, 2)
+    assert data_hash({'a': 1, 'b': 2}) == data_hash({'b': 2, 'a': 1})
+
+
+def test_stamp_only_moves_when_content_changes(tmp_path):
+    path = str(tmp_path / 'render.json')
+    cache = RenderCache(path)
+    first = cache.stamp('README.md', 'conteúdo', datetime(2026, 3, 1, 10, 0, 0, 123))
+    assert first == datetime(2026, 3, 1, 10, 0, 0)
+    cache.save()
+
+    restored = RenderCache(path)
+    assert restored.stamp('README.md', 'conteúdo', datetime(2026, 3, 9)) == first
+    assert not restored.dirty
+    assert restored.stamp('README.md', 'novo', datetime(2026, 3, 9)) == datetime(2026, 3, 9)
+
+
+def test_write_if_changed(tmp_path):
+    path = str(tmp_path / 'OUT.md')
+    assert write_if_changed(path, 'a')
+    assert not write_if_changed(path, 'a')
+    assert write_if_changed(path, 'b')
+
+
+def test_unchanged_dashboard_is_not_rewritten(tmp_path):
+    cache_path = str(tmp_path / 'render.json')
+    output = str(tmp_path / 'INSIGHTS_DASHBOARD.md')
+    assert ListingAgent(render_cache=RenderCache(cache_path)).create_insights_dashboard(output)
+    content = open(output, encoding='utf-8').read()
+
+    cache = RenderCache(cache_path)
+    assert not ListingAgent(render_cache=cache).create_insights_dashboard(output)
+    assert cache.misses == 0
+    assert open(output, encoding='utf-8').read() == content
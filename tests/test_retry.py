@@ -0,0 +1,125 @@
+import pytest
+import requests
+
+from agents.core import CircuitBreaker, CircuitOpenError, GitHubClient, RetryPolicy
+
+
+def make_response(status, headers=None, text=''):
+    response = requests.Response()
+    response.status_code = status
+    response._content = text.encode('utf-8')
+    response.headers.update(headers or {})
+    return response
+
+
+class FakeSession:
+    """Devolve as respostas na ordem, uma por requisição"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+        self.headers = {}
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    waited = []
+    monkeypatch.setattr('agents.core.retry.time.sleep', waited.append)
+    return waited
+
+
+def client_with(session, policy=None, breaker=None):
+    client = GitHubClient('token', retry_policy=policy or RetryPolicy(), circuit_breaker=breaker)
+    client.session = session
+    return client
+
+
+def test_delay_never_shortens_retry_after():
+    policy = RetryPolicy(backoff_max=30, max_retry_after=120)
+    response = make_response(403, {'Retry-After': '45'})
+    assert policy.should_retry('GET', 0, response)
+    assert policy.delay(0, response) == 45
+
+
+def test_retry_after_above_cap_gives_up():
+    policy = RetryPolicy(max_retry_after=30)
+    assert not policy.should_retry('GET', 0, make_response(429, {'Retry-After': '45'}))
+    assert policy.should_retry('GET', 0, make_response(429, {'Retry-After': '30'}))
+
+
+def test_retry_after_http_date():
+    response = make_response(503, {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+    assert RetryPolicy.retry_after(response) == 0
+    assert RetryPolicy.retry_after(make_response(503, {'Retry-After': 'depois'})) is None
+
+
+def test_backoff_without_retry_after_is_bounded():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5)
+    for attempt in range(6):
+        assert 0 <= policy.delay(attempt) <= min(5, 2 ** attempt)
+
+
+def test_only_idempotent_methods_and_transient_statuses_are_retried():
+    policy = RetryPolicy(max_retries=2)
+    assert policy.should_retry('GET', 1, make_response(502))
+    assert not policy.should_retry('GET', 2, make_response(502))
+    assert not policy.should_retry('POST', 0, make_response(502))
+    assert not policy.should_retry('GET', 0, make_response(404))
+    assert policy.should_retry('GET', 0, make_response(403, text='You have exceeded a secondary rate limit'))
+
+
+def test_client_waits_full_retry_after(sleeps):
+    session = FakeSession(make_response(403, {'Retry-After': '45'}), make_response(200))
+    client = client_with(session, RetryPolicy(backoff_max=30))
+    assert client.request('GET', 'https://api.github.com/x').status_code == 200
+    assert sleeps == [45]
+    assert client.retry_policy.stats() == {'retries': 1, 'backoff_seconds': 45}
+
+
+def test_client_returns_response_when_retry_after_exceeds_cap(sleeps):
+    session = FakeSession(make_response(429, {'Retry-After': '600'}))
+    client = client_with(session, RetryPolicy(max_retry_after=120))
+    assert client.request('GET', 'https://api.github.com/x').status_code == 429
+    assert sleeps == []
+    assert session.calls == 1
+
+
+def test_circuit_opens_after_consecutive_failures(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr('agents.core.retry.time.monotonic', lambda: clock[0])
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+
+    breaker.record_failure()
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    # Meio-aberto após o tempo de recuperação: uma falha reabre, um sucesso fecha
+    clock[0] += 61
+    breaker.before_request()
+    assert breaker.state == 'half-open'
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    clock[0] += 61
+    breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == 'closed'
+    assert breaker.times_opened == 2
+
+
+def test_client_counts_exhausted_retries_as_failure(sleeps):
+    session = FakeSession(*[make_response(502) for _ in range(3)])
+    breaker = CircuitBreaker(failure_threshold=1)
+    client = client_with(session, RetryPolicy(max_retries=2), breaker)
+    assert client.request('GET', 'https://api.github.com/x').status_code == 502
+    assert session.calls == 3
+    assert breaker.state == 'open'
@@ -0,0 +1,85 @@
+import threading
+import time
+from collections import Counter
+
+from agents.core import RunContext
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeClient:
+    """Usuário 'dev' com três repositórios (um fork); /languages demora para responder"""
+
+    graphql = None
+    max_concurrency = 4
+
+    def __init__(self, languages_delay=0.0):
+        self.calls = Counter()
+        self.languages_delay = languages_delay
+        self.lock = threading.Lock()
+
+    def count(self, path):
+        with self.lock:
+            self.calls[path.split('/')[-1]] += 1
+
+    def get_json(self, path):
+        self.count(path)
+        return {'login': 'dev', 'followers': 1}
+
+    def paginate(self, path, params=None):
+        self.count(path)
+        return iter([
+            {'name': name, 'full_name': f'dev/{name}', 'fork': name == 'fork',
+             'languages_url': f'https://api.github.com/repos/dev/{name}/languages'}
+            for name in ('app', 'lib', 'fork')
+        ])
+
+    def get(self, url, priority=None):
+        self.count(url)
+        time.sleep(self.languages_delay)
+        return FakeResponse({'Python': len(url)})
+
+
+def test_snapshot_is_loaded_once():
+    client = FakeClient()
+    context = RunContext(client, 'dev')
+    assert context.user['login'] == 'dev'
+    assert [repo['name'] for repo in context.repos] == ['app', 'lib', 'fork']
+    context.user
+    context.repos
+    assert set(context.languages) == {'dev/app', 'dev/lib'}
+    context.languages
+    assert context.find_repo('LIB')['full_name'] == 'dev/lib'
+    assert context.find_repo('outro') is None
+    assert client.calls == Counter({'dev': 1, 'repos': 1, 'languages': 2})
+
+    context.invalidate()
+    context.repos
+    assert client.calls['repos'] == 2
+
+
+def test_user_and_repos_do_not_wait_for_languages():
+    client = FakeClient(languages_delay=0.5)
+    context = RunContext(client, 'dev')
+    context.repos
+    loader = threading.Thread(target=lambda: context.languages)
+    loader.start()
+    time.sleep(0.1)
+
+    start = time.monotonic()
+    context.user
+    context.repos
+    assert time.monotonic() - start < 0.3
+    loader.join()
+    # Depois da carga, languages fica memoizado
+    assert context.languages is context.languages
+    assert client.calls['languages'] == 2
@@ -0,0 +1,134 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from agents.core import TopK
+from agents.projects import FeaturedRanking, ScoringEngine, VectorScoringEngine
+from agents.projects.scoring import HAS_NUMPY
+
+NOW = datetime(2026, 3, 15, 12, 0, 0)
+
+ENGINES = [ScoringEngine, pytest.param(
+    VectorScoringEngine, marks=pytest.mark.skipif(not HAS_NUMPY, reason='NumPy não instalado')
+)]
+
+
+def reference_score(repo, now=NOW):
+    """Score original do ProjectsAgent (antes do motor configurável)"""
+    score = 0.0
+    score += repo.get('stargazers_count', 0) * 3
+    score += repo.get('forks_count', 0) * 2
+    score += repo.get('watchers_count', 0) * 1
+    score += repo.get('open_issues_count', 0) * 0.5
+    if not repo.get('fork', False):
+        score += 10
+    if repo.get('description'):
+        score += 5
+    if repo.get('homepage'):
+        score += 3
+    score += len(repo.get('topics', [])) * 2
+    updated_at = datetime.strptime(repo['updated_at'], '%Y-%m-%dT%H:%M:%SZ')
+    if (now - updated_at).days > 365:
+        score *= 0.5
+    return score
+
+
+def make_repo(rng, i, now=NOW):
+    updated = now - timedelta(seconds=rng.randint(0, 800 * 86400))
+    return {
+        'name': f'r{i}',
+        'full_name': f'dev/r{i}',
+        'stargazers_count': rng.randint(0, 50),
+        'forks_count': rng.randint(0, 9),
+        'watchers_count': rng.randint(0, 50),
+        'open_issues_count': rng.randint(0, 5),
+        'fork': rng.random() < 0.2,
+        'description': rng.choice([None, '', 'descrição']),
+        'homepage': rng.choice([None, '', 'https://exemplo.dev']),
+        'topics': ['python'] * rng.randint(0, 3),
+        'updated_at': updated.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'private': rng.random() < 0.05
+    }
+
+
+def expected_top(repos, k):
+    public = [repo for repo in repos if not repo.get('private')]
+    return [repo['full_name'] for repo in sorted(public, key=reference_score, reverse=True)[:k]]
+
+
+@pytest.mark.parametrize('engine_class', ENGINES)
+def test_scores_match_reference(engine_class):
+    rng = random.Random(1)
+    repos = [make_repo(rng, i) for i in range(2000)]
+    engine = engine_class(now=NOW)
+    assert engine.score_all(repos) == [reference_score(repo) for repo in repos]
+    assert engine.score_all([]) == []
+
+
+def test_unknown_weight_is_rejected():
+    with pytest.raises(ValueError, match='desconhecidos'):
+        ScoringEngine({'stars': 1, 'estrelas': 2})
+
+
+def test_half_life_decay():
+    engine = ScoringEngine(weights={'not_fork': 0}, recency={'half_life_days': 10}, now=NOW)
+    repo = {'stargazers_count': 10, 'fork': True,
+            'updated_at': (NOW - timedelta(days=10)).strftime('%Y-%m-%dT%H:%M:%SZ')}
+    assert engine.score(repo) == pytest.approx(15)
+
+
+@pytest.mark.parametrize('engine_class', ENGINES)
+def test_incremental_ranking_matches_full_sort(engine_class):
+    rng = random.Random(2)
+    repos = [make_repo(rng, i) for i in range(500)]
+    engine = engine_class(now=NOW)
+    engine.refresh = lambda now=None: False
+    ranking = FeaturedRanking(engine)
+
+    assert ranking.update(repos) == sum(not repo['private'] for repo in repos)
+    assert ranking.update(repos) == 0
+
+    for step in range(150):
+        # Altera, remove, adiciona e reordena repositórios entre as atualizações
+        for _ in range(rng.randint(0, 10)):
+            j = rng.randrange(len(repos))
+            repos[j] = dict(repos[j], stargazers_count=rng.randint(0, 60))
+        if rng.random() < 0.3:
+            del repos[rng.randrange(len(repos))]
+        if rng.random() < 0.3:
+            repos.append(make_repo(rng, 1000 + step))
+        if rng.random() < 0.1:
+            rng.shuffle(repos)
+
+        ranking.update(repos)
+        k = rng.randint(0, 12)
+        assert [repo['full_name'] for repo in ranking.top(k)] == expected_top(repos, k), step
+    assert len(ranking._heap) <= 2 * len(ranking) + 64
+
+
+def test_day_rollover_rescores_and_forgets_removed_repos():
+    rng = random.Random(3)
+    repos = [make_repo(rng, i, datetime.now()) for i in range(50)]
+    engine = ScoringEngine(now=datetime.now() - timedelta(days=1))
+    ranking = FeaturedRanking(engine)
+    ranking._scored_at = engine.now
+    ranking._entries['dev/removido'] = (1.0, 0, ())
+    ranking._repos['dev/removido'] = {'full_name': 'dev/removido'}
+
+    public = [repo for repo in repos if not repo['private']]
+    assert ranking.update(repos) == len(public)
+    assert engine.now.date() == datetime.now().date()
+    assert set(ranking._repos) == {repo['full_name'] for repo in public}
+
+
+def test_top_k_keeps_highest_with_stable_ties():
+    top = TopK(3)
+    for score, name in [(1, 'a'), (5, 'b'), (3, 'c'), (5, 'd'), (0, 'e'), (3, 'f')]:
+        top.add(score, name)
+    assert top.items() == ['b', 'd', 'c']
+    assert top.scored()[0] == ('b', 5)
+
+    empty = TopK(0)
+    empty.add(1, 'a')
+    assert len(empty) == 0
@@ -0,0 +1,70 @@
+import threading
+
+from agents.core import SearchCache, agent_scope
+from agents.core.metrics import current_agent
+
+
+class FakeResponse:
+    def __init__(self, items):
+        self.items = items
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {'items': self.items}
+
+
+class FakeClient:
+    """Devolve o agente atual como item: mostra a quem a requisição foi atribuída"""
+
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def get(self, endpoint, params=None, priority=None):
+        with self.lock:
+            self.calls += 1
+        return FakeResponse([{'agent': current_agent.get(), 'call': self.calls}])
+
+
+def expire(cache, key, age):
+    cache.cache.entries[key][0] -= age
+
+
+def test_equivalent_queries_share_entry(tmp_path):
+    client = FakeClient()
+    cache = SearchCache(client, str(tmp_path / 'search.json'))
+    first = cache.search('/search/issues', {'q': 'is:open  Label:"good first issue"', 'per_page': 5})
+    again = cache.search('/search/issues', {'q': 'label:"good first issue" is:open', 'per_page': 5})
+    assert first == again
+    assert client.calls == 1
+    cache.search('/search/issues', {'q': 'is:open', 'per_page': 10})
+    assert client.calls == 2
+
+
+def test_stale_entry_is_served_and_revalidated_in_caller_context(tmp_path):
+    client = FakeClient()
+    cache = SearchCache(client, str(tmp_path / 'search.json'), ttl=60, stale_ttl=60)
+    params = {'q': 'stars:>100'}
+    key = cache.make_key('/search/repositories', params)
+
+    with agent_scope('engagement'):
+        cache.search('/search/repositories', params)
+        expire(cache, key, 90)
+        stale = cache.search('/search/repositories', params)
+    assert stale[0]['call'] == 1
+    cache.close()
+
+    refreshed = cache.search('/search/repositories', params)
+    assert refreshed == [{'agent': 'engagement', 'call': 2}]
+    assert client.calls == 2
+
+
+def test_expired_entry_is_fetched_again(tmp_path):
+    client = FakeClient()
+    cache = SearchCache(client, ttl=60, stale_ttl=60)
+    params = {'q': 'stars:>100'}
+    cache.search('/search/repositories', params)
+    expire(cache, cache.make_key('/search/repositories', params), 200)
+    assert cache.search('/search/repositories', params)[0]['call'] == 2
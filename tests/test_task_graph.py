@@ -0,0 +1,92 @@
+import threading
+import time
+
+import pytest
+
+from agents.core import TaskGraph
+
+
+def test_dependencies_run_in_order_and_independent_tasks_in_parallel():
+    order = []
+    lock = threading.Lock()
+    both_running = threading.Barrier(2, timeout=5)
+
+    def task(name, barrier=False):
+        def run():
+            if barrier:
+                both_running.wait()
+            with lock:
+                order.append(name)
+            return name
+        return run
+
+    graph = TaskGraph(max_workers=2)
+    graph.add('context', task('context'))
+    # profile e projects só terminam se estiverem rodando ao mesmo tempo
+    graph.add('profile', task('profile', barrier=True), depends_on=['context'])
+    graph.add('projects', task('projects', barrier=True), depends_on=['context'])
+    graph.add('readme', task('readme'), depends_on=['profile', 'projects'])
+    results = graph.run()
+
+    assert order[0] == 'context' and order[-1] == 'readme'
+    assert {name: result.status for name, result in results.items()} == {
+        'context': 'ok', 'profile': 'ok', 'projects': 'ok', 'readme': 'ok'
+    }
+    assert results['readme'].value == 'readme'
+
+
+def test_failure_skips_dependents_only():
+    def boom():
+        raise RuntimeError('API fora do ar')
+
+    graph = TaskGraph()
+    graph.add('profile', boom)
+    graph.add('readme', lambda: True, depends_on=['profile'])
+    graph.add('insights', lambda: False)
+    graph.add('quality', lambda: None)
+    results = graph.run()
+
+    assert results['profile'].status == 'failed'
+    assert isinstance(results['profile'].error, RuntimeError)
+    assert 'API fora do ar' in results['profile'].output
+    assert results['readme'].status == 'skipped'
+    assert results['insights'].status == 'failed'
+    assert results['quality'].status == 'ok'
+
+
+def test_output_of_each_task_is_printed_in_one_block(capsys):
+    def chatty(name):
+        def run():
+            for i in range(3):
+                print(f'{name} {i}')
+                time.sleep(0.01)
+        return run
+
+    graph = TaskGraph(max_workers=2)
+    graph.add('a', chatty('a'))
+    graph.add('b', chatty('b'))
+    results = graph.run()
+
+    out = capsys.readouterr().out
+    assert results['a'].output == 'a 0\na 1\na 2\n'
+    assert 'a 0\na 1\na 2\n' in out and 'b 0\nb 1\nb 2\n' in out
+
+
+def test_invalid_graphs_are_rejected():
+    graph = TaskGraph()
+    graph.add('a', lambda: True, depends_on=['inexistente'])
+    with pytest.raises(ValueError, match='inexistentes'):
+        graph.run()
+
+    graph = TaskGraph()
+    graph.add('a', lambda: True, depends_on=['b'])
+    graph.add('b', lambda: True, depends_on=['a'])
+    with pytest.raises(ValueError, match='circular'):
+        graph.run()
+
+
+def test_format_summary():
+    graph = TaskGraph()
+    graph.add('a', lambda: True)
+    summary = TaskGraph.format_summary(graph.run(), 1.5)
+    assert '✅ a:' in summary and 'Total: 1.50s' in summary
@@ -0,0 +1,64 @@
+from datetime import date, timedelta
+
+from agents.insights.timeseries import MetricsStore, profile_series, repo_series
+
+DAY = date(2026, 3, 15)
+
+
+def repo(full_name, stars, forks=0):
+    return {'full_name': full_name, 'stargazers_count': stars, 'forks_count': forks, 'size': 10}
+
+
+def test_record_replaces_same_day_snapshot(tmp_path):
+    store = MetricsStore(str(tmp_path / 'ts.sqlite3'))
+    store.record_repos([repo('dev/app', 1)], DAY)
+    store.record_repos([repo('dev/app', 4), repo('dev/lib', 2)], DAY)
+    store.record({profile_series('dev'): {'stars': 6, 'followers': 3}}, DAY)
+
+    assert store.at(repo_series('dev/app'), DAY)['stars'] == 4
+    assert store.at(repo_series('dev/app'), DAY - timedelta(days=1)) is None
+    assert store.at(profile_series('dev'), DAY)['followers'] == 3
+    assert store.series_count() == 3
+
+
+def test_range_starts_with_value_in_force(tmp_path):
+    store = MetricsStore(str(tmp_path / 'ts.sqlite3'))
+    series = repo_series('dev/app')
+    # Snapshots só nos dias com mudança
+    for offset, stars in ((-30, 5), (-10, 8), (-2, 9)):
+        store.record_repos([repo('dev/app', stars)], DAY + timedelta(days=offset))
+
+    rows = store.range(series, since=DAY - timedelta(days=7), until=DAY)
+    assert [(row['day'], row['stars']) for row in rows] == [
+        ((DAY - timedelta(days=7)).isoformat(), 8),
+        ((DAY - timedelta(days=2)).isoformat(), 9)
+    ]
+    assert [row['stars'] for row in store.range(series)] == [5, 8, 9]
+    assert store.range(series, since=DAY - timedelta(days=40), until=DAY - timedelta(days=35)) == []
+
+
+def test_delta(tmp_path):
+    store = MetricsStore(str(tmp_path / 'ts.sqlite3'))
+    series = repo_series('dev/app')
+    store.record_repos([repo('dev/app', 5, 1)], DAY - timedelta(days=20))
+    assert store.delta(series, 7, DAY)['stars'] == 0
+
+    store.record_repos([repo('dev/app', 12, 2)], DAY - timedelta(days=1))
+    delta = store.delta(series, 7, DAY)
+    assert (delta['stars'], delta['forks']) == (7, 1)
+    assert delta['since'] == (DAY - timedelta(days=7)).isoformat() and delta['days'] == 7
+    # Sem histórico anterior ao período
+    assert store.delta(series, 30, DAY) is None
+    assert store.delta(repo_series('dev/outro'), 7, DAY) is None
+
+
+def test_downsample_keeps_last_snapshot_per_period(tmp_path):
+    store = MetricsStore(str(tmp_path / 'ts.sqlite3'))
+    for day, stars in ((date(2026, 1, 5), 1), (date(2026, 1, 20), 3), (date(2026, 2, 2), 4)):
+        store.record_repos([repo('dev/app', stars)], day)
+
+    months = store.downsample(repo_series('dev/app'), 'month')
+    assert [(row['bucket'], row['day'], row['stars']) for row in months] == [
+        ('2026-01', '2026-01-20', 3), ('2026-02', '2026-02-02', 4)
+    ]
+    assert len(store.downsample(repo_series('dev/app'), 'week', since=date(2026, 1, 10))) == 2
@@ -0,0 +1,83 @@
+import json
+
+from agents.core import RepoResolver, TTLCache
+
+
+def test_expiry_and_stale_reads(tmp_path):
+    cache = TTLCache(ttl=60)
+    cache.set('a', {'stars': 1})
+    assert cache.get('a') == {'stars': 1}
+    cache.entries['a'][0] -= 120
+    assert cache.get('a') is None
+    value, age = cache.get_entry('a')
+    assert value == {'stars': 1} and age >= 120
+    cache.purge()
+    assert cache.get_entry('a') is None
+
+
+def test_lru_bound():
+    cache = TTLCache(max_entries=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+    assert list(cache.entries) == ['a', 'c']
+
+
+def test_persistence_skips_expired_entries(tmp_path):
+    path = tmp_path / 'cache' / 'repos.json'
+    cache = TTLCache(str(path), ttl=60)
+    cache.set('fresh', 1)
+    cache.set('old', 2)
+    cache.entries['old'][0] -= 120
+    cache.save()
+
+    assert set(json.loads(path.read_text(encoding='utf-8'))) == {'fresh'}
+    assert TTLCache(str(path), ttl=60).get('fresh') == 1
+
+    path.write_text('{corrompido', encoding='utf-8')
+    assert TTLCache(str(path)).entries == {}
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeClient:
+    graphql = None
+    max_concurrency = 4
+
+    def __init__(self):
+        self.urls = []
+
+    def get(self, url, priority=None):
+        self.urls.append(url)
+        if url.endswith('/removido'):
+            raise ValueError('404')
+        return FakeResponse({'full_name': RepoResolver.full_name(url)})
+
+
+def test_resolver_deduplicates_and_reuses_cache(tmp_path):
+    client = FakeClient()
+    cache = TTLCache(str(tmp_path / 'repos.json'))
+    resolver = RepoResolver(client, cache)
+    urls = [f'https://api.github.com/repos/dev/{name}' for name in ('a', 'b', 'a', 'removido')]
+
+    resolved = resolver.resolve(urls)
+    assert {url: repo['full_name'] for url, repo in resolved.items()} == {
+        urls[0]: 'dev/a', urls[1]: 'dev/b'
+    }
+    assert sorted(client.urls) == sorted(set(urls))
+
+    client.urls.clear()
+    assert RepoResolver(client, TTLCache(str(tmp_path / 'repos.json'))).resolve(urls[:2]) == {
+        urls[0]: {'full_name': 'dev/a'}, urls[1]: {'full_name': 'dev/b'}
+    }
+    assert client.urls == []
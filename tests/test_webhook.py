@@ -0,0 +1,86 @@
+import hashlib
+import hmac
+import json
+
+from agents.engagement import WebhookReceiver, verify_signature
+from agents.engagement.webhook import to_event
+
+SECRET = 'segredo'
+
+
+def post(receiver, event_name, payload, delivery, secret=SECRET):
+    body = json.dumps(payload).encode('utf-8')
+    signature = 'sha256=' + hmac.new(secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+    return receiver.handle(event_name, body, signature, delivery)
+
+
+def payload(action=None, **extra):
+    data = {'sender': {'login': 'dev'}, 'repository': {'full_name': 'dev/app'}, **extra}
+    if action:
+        data['action'] = action
+    return data
+
+
+def test_verify_signature():
+    body = b'{}'
+    signature = 'sha256=' + hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest()
+    assert verify_signature(SECRET, body, signature)
+    assert not verify_signature(SECRET, body + b' ', signature)
+    assert not verify_signature(SECRET, body, None)
+    assert not verify_signature('', body, signature)
+
+
+def test_invalid_signature_is_rejected():
+    receiver = WebhookReceiver('dev', SECRET)
+    status, _ = post(receiver, 'push', payload(commits=[]), 'd1', secret='outro')
+    assert status == 401
+
+
+def test_only_actions_listed_by_events_api_are_counted():
+    receiver = WebhookReceiver('dev', SECRET)
+    deliveries = [
+        ('issue_comment', 'created', 200),
+        ('issue_comment', 'edited', 202),
+        ('issue_comment', 'deleted', 202),
+        ('pull_request', 'opened', 200),
+        ('pull_request', 'labeled', 202),
+        ('pull_request', 'synchronize', 202),
+        ('pull_request', 'closed', 200),
+        ('issues', 'opened', 200),
+        ('issues', 'labeled', 202),
+    ]
+    for index, (event_name, action, expected) in enumerate(deliveries):
+        status, message = post(receiver, event_name, payload(action), f'd{index}')
+        assert status == expected, (event_name, action, message)
+
+    activity = receiver.tracker.result()[7]
+    assert activity['issues_commented'] == 1
+    assert activity['pull_requests'] == 2
+    assert activity['issues_opened'] == 1
+    assert activity['total_events'] == 4
+
+
+def test_repository_created_counts_as_new_repo():
+    receiver = WebhookReceiver('dev', SECRET)
+    assert post(receiver, 'repository', payload('created'), 'd1')[0] == 200
+    assert post(receiver, 'repository', payload('deleted'), 'd2')[0] == 202
+    assert post(receiver, 'create', payload(ref_type='branch', ref='main'), 'd3')[0] == 200
+    assert receiver.tracker.result()[7]['repos_created'] == 1
+
+
+def test_duplicate_delivery_and_other_actors_are_not_applied():
+    receiver = WebhookReceiver('dev', SECRET)
+    push = payload(commits=[{'id': 'a', 'message': 'x'}], ref='refs/heads/main')
+    assert post(receiver, 'push', push, 'd1')[0] == 200
+    assert post(receiver, 'push', push, 'd1') == (200, 'duplicate delivery')
+    other = dict(push, sender={'login': 'alguem'})
+    assert post(receiver, 'push', other, 'd2')[0] == 202
+    assert receiver.tracker.result()[7]['commits'] == 1
+
+
+def test_to_event_matches_events_api_shape():
+    event = to_event('push', payload(commits=[{'id': 'a', 'message': 'm'}], ref='refs/heads/main'), 'd1')
+    assert event['type'] == 'PushEvent'
+    assert event['payload']['size'] == 1
+    assert event['created_at'].endswith('Z')
+    assert to_event('gollum', payload(), 'd2') is None